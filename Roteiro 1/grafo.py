@@ -1,32 +1,173 @@
+from contextlib import contextmanager
+
+
 class VerticeInvalidoException(Exception):
     pass
 
 class ArestaInvalidaException(Exception):
     pass
 
+@contextmanager
+def _abre_arquivo(arquivo, modo):
+    '''
+    Abre o arquivo se for passado um caminho. Se já for um objeto de arquivo, ele é usado como está e não é fechado.
+    '''
+    if hasattr(arquivo, 'read') or hasattr(arquivo, 'write'):
+        yield arquivo
+    else:
+        with open(arquivo, modo, encoding='utf-8') as f:
+            yield f
+
+
+class ComplementoGrafo:
+    '''
+    Visão dos pares de vértices não adjacentes de um Grafo, calculada sob demanda.
+    Nenhuma lista é montada: a iteração gera os pares um a um, a pertinência é respondida em O(1)
+    e o tamanho vem de um contador mantido pelo próprio Grafo. A visão acompanha as alterações feitas no grafo.
+    '''
+
+    def __init__(self, grafo):
+        self.__grafo = grafo
+
+    def __iter__(self):
+        return self.__grafo.iter_nao_adjacentes()
+
+    def __contains__(self, par):
+        '''
+        :param par: Um par de vértices, no formato X-Y ou como uma tupla (X, Y)
+        '''
+        if isinstance(par, str):
+            par = par.split(Grafo.SEPARADOR_ARESTA)
+            if len(par) != Grafo.QTDE_MAX_SEPARADOR + 1:
+                return False
+        return self.__grafo.sao_nao_adjacentes(par[0], par[1])
+
+    def __len__(self):
+        return self.__grafo.quantidade_nao_adjacentes()
+
+
 class Grafo:
 
     QTDE_MAX_SEPARADOR = 1
     SEPARADOR_ARESTA = '-'
 
-    def __init__(self, N=[], A={}):
+    def __init__(self, N=None, A=None):
         '''
         Constrói um objeto do tipo Grafo. Se nenhum parâmetro for passado, cria um Grafo vazio.
         Se houver alguma aresta ou algum vértice inválido, uma exceção é lançada.
         :param N: Uma lista dos vértices (ou nodos) do grafo.
         :param V: Uma dicionário que guarda as arestas do grafo. A chave representa o nome da aresta e o valor é uma string que contém dois vértices separados por um traço.
         '''
+
+        if N == None:
+            N = list()
+        if A == None:
+            A = dict()
+
         for v in N:
             if not(Grafo.verticeValido(v)):
                 raise VerticeInvalidoException('O vértice ' + v + ' é inválido')
 
-        self.N = N
+        self.N = list(N)
+        self.__conjunto_vertices = set(N)
 
+        # Cada aresta é separada nos seus dois vértices uma única vez e o par é guardado para os outros métodos
+        self.__extremidades = {}
         for a in A:
-            if not(self.arestaValida(A[a])):
+            par = self.__separa_aresta(A[a])
+            if par is None:
                 raise ArestaInvalidaException('A aresta ' + A[a] + ' é inválida')
+            self.__extremidades[a] = par
+
+        self.A = dict(A)
+
+        # Índice de incidência: para cada vértice, as arestas que incidem sobre ele
+        self.__incidencia = {}
+        # Para cada vértice, os seus vizinhos e quantas arestas ligam o vértice a cada um deles.
+        # É o contador de multiplicidade de cada par não ordenado {X, Y}, acessível a partir de qualquer um dos dois.
+        self.__vizinhos = {}
+        # Quantidade de pares ordenados (X, Y) de vértices adjacentes
+        self.__pares_adjacentes = 0
+        # Quantidade de pares não ordenados {X, Y} ligados por mais de uma aresta
+        self.__pares_paralelos = 0
+        # Quantidade de arestas que não são laços e de pares distintos {X, Y}, com X != Y, ligados por elas
+        self.__arestas_sem_laco = 0
+        self.__pares_sem_laco = 0
+        for v in self.N:
+            self.__incidencia[v] = {}
+            self.__vizinhos[v] = {}
+        for a in self.A:
+            self.__indexa_aresta(a)
+
+    def __separa_aresta(self, aresta):
+        '''
+        Separa uma aresta no formato X-Y nos seus dois vértices, validando-a ao mesmo tempo.
+        :param aresta: A aresta a ser separada
+        :return: Uma tupla (X, Y) ou None se a aresta não for válida neste grafo
+        '''
+        partes = aresta.split(Grafo.SEPARADOR_ARESTA)
+        if len(partes) != Grafo.QTDE_MAX_SEPARADOR + 1:
+            return None
+
+        v1, v2 = partes
+        if v1 not in self.__conjunto_vertices or v2 not in self.__conjunto_vertices:
+            return None
+
+        return v1, v2
+
+    def __indexa_aresta(self, nome):
+        '''
+        Registra a aresta no índice de incidência dos seus dois vértices.
+        Um laço é registrado uma única vez no seu vértice.
+        :param nome: O nome de uma aresta que já está em self.A
+        '''
+        v1, v2 = self.__extremidades[nome]
+        self.__incidencia[v1][nome] = None
+        self.__incidencia[v2][nome] = None
+
+        self.__adiciona_vizinho(v1, v2)
+        if v1 != v2:
+            self.__adiciona_vizinho(v2, v1)
+            self.__arestas_sem_laco += 1
+            if self.__vizinhos[v1][v2] == 1:
+                self.__pares_sem_laco += 1
+        if self.__vizinhos[v1][v2] == 2:
+            self.__pares_paralelos += 1
+
+    def __desindexa_aresta(self, nome):
+        '''
+        Remove a aresta do índice de incidência dos seus dois vértices.
+        :param nome: O nome de uma aresta que ainda está em self.A
+        '''
+        v1, v2 = self.__extremidades.pop(nome)
+        self.__incidencia[v1].pop(nome, None)
+        self.__incidencia[v2].pop(nome, None)
+
+        if self.__vizinhos[v1][v2] == 2:
+            self.__pares_paralelos -= 1
+        if v1 != v2:
+            self.__arestas_sem_laco -= 1
+            if self.__vizinhos[v1][v2] == 1:
+                self.__pares_sem_laco -= 1
+        self.__remove_vizinho(v1, v2)
+        if v1 != v2:
+            self.__remove_vizinho(v2, v1)
+
+    def __adiciona_vizinho(self, v1, v2):
+        vizinhos = self.__vizinhos[v1]
+        if v2 in vizinhos:
+            vizinhos[v2] += 1
+        else:
+            vizinhos[v2] = 1
+            self.__pares_adjacentes += 1
 
-        self.A = A
+    def __remove_vizinho(self, v1, v2):
+        vizinhos = self.__vizinhos[v1]
+        if vizinhos[v2] > 1:
+            vizinhos[v2] -= 1
+        else:
+            del vizinhos[v2]
+            self.__pares_adjacentes -= 1
 
     def arestaValida(self, aresta=''):
         '''
@@ -39,23 +180,7 @@ class Grafo:
         :param aresta: A aresta que se quer verificar se está no formato correto.
         :return: Um valor booleano que indica se a aresta está no formato correto.
         '''
-
-        # Não pode haver mais de um caractere separador
-        if aresta.count(Grafo.SEPARADOR_ARESTA) != Grafo.QTDE_MAX_SEPARADOR:
-            return False
-
-        # Índice do elemento separador
-        i_traco = aresta.index(Grafo.SEPARADOR_ARESTA)
-
-        # O caractere separador não pode ser o primeiro ou o último caractere da aresta
-        if i_traco == 0 or aresta[-1] == Grafo.SEPARADOR_ARESTA:
-            return False
-
-        # Verifica se as arestas antes de depois do elemento separador existem no Grafo
-        if not(self.existeVertice(aresta[:i_traco])) or not(self.existeVertice(aresta[i_traco+1:])):
-            return False
-
-        return True
+        return self.__separa_aresta(aresta) is not None
 
     @classmethod
     def verticeValido(self, vertice=''):
@@ -73,7 +198,7 @@ class Grafo:
         :param vertice: O vértice que deve ser verificado.
         :return: Um valor booleano que indica se o vértice existe no grafo.
         '''
-        return Grafo.verticeValido(vertice) and self.N.count(vertice) > 0
+        return vertice in self.__conjunto_vertices
 
     def existeAresta(self, aresta=''):
         '''
@@ -82,10 +207,13 @@ class Grafo:
         :return: Um valor booleano que indica se a aresta existe no grafo.
         '''
         existe = False
-        if Grafo.arestaValida(self, aresta):
-            for k in self.A:
-                if aresta == self.A[k]:
+        par = self.__separa_aresta(aresta)
+        if par is not None:
+            # Basta olhar as arestas que incidem sobre o primeiro vértice
+            for k in self.__incidencia[par[0]]:
+                if par == self.__extremidades[k]:
                     existe = True
+                    break
 
         return existe
 
@@ -97,6 +225,9 @@ class Grafo:
         '''
         if self.verticeValido(v) and not self.existeVertice(v):
             self.N.append(v)
+            self.__conjunto_vertices.add(v)
+            self.__incidencia[v] = {}
+            self.__vizinhos[v] = {}
         else:
             raise VerticeInvalidoException('O vértice ' + v + ' é inválido')
 
@@ -106,98 +237,210 @@ class Grafo:
         :param v: A aresta a ser adicionada
         :raises: ArestaInvalidaException se a aresta passada como parâmetro não puder ser adicionada
         '''
-        if self.arestaValida(a):
-            self.A[nome] = a
-        else:
-            ArestaInvalidaException('A aresta ' + self.A[a] + ' é inválida')
+        par = self.__separa_aresta(a)
+        if par is None:
+            raise ArestaInvalidaException('A aresta ' + a + ' é inválida')
+
+        if nome in self.A:
+            self.__desindexa_aresta(nome)
+        self.A[nome] = a
+        self.__extremidades[nome] = par
+        self.__indexa_aresta(nome)
+
+    def adicionaArestas(self, A):
+        '''
+        Adiciona várias arestas de uma vez. Todas as arestas são validadas antes de qualquer uma ser incluída,
+        de modo que o grafo não é alterado se alguma delas for inválida.
+        :param A: Um dicionário no mesmo formato do construtor, com o nome da aresta como chave e a aresta X-Y como valor
+        :raises: ArestaInvalidaException se alguma das arestas não puder ser adicionada
+        '''
+        pares = {}
+        for nome in A:
+            par = self.__separa_aresta(A[nome])
+            if par is None:
+                raise ArestaInvalidaException('A aresta ' + A[nome] + ' é inválida')
+            pares[nome] = par
+
+        for nome in pares:
+            if nome in self.A:
+                self.__desindexa_aresta(nome)
+            self.A[nome] = A[nome]
+            self.__extremidades[nome] = pares[nome]
+            self.__indexa_aresta(nome)
 
     def vertices_nao_adjacentes(self):
-        arestas = self.A.values()
-        resultado = []
+        '''
+        Fornece todos os pares ordenados X-Y de vértices que não são ligados por nenhuma aresta, em qualquer sentido.
+        Para grafos grandes prefira complemento(), que não monta a lista.
+        :return: Uma lista com os pares no formato X-Y
+        '''
+        return list(self.iter_nao_adjacentes())
 
+    def iter_nao_adjacentes(self):
+        '''
+        Gera, um a um, os pares X-Y de vértices não adjacentes, na mesma ordem de vertices_nao_adjacentes().
+        '''
         for i in self.N:
+            vizinhos = self.__vizinhos[i]
+            prefixo = i + self.SEPARADOR_ARESTA
             for j in self.N:
-                aresta_indo = "{}{}{}".format(i,self.SEPARADOR_ARESTA,j)
-                aresta_voltando = "{}{}{}".format(j, self.SEPARADOR_ARESTA, i)
-                if aresta_indo not in arestas and aresta_voltando not in arestas:
-                    resultado.append(aresta_indo)
-        return resultado
+                if j not in vizinhos:
+                    yield prefixo + j
+
+    def sao_nao_adjacentes(self, v1, v2):
+        '''
+        Verifica em O(1) se dois vértices do grafo não são ligados por nenhuma aresta.
+        :param v1: O primeiro vértice
+        :param v2: O segundo vértice
+        :return: Um valor booleano; False se algum dos vértices não existir no grafo
+        '''
+        if v1 not in self.__vizinhos or v2 not in self.__vizinhos:
+            return False
+        return v2 not in self.__vizinhos[v1]
+
+    def quantidade_nao_adjacentes(self):
+        '''
+        Fornece em O(1) a quantidade de pares ordenados de vértices não adjacentes, sem montar a lista.
+        :return: O tamanho que vertices_nao_adjacentes() teria
+        '''
+        return len(self.N) * len(self.N) - self.__pares_adjacentes
+
+    def complemento(self):
+        '''
+        Fornece uma visão preguiçosa dos pares de vértices não adjacentes.
+        :return: Um ComplementoGrafo ligado a este grafo
+        '''
+        return ComplementoGrafo(self)
 
     def ha_laco(self):
-        arestas = self.A.values()
-        for i in arestas:
-            v1,v2 = i.split(self.SEPARADOR_ARESTA)
+        for v1, v2 in self.__extremidades.values():
             if v1 == v2:
                 return True
         return False
 
     def ha_paralelas(self):
-        arestas = list(self.A.values())
-
-        for i in arestas:
-            v1, v2 = i.split(self.SEPARADOR_ARESTA)
-
-            if(arestas.count("{}{}{}".format(v1,self.SEPARADOR_ARESTA,v2)) +  arestas.count("{}{}{}".format(v2,self.SEPARADOR_ARESTA,v1)) > 1):
-                return True
-
-        return False
+        '''
+        Verifica se algum par de vértices é ligado por mais de uma aresta, em qualquer sentido.
+        :return: Um valor booleano que indica se há arestas paralelas
+        '''
+        return self.__pares_paralelos > 0
 
-    def  grau(self, vertice):
-        aresta = self.A
+    def multiplicidade(self, v1, v2):
+        '''
+        Fornece em O(1) quantas arestas ligam dois vértices, em qualquer sentido.
+        :param v1: O primeiro vértice
+        :param v2: O segundo vértice
+        :return: A quantidade de arestas entre os dois vértices
+        '''
+        return self.__vizinhos.get(v1, {}).get(v2, 0)
 
-        cont = 0
-        for i in aresta:
-            V1, V2 = aresta[i].split(self.SEPARADOR_ARESTA)
-            if V1 == vertice or V2 == vertice:
-                    cont += 1
+    def multiplicidades(self):
+        '''
+        Fornece todos os grupos de arestas paralelas.
+        Cada par aparece uma única vez, com o vértice que vem primeiro em N na frente.
+        :return: Um dicionário com o par no formato X-Y como chave e a quantidade de arestas que ligam o par como valor
+        '''
+        resultado = {}
+        if self.__pares_paralelos == 0:
+            return resultado
+
+        vistos = set()
+        for v1 in self.N:
+            vistos.add(v1)
+            for v2, quantidade in self.__vizinhos[v1].items():
+                if quantidade > 1 and (v2 == v1 or v2 not in vistos):
+                    resultado[v1 + self.SEPARADOR_ARESTA + v2] = quantidade
+        return resultado
 
-        return cont
+    def grau(self, vertice):
+        '''
+        Calcula o grau de um vértice a partir do índice de incidência. Cada laço conta uma única vez.
+        :param vertice: O vértice a ser analisado
+        :return: A quantidade de arestas que incidem sobre o vértice
+        '''
+        return len(self.__incidencia.get(vertice, ()))
 
     def arestas_sobre_vertice(self, vertice):
-        aresta = self.A
-
-        arestas_final = []
-        for i in aresta:
-            V1,V2 = aresta[i].split(self.SEPARADOR_ARESTA)
-            if V1 == vertice or V2 == vertice:
-                arestas_final.append(i)
-        return arestas_final
+        '''
+        Fornece os nomes das arestas que incidem sobre um vértice, na ordem em que foram adicionadas.
+        :param vertice: O vértice a ser analisado
+        :return: Uma lista com os nomes das arestas
+        '''
+        return list(self.__incidencia.get(vertice, ()))
 
     def eh_completo(self):
-        arestas = list(self.A.values())
-
-        verticies = self.N
-
-        lista_completo = []
-
-        if len(verticies) == 1:
-            return True
-
-        for i in range(len(verticies)):
-            for j in range(i+1 , len(verticies)):
-                    lista_completo.append("{}{}{}".format(verticies[i],self.SEPARADOR_ARESTA,verticies[j]))
-
-
+        '''
+        Verifica em O(1) se o grafo é completo, a partir dos contadores mantidos a cada inclusão de aresta:
+        todo par de vértices distintos deve estar ligado por exatamente uma aresta. Laços não são considerados.
+        :return: Um valor booleano que indica se o grafo é completo
+        '''
+        necessarias = len(self.N) * (len(self.N) - 1) // 2
+        return self.__pares_sem_laco == necessarias and self.__arestas_sem_laco == necessarias
 
-        cont = 0
-        for i in arestas:
-            V1,V2 = i.split(self.SEPARADOR_ARESTA)
-            if  V1 != V2:
-                 cont+=1
+    @classmethod
+    def carregar(cls, arquivo):
+        '''
+        Constrói um grafo a partir de um arquivo texto com uma lista de arestas, lido linha a linha.
+        Formato de cada linha:
+          X        declara o vértice X (útil para vértices isolados e para fixar a ordem dos vértices)
+          X-Y      uma aresta, que recebe o nome a1, a2, ... conforme a ordem do arquivo
+          nome X-Y uma aresta com nome próprio
+        Linhas vazias ou começadas por # são ignoradas. Vértices que aparecem apenas em arestas são incluídos
+        automaticamente, na ordem em que aparecem. Cada linha é incluída direto no grafo, sem montar antes um
+        dicionário de arestas que o construtor copiaria de novo.
+        :param arquivo: O caminho do arquivo ou um objeto de arquivo aberto para leitura
+        :return: O Grafo lido
+        :raises: VerticeInvalidoException ou ArestaInvalidaException se alguma linha não estiver no formato
+        :raises: ArestaInvalidaException se dois nomes de aresta se repetirem, inclusive um nome a1, a2, ... gerado
+        automaticamente e usado depois por uma linha com nome próprio
+        '''
+        g = cls()
+        proxima_aresta = 1
 
-        if len(lista_completo) != cont:
-            return False
-        else:
-            for i in range(len(lista_completo)):
-                v1,v2 = lista_completo[i].split("-")
-                if (lista_completo[i] not in arestas):
-                    if "{}{}{}".format(v2,self.SEPARADOR_ARESTA, v1) not in arestas:
-                        return False
+        with _abre_arquivo(arquivo, 'r') as f:
+            for num_linha, linha in enumerate(f, 1):
+                campos = linha.split()
+                if not campos or campos[0].startswith('#'):
                     continue
 
-            return True
-
+                if len(campos) == 1 and cls.SEPARADOR_ARESTA not in campos[0]:
+                    if not g.existeVertice(campos[0]):
+                        g.adicionaVertice(campos[0])
+                    continue
 
+                if len(campos) == 1:
+                    while 'a' + str(proxima_aresta) in g.A:
+                        proxima_aresta += 1
+                    nome = 'a' + str(proxima_aresta)
+                    aresta = campos[0]
+                elif len(campos) == 2:
+                    nome, aresta = campos
+                    if nome in g.A:
+                        raise ArestaInvalidaException('A aresta {} já existe (linha {})'.format(nome, num_linha))
+                else:
+                    raise ArestaInvalidaException('Linha {} inválida: {}'.format(num_linha, linha.strip()))
+
+                partes = aresta.split(cls.SEPARADOR_ARESTA)
+                if len(partes) != cls.QTDE_MAX_SEPARADOR + 1 or '' in partes:
+                    raise ArestaInvalidaException('A aresta {} é inválida (linha {})'.format(aresta, num_linha))
+                for v in partes:
+                    if not g.existeVertice(v):
+                        g.adicionaVertice(v)
+                g.adicionaAresta(nome, aresta)
+
+        return g
+
+    def salvar(self, arquivo):
+        '''
+        Grava o grafo no formato lido por carregar(), uma linha por vez, sem montar o texto inteiro em memória.
+        Primeiro são gravados todos os vértices, na ordem de N, e depois as arestas com os seus nomes.
+        :param arquivo: O caminho do arquivo ou um objeto de arquivo aberto para escrita
+        '''
+        with _abre_arquivo(arquivo, 'w') as f:
+            for v in self.N:
+                f.write(v + '\n')
+            for nome in self.A:
+                f.write(nome + ' ' + self.A[nome] + '\n')
 
     def __str__(self):
         '''
@@ -205,21 +448,7 @@ class Grafo:
         O String contém um sequência dos vértices separados por vírgula, seguido de uma sequência das arestas no formato padrão.
         :return: Uma string que representa o grafo
         '''
-        grafo_str = ''
-
-        for v in range(len(self.N)):
-            grafo_str += self.N[v]
-            if v < (len(self.N) - 1):  # Só coloca a vírgula se não for o último vértice
-                grafo_str += ", "
-
-        grafo_str += '\n'
-
-        for i, a in enumerate(self.A):
-            grafo_str += self.A[a]
-            if not(i == len(self.A) - 1): # Só coloca a vírgula se não for a última aresta
-                grafo_str += ", "
-
-        return grafo_str
+        return ", ".join(self.N) + '\n' + ", ".join(self.A.values())
 
 
 
@@ -1,3 +1,4 @@
+import io
 import unittest
 from grafo import *
 
@@ -92,3 +93,135 @@ class TestGrafo(unittest.TestCase):
         self.assertFalse((self.g_l3.eh_completo()))
         self.assertTrue((self.g_l4.eh_completo()))
         self.assertTrue((self.g_l5.eh_completo()))
+
+    def test_existe_aresta(self):
+        self.assertTrue(self.g_p.existeAresta('J-C'))
+        self.assertTrue(self.g_p.existeAresta('T-Z'))
+        self.assertFalse(self.g_p.existeAresta('C-J'))
+        self.assertFalse(self.g_p.existeAresta('J-Z'))
+        self.assertFalse(self.g_p.existeAresta('J-X'))
+
+    def test_adiciona_aresta_atualiza_incidencia(self):
+        g = Grafo(['A', 'B', 'C'], {'a1': 'A-B'})
+        g.adicionaAresta('a2', 'B-C')
+        self.assertEqual(g.grau('B'), 2)
+        self.assertEqual(g.arestas_sobre_vertice('B'), ['a1', 'a2'])
+        self.assertTrue(g.existeAresta('B-C'))
+
+        # Reaproveitar o nome de uma aresta substitui a aresta anterior
+        g.adicionaAresta('a2', 'A-C')
+        self.assertEqual(g.grau('B'), 1)
+        self.assertEqual(g.grau('C'), 1)
+        self.assertFalse(g.existeAresta('B-C'))
+
+        g.adicionaVertice('D')
+        self.assertEqual(g.grau('D'), 0)
+        self.assertRaises(ArestaInvalidaException, g.adicionaAresta, 'a3', 'A-E')
+
+    def test_adiciona_arestas(self):
+        g = Grafo(['A', 'B', 'C'], {})
+        g.adicionaArestas({'a1': 'A-B', 'a2': 'B-C', 'a3': 'C-C'})
+        self.assertEqual(g.grau('C'), 2)
+        self.assertTrue(g.existeAresta('B-C'))
+
+        # Nenhuma aresta é incluída se alguma for inválida
+        self.assertRaises(ArestaInvalidaException, g.adicionaArestas, {'a4': 'A-C', 'a5': 'A--B'})
+        self.assertFalse(g.existeAresta('A-C'))
+        self.assertRaises(ArestaInvalidaException, Grafo, ['A', 'B'], {'a1': 'A-B-A'})
+
+    def test_complemento(self):
+        complemento = self.g_p.complemento()
+        self.assertEqual(list(complemento), self.g_p.vertices_nao_adjacentes())
+        self.assertEqual(len(complemento), 35)
+        self.assertIn('J-E', complemento)
+        self.assertIn(('Z', 'C'), complemento)
+        self.assertNotIn('C-J', complemento)
+        self.assertNotIn('J-X', complemento)
+
+        self.assertEqual(len(self.g_l1.complemento()), 13)
+        self.assertNotIn('A-A', self.g_l1.complemento())
+
+        # A visão acompanha as alterações no grafo
+        g = Grafo(['J'], {})
+        complemento_g = g.complemento()
+        g.adicionaVertice('K')
+        self.assertEqual(len(complemento_g), 4)
+        g.adicionaAresta('a1', 'K-J')
+        self.assertEqual(len(complemento_g), 2)
+        self.assertEqual(list(complemento_g), ['J-J', 'K-K'])
+        g.adicionaAresta('a1', 'K-K')
+        self.assertEqual(list(complemento_g), ['J-J', 'J-K', 'K-J'])
+
+    def test_multiplicidades(self):
+        self.assertEqual(self.g_p.multiplicidades(), {'C-E': 2, 'C-P': 2})
+        self.assertEqual(self.g_p.multiplicidade('E', 'C'), 2)
+        self.assertEqual(self.g_p.multiplicidade('J', 'C'), 1)
+        self.assertEqual(self.g_p.multiplicidade('J', 'Z'), 0)
+        self.assertEqual(self.g_p_sem_paralelas.multiplicidades(), {})
+        self.assertEqual(self.g_l1.multiplicidades(), {'A-A': 2})
+        self.assertEqual(self.g_l2.multiplicidades(), {'A-B': 2})
+
+        # Um único laço não é uma aresta paralela
+        self.assertFalse(self.g_l4.ha_paralelas())
+
+        g = Grafo(['A', 'B'], {'a1': 'A-B'})
+        g.adicionaAresta('a2', 'B-A')
+        self.assertTrue(g.ha_paralelas())
+        g.adicionaAresta('a2', 'B-B')
+        self.assertFalse(g.ha_paralelas())
+        self.assertEqual(g.multiplicidades(), {})
+
+    def test_eh_completo_incremental(self):
+        g = Grafo(['A', 'B'], {})
+        self.assertFalse(g.eh_completo())
+        g.adicionaAresta('a1', 'A-B')
+        self.assertTrue(g.eh_completo())
+        g.adicionaVertice('C')
+        self.assertFalse(g.eh_completo())
+        g.adicionaAresta('a2', 'C-A')
+        g.adicionaAresta('a3', 'B-C')
+        self.assertTrue(g.eh_completo())
+        g.adicionaAresta('a4', 'C-C')
+        self.assertTrue(g.eh_completo())
+        g.adicionaAresta('a5', 'B-A')
+        self.assertFalse(g.eh_completo())
+        g.adicionaAresta('a5', 'B-B')
+        self.assertTrue(g.eh_completo())
+
+    def test_carregar_e_salvar(self):
+        arquivo = io.StringIO()
+        self.g_p.salvar(arquivo)
+        arquivo.seek(0)
+        g = Grafo.carregar(arquivo)
+        self.assertEqual(g.N, self.g_p.N)
+        self.assertEqual(g.A, self.g_p.A)
+        self.assertEqual(str(g), str(self.g_p))
+
+        g = Grafo.carregar(io.StringIO('# Paraíba\nZ\nJ-C\n\nx C-E\nC-E\n'))
+        self.assertEqual(g.N, ['Z', 'J', 'C', 'E'])
+        self.assertEqual(g.A, {'a1': 'J-C', 'x': 'C-E', 'a2': 'C-E'})
+        self.assertEqual(g.grau('Z'), 0)
+
+        self.assertRaises(ArestaInvalidaException, Grafo.carregar, io.StringIO('J-C-E\n'))
+        self.assertRaises(ArestaInvalidaException, Grafo.carregar, io.StringIO('a1 J-C 3\n'))
+
+        # Nomes repetidos, inclusive um nome gerado automaticamente e usado depois por uma linha com nome
+        self.assertRaises(ArestaInvalidaException, Grafo.carregar, io.StringIO('x J-C\nx C-E\n'))
+        self.assertRaises(ArestaInvalidaException, Grafo.carregar, io.StringIO('J-C\na1 C-E\n'))
+        self.assertEqual(Grafo.carregar(io.StringIO('a1 J-C\nC-E\n')).A, {'a1': 'J-C', 'a2': 'C-E'})
+
+        # As arestas não passam pelo construtor, que faria uma segunda cópia delas
+        construtor = Grafo.__init__
+        arestas_no_construtor = []
+
+        def registra(grafo, N=None, A=None):
+            arestas_no_construtor.append(A)
+            construtor(grafo, N, A)
+
+        Grafo.__init__ = registra
+        try:
+            g = Grafo.carregar(io.StringIO('J-C\nC-E\n'))
+        finally:
+            Grafo.__init__ = construtor
+        self.assertEqual(arestas_no_construtor, [None])
+        self.assertEqual(g.A, {'a1': 'J-C', 'a2': 'C-E'})
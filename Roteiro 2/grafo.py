@@ -1,32 +1,141 @@
+from array import array
+
 class VerticeInvalidoException(Exception):
     pass
 
 class ArestaInvalidaException(Exception):
     pass
 
+class BuscaEmProfundidade:
+    '''
+    Resultado de uma única busca em profundidade sobre todo o grafo, seguindo as arestas no sentido X-Y.
+    Os vértices são identificados pela posição em N e as arestas pela posição em A. Todas as informações ficam em arrays:
+    pre[i] e pos[i] são os instantes de descoberta e de término do vértice i; pai[i] e aresta_pai[i] são o vértice e a
+    aresta pelos quais i foi descoberto (-1 para as raízes da floresta); tipos[k] é o tipo da aresta k;
+    ordem_termino tem os vértices na ordem em que terminaram.
+    '''
+
+    ARVORE = 0
+    RETORNO = 1
+    AVANCO = 2
+    CRUZAMENTO = 3
+
+    def __init__(self, vertices, nomes_arestas, offsets, alvos, arestas):
+        '''
+        Percorre o grafo descrito pela lista de adjacência CSR, começando uma nova árvore em cada vértice ainda não
+        descoberto, na ordem de N. Usa uma pilha explícita, então não depende do limite de recursão.
+        '''
+        n = len(vertices)
+        self.vertices = vertices
+        self.nomes_arestas = nomes_arestas
+        self.pre = array('i', [-1]) * n
+        self.pos = array('i', [-1]) * n
+        self.pai = array('i', [-1]) * n
+        self.aresta_pai = array('i', [-1]) * n
+        self.tipos = bytearray(len(nomes_arestas))
+        self.ordem_termino = array('i')
+
+        pre, pos, tipos = self.pre, self.pos, self.tipos
+        proximo = offsets[:n]
+        tempo = 0
+        for raiz in range(n):
+            if pre[raiz] != -1:
+                continue
+            pre[raiz] = tempo
+            tempo += 1
+            pilha = [raiz]
+            while pilha:
+                u = pilha[-1]
+                p = proximo[u]
+                if p < offsets[u + 1]:
+                    proximo[u] = p + 1
+                    w = alvos[p]
+                    k = arestas[p]
+                    if pre[w] == -1:
+                        tipos[k] = self.ARVORE
+                        self.pai[w] = u
+                        self.aresta_pai[w] = k
+                        pre[w] = tempo
+                        tempo += 1
+                        pilha.append(w)
+                    elif pos[w] == -1:
+                        # w ainda está na pilha, então é um ancestral de u (ou o próprio u, no caso de um laço)
+                        tipos[k] = self.RETORNO
+                    elif pre[u] < pre[w]:
+                        tipos[k] = self.AVANCO
+                    else:
+                        tipos[k] = self.CRUZAMENTO
+                else:
+                    pos[u] = tempo
+                    tempo += 1
+                    self.ordem_termino.append(u)
+                    pilha.pop()
+
+    def arestas_do_tipo(self, tipo):
+        '''
+        :param tipo: ARVORE, RETORNO, AVANCO ou CRUZAMENTO
+        :return: Uma lista com os nomes das arestas do tipo pedido, na ordem de A
+        '''
+        return [self.nomes_arestas[k] for k, t in enumerate(self.tipos) if t == tipo]
+
+    def ha_ciclo(self):
+        '''
+        Um grafo direcionado tem ciclo se, e somente se, a busca em profundidade encontra uma aresta de retorno.
+        :return: Um valor booleano que indica se há ciclo
+        '''
+        return self.RETORNO in self.tipos
+
+    def ordem_topologica(self):
+        '''
+        Fornece os vértices em ordem decrescente de término, que é uma ordenação topológica quando não há ciclos.
+        :return: Uma lista de vértices, ou None se o grafo tiver ciclo
+        '''
+        if self.ha_ciclo():
+            return None
+        return [self.vertices[i] for i in reversed(self.ordem_termino)]
+
+    def arestas_de_retorno(self):
+        '''
+        :return: Uma lista com os nomes das arestas que voltam para um ancestral (inclusive os laços)
+        '''
+        return self.arestas_do_tipo(self.RETORNO)
+
 class Grafo:
 
     QTDE_MAX_SEPARADOR = 1
     SEPARADOR_ARESTA = '-'
 
-    def __init__(self, N=[], A={}):
+    def __init__(self, N=None, A=None):
         '''
         Constrói um objeto do tipo Grafo. Se nenhum parâmetro for passado, cria um Grafo vazio.
         Se houver alguma aresta ou algum vértice inválido, uma exceção é lançada.
         :param N: Uma lista dos vértices (ou nodos) do grafo.
         :param V: Uma dicionário que guarda as arestas do grafo. A chave representa o nome da aresta e o valor é uma string que contém dois vértices separados por um traço.
         '''
+
+        if N == None:
+            N = list()
+        if A == None:
+            A = dict()
+
         for v in N:
             if not(Grafo.verticeValido(v)):
                 raise VerticeInvalidoException('O vértice ' + v + ' é inválido')
 
-        self.N = N
+        self.N = list(N)
 
         for a in A:
             if not(self.arestaValida(A[a])):
                 raise ArestaInvalidaException('A aresta ' + A[a] + ' é inválida')
 
-        self.A = A
+        self.A = dict(A)
+
+        # Pares {X, Y} de vértices distintos ligados por alguma aresta, usados por eh_completo()
+        self.__conta_pares()
+
+        # Fotografia CSR do grafo, montada sob demanda por csr(), e a busca em profundidade feita sobre ela
+        self.__csr = None
+        self.__busca = None
 
     def arestaValida(self, aresta=''):
         '''
@@ -96,7 +205,10 @@ class Grafo:
         :raises: VerticeInvalidoException se o vértice passado como parâmetro não puder ser adicionado
         '''
         if self.verticeValido(v) and not self.existeVertice(v):
+            em_dia = self.__tamanhos_pares == (len(self.N), len(self.A))
             self.N.append(v)
+            self.__tamanhos_pares = (len(self.N), len(self.A)) if em_dia else None
+            self.__csr = None
         else:
             raise VerticeInvalidoException('O vértice ' + v + ' é inválido')
 
@@ -107,7 +219,15 @@ class Grafo:
         :raises: ArestaInvalidaException se a aresta passada como parâmetro não puder ser adicionada
         '''
         if self.arestaValida(a):
+            # Trocar uma aresta existente obriga a refazer os pares, já que o par antigo pode continuar ligado
+            em_dia = nome not in self.A and self.__tamanhos_pares == (len(self.N), len(self.A))
             self.A[nome] = a
+            if em_dia:
+                self.__inclui_par(a)
+                self.__tamanhos_pares = (len(self.N), len(self.A))
+            else:
+                self.__tamanhos_pares = None
+            self.__csr = None
         else:
             ArestaInvalidaException('A aresta ' + self.A[a] + ' é inválida')
 
@@ -163,47 +283,203 @@ class Grafo:
                 arestas_final.append(i)
         return arestas_final
 
-    def eh_completo(self):
-        arestas = list(self.A.values())
+    def __conta_pares(self):
+        '''
+        Refaz, em O(E), o conjunto de pares de vértices distintos ligados por alguma aresta.
+        '''
+        self.__pares = set()
+        for a in self.A.values():
+            self.__inclui_par(a)
+        self.__tamanhos_pares = (len(self.N), len(self.A))
 
-        verticies = self.N
+    def __inclui_par(self, aresta):
+        v1, v2 = aresta.split(self.SEPARADOR_ARESTA)
+        if v1 != v2:
+            self.__pares.add((v1, v2) if v1 < v2 else (v2, v1))
 
-        lista_completo = []
+    def eh_completo(self):
+        '''
+        Verifica se o grafo é completo: todo par de vértices distintos deve estar ligado por exatamente uma aresta,
+        sem laços. Custa O(1) com o conjunto de pares mantido por adicionaAresta(), que só é refeito depois que uma
+        aresta é trocada ou que os tamanhos de N ou A mudam por uma alteração direta. Uma alteração direta que mantém
+        os tamanhos (como trocar o valor de A[nome]) não é percebida.
+        :return: Um valor booleano que indica se o grafo é completo
+        '''
+        verticies = self.N
 
         if len(verticies) == 1:
             return True
         elif len(verticies) == 2:
             return True
 
-        for i in range(len(verticies)):
-            for j in range(i+1 , len(verticies)):
-                    lista_completo.append("{}{}{}".format(verticies[i],self.SEPARADOR_ARESTA,verticies[j]))
-
-
-        if len(lista_completo) != len(arestas):
-            return False
-        else:
-            for i in range(len(lista_completo)):
-                v1,v2 = lista_completo[i].split("-")
-                if (lista_completo[i] not in arestas):
-                    if "{}{}{}".format(v2,self.SEPARADOR_ARESTA, v1) not in arestas:
-                        return False
-                    continue
-
-            return True
+        if self.__tamanhos_pares != (len(self.N), len(self.A)):
+            self.__conta_pares()
 
+        necessarias = len(verticies) * (len(verticies) - 1) // 2
+        return len(self.A) == necessarias and len(self.__pares) == necessarias
 
     def DFS(self, verticie, visitados):
-
-        visitados.append(verticie)
-        for a in self.A:
-            v1,v2 = self.A[a].split(self.SEPARADOR_ARESTA)
-            if v2 not in visitados and v1 == verticie:
+        '''
+        Faz uma busca em profundidade a partir de um vértice, seguindo as arestas no sentido X-Y.
+        :param verticie: O vértice onde a busca começa
+        :param visitados: Uma lista com os vértices e arestas já visitados, que é estendida pela busca
+        :return: A lista visitados, com os vértices alcançados intercalados com as arestas usadas para chegar neles
+        '''
+        for v, a in self.DFS_iter(verticie, visitados):
+            if a is not None:
                 visitados.append(a)
-                self.DFS(v2, visitados)
+            visitados.append(v)
 
         return visitados
 
+    def DFS_iter(self, verticie, visitados=None):
+        '''
+        Versão iterativa e preguiçosa da busca em profundidade, com uma pilha explícita no lugar da recursão.
+        Percorre os vértices na mesma ordem de DFS(), em O(V + E).
+        :param verticie: O vértice onde a busca começa
+        :param visitados: Vértices e arestas que devem ser considerados já visitados. A lista não é alterada
+        :return: Um gerador de pares (vértice, aresta) na ordem em que os vértices são descobertos. O primeiro par é
+        (verticie, None) e nos demais a aresta é a usada para chegar no vértice
+        '''
+        # Arestas que saem de cada vértice, na ordem do dicionário, separadas uma única vez
+        sucessores = {}
+        for a in self.A:
+            v1, v2 = self.A[a].split(self.SEPARADOR_ARESTA)
+            if v1 in sucessores:
+                sucessores[v1].append((a, v2))
+            else:
+                sucessores[v1] = [(a, v2)]
+
+        # Vértices e arestas ficam no mesmo conjunto, assim como ficam na mesma lista em DFS()
+        vistos = set() if visitados is None else set(visitados)
+        vistos.add(verticie)
+        yield verticie, None
+
+        pilha = [iter(sucessores.get(verticie, ()))]
+        while pilha:
+            for a, v2 in pilha[-1]:
+                if v2 not in vistos:
+                    vistos.add(a)
+                    vistos.add(v2)
+                    yield v2, a
+                    pilha.append(iter(sucessores.get(v2, ())))
+                    break
+            else:
+                pilha.pop()
+
+
+    def csr(self):
+        '''
+        Fornece a lista de adjacência do grafo no formato CSR (compressed sparse row), seguindo as arestas no sentido X-Y.
+        Os vértices são identificados pela posição em N e as arestas pela posição em A. Os sucessores do vértice i estão em
+        alvos[offsets[i]:offsets[i + 1]] e as arestas correspondentes em arestas[offsets[i]:offsets[i + 1]], na ordem de A.
+        A fotografia é montada uma vez e guardada até a próxima alteração feita por adicionaVertice ou adicionaAresta.
+        :return: Uma tupla (offsets, alvos, arestas) de array('i')
+        '''
+        if self.__csr is None or self.__csr[3] != (len(self.N), len(self.A)):
+            indices = {}
+            for i, v in enumerate(self.N):
+                indices[v] = i
+            n = len(self.N)
+
+            origens = array('i')
+            destinos = array('i')
+            for a in self.A:
+                v1, v2 = self.A[a].split(self.SEPARADOR_ARESTA)
+                origens.append(indices[v1])
+                destinos.append(indices[v2])
+
+            # offsets[i + 1] começa com o grau de saída de i e depois vira a soma acumulada
+            offsets = array('i', [0]) * (n + 1)
+            for o in origens:
+                offsets[o + 1] += 1
+            for i in range(n):
+                offsets[i + 1] += offsets[i]
+
+            alvos = array('i', [0]) * len(origens)
+            arestas = array('i', [0]) * len(origens)
+            proximo = offsets[:n]
+            for k, o in enumerate(origens):
+                p = proximo[o]
+                alvos[p] = destinos[k]
+                arestas[p] = k
+                proximo[o] = p + 1
+
+            self.__csr = (offsets, alvos, arestas, (len(self.N), len(self.A)), indices)
+
+        return self.__csr[:3]
+
+    def BFS(self, origens):
+        '''
+        Faz uma busca em largura a partir de um ou mais vértices ao mesmo tempo, seguindo as arestas no sentido X-Y.
+        A busca avança uma fronteira inteira por vez sobre a fotografia CSR do grafo.
+        :param origens: Um vértice ou uma lista de vértices de onde a busca começa
+        :return: Uma tupla (distancias, pais) de array('i') indexados pela posição do vértice em N.
+        distancias[i] é a quantidade de arestas entre a origem mais próxima e o vértice i, ou -1 se ele não for alcançável.
+        pais[i] é a posição do vértice que antecede i no caminho, ou -1 para as origens e os vértices não alcançáveis.
+        :raises: VerticeInvalidoException se alguma origem não pertencer ao grafo
+        '''
+        if isinstance(origens, str):
+            origens = [origens]
+
+        offsets, alvos, _ = self.csr()
+        indices = self.__csr[4]
+        distancias = array('i', [-1]) * len(self.N)
+        pais = array('i', [-1]) * len(self.N)
+
+        fronteira = []
+        for v in origens:
+            if v not in indices:
+                raise VerticeInvalidoException('O vértice ' + str(v) + ' não existe no grafo')
+            i = indices[v]
+            if distancias[i] == -1:
+                distancias[i] = 0
+                fronteira.append(i)
+
+        nivel = 0
+        while fronteira:
+            nivel += 1
+            proxima = []
+            for u in fronteira:
+                for w in alvos[offsets[u]:offsets[u + 1]]:
+                    if distancias[w] == -1:
+                        distancias[w] = nivel
+                        pais[w] = u
+                        proxima.append(w)
+            fronteira = proxima
+
+        return distancias, pais
+
+    def busca_em_profundidade(self):
+        '''
+        Faz uma única busca em profundidade sobre o grafo inteiro, em O(V + E), registrando os tempos de descoberta e
+        término, a floresta de busca e o tipo de cada aresta. O resultado é guardado até a próxima alteração do grafo.
+        :return: Um objeto BuscaEmProfundidade
+        '''
+        offsets, alvos, arestas = self.csr()
+        if self.__busca is None or self.__busca[0] is not offsets:
+            busca = BuscaEmProfundidade(list(self.N), list(self.A), offsets, alvos, arestas)
+            self.__busca = (offsets, busca)
+        return self.__busca[1]
+
+    def ha_ciclo(self):
+        '''
+        Verifica se há um ciclo seguindo as arestas no sentido X-Y. Um laço também é um ciclo.
+        :return: Um valor booleano que indica se há ciclo
+        '''
+        return self.busca_em_profundidade().ha_ciclo()
+
+    def ordem_topologica(self):
+        '''
+        :return: Uma lista com os vértices em ordem topológica, ou None se o grafo tiver ciclo
+        '''
+        return self.busca_em_profundidade().ordem_topologica()
+
+    def arestas_de_retorno(self):
+        '''
+        :return: Uma lista com os nomes das arestas de retorno encontradas pela busca em profundidade
+        '''
+        return self.busca_em_profundidade().arestas_de_retorno()
 
     def __str__(self):
         '''
@@ -0,0 +1,155 @@
+import random
+import unittest
+from grafo import *
+
+class TestGrafo(unittest.TestCase):
+
+    def setUp(self):
+        # Grafo da Paraíba, com as arestas seguidas no sentido X-Y
+        self.g_p = Grafo(['J', 'C', 'E', 'P', 'M', 'T', 'Z'], {'a1':'J-C', 'a2':'C-E', 'a3':'C-E', 'a4':'C-P', 'a5':'C-P', 'a6':'C-M', 'a7':'C-T', 'a8':'M-T', 'a9':'T-Z'})
+
+        # Grafo da questão do roteiro (main.py)
+        self.g_q = Grafo(['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'J', 'K'], {'1': 'A-B', ' 2': 'A-G', '3': 'A-J', '4': 'K-G', '5': 'K-J', '6': 'J-G', '7': 'J-I', '8': 'I-G', '9': 'G-H', '10': 'H-F', '11': 'F-B', '12': 'B-G', '13': 'B-C', '14': 'C-D', '15': 'D-E', '16': 'D-B', '17': 'B-E'})
+
+    def test_DFS(self):
+        # Resultados da implementação recursiva original
+        self.assertEqual(self.g_p.DFS('J', []), ['J', 'a1', 'C', 'a2', 'E', 'a4', 'P', 'a6', 'M', 'a8', 'T', 'a9', 'Z'])
+        self.assertEqual(self.g_p.DFS('C', []), ['C', 'a2', 'E', 'a4', 'P', 'a6', 'M', 'a8', 'T', 'a9', 'Z'])
+        self.assertEqual(self.g_p.DFS('T', ['Z']), ['Z', 'T'])
+        self.assertEqual(self.g_q.DFS('K', []), ['K', '4', 'G', '9', 'H', '10', 'F', '11', 'B', '13', 'C', '14', 'D', '15', 'E', '5', 'J', '7', 'I'])
+        self.assertEqual(self.g_q.DFS('A', []), ['A', '1', 'B', '12', 'G', '9', 'H', '10', 'F', '13', 'C', '14', 'D', '15', 'E', '3', 'J', '7', 'I'])
+
+    def test_DFS_iter(self):
+        self.assertEqual(list(self.g_p.DFS_iter('M')), [('M', None), ('T', 'a8'), ('Z', 'a9')])
+
+        # A lista de visitados não é alterada e a busca é preguiçosa
+        visitados = ['T']
+        busca = self.g_p.DFS_iter('C', visitados)
+        self.assertEqual(next(busca), ('C', None))
+        self.assertEqual(next(busca), ('E', 'a2'))
+        self.assertEqual(list(busca), [('P', 'a4'), ('M', 'a6')])
+        self.assertEqual(visitados, ['T'])
+
+        # Caminho longo, maior que o limite de recursão
+        n = 5000
+        g = Grafo()
+        g.N = ['v' + str(i) for i in range(n)]
+        g.A = {'a' + str(i): 'v' + str(i) + '-v' + str(i + 1) for i in range(n - 1)}
+        self.assertEqual(len(g.DFS('v0', [])), 2 * n - 1)
+
+    def test_csr(self):
+        offsets, alvos, arestas = self.g_p.csr()
+        self.assertEqual(list(offsets), [0, 1, 7, 7, 7, 8, 9, 9])
+        self.assertEqual(list(alvos), [1, 2, 2, 3, 3, 4, 5, 5, 6])
+        self.assertEqual(list(arestas), [0, 1, 2, 3, 4, 5, 6, 7, 8])
+        self.assertIs(self.g_p.csr()[0], offsets)
+
+        # A fotografia é refeita depois de cada alteração
+        self.g_p.adicionaAresta('a10', 'Z-J')
+        offsets, alvos, arestas = self.g_p.csr()
+        self.assertEqual(list(offsets), [0, 1, 7, 7, 7, 8, 9, 10])
+        self.assertEqual(alvos[9], 0)
+        self.assertEqual(arestas[9], 9)
+
+        self.g_p.adicionaVertice('X')
+        offsets = self.g_p.csr()[0]
+        self.assertEqual(list(offsets), [0, 1, 7, 7, 7, 8, 9, 10, 10])
+
+        # Alterações feitas diretamente em A também são percebidas
+        self.g_p.A['a11'] = 'X-J'
+        offsets, alvos, _ = self.g_p.csr()
+        self.assertEqual(list(offsets), [0, 1, 7, 7, 7, 8, 9, 10, 11])
+        self.assertEqual(alvos[10], 0)
+
+    def test_BFS(self):
+        # Posições em N: J=0, C=1, E=2, P=3, M=4, T=5, Z=6
+        distancias, pais = self.g_p.BFS(['J', 'M'])
+        self.assertEqual(list(distancias), [0, 1, 2, 2, 0, 1, 2])
+        self.assertEqual(list(pais), [-1, 0, 1, 1, -1, 4, 5])
+
+        distancias, pais = self.g_p.BFS('C')
+        self.assertEqual(list(distancias), [-1, 0, 1, 1, 1, 1, 2])
+        self.assertEqual(list(pais), [-1, -1, 1, 1, 1, 1, 5])
+
+        distancias, _ = self.g_p.BFS('Z')
+        self.assertEqual(list(distancias), [-1, -1, -1, -1, -1, -1, 0])
+
+        self.g_p.adicionaAresta('a10', 'Z-J')
+        distancias, _ = self.g_p.BFS(['Z', 'T'])
+        self.assertEqual(list(distancias), [1, 2, 3, 3, 3, 0, 0])
+
+        self.assertRaises(VerticeInvalidoException, self.g_p.BFS, ['J', 'X'])
+
+    def test_busca_em_profundidade(self):
+        # Grafo acíclico: posições em N A=0, B=1, C=2, D=3, E=4
+        g = Grafo(['A', 'B', 'C', 'D', 'E'], {'a1':'A-B', 'a2':'A-C', 'a3':'B-D', 'a4':'C-D', 'a5':'A-D', 'a6':'E-C'})
+        busca = g.busca_em_profundidade()
+        self.assertEqual(list(busca.pre), [0, 1, 5, 2, 8])
+        self.assertEqual(list(busca.pos), [7, 4, 6, 3, 9])
+        self.assertEqual(list(busca.pai), [-1, 0, 0, 1, -1])
+        self.assertEqual(busca.arestas_do_tipo(BuscaEmProfundidade.ARVORE), ['a1', 'a2', 'a3'])
+        self.assertEqual(busca.arestas_do_tipo(BuscaEmProfundidade.AVANCO), ['a5'])
+        self.assertEqual(busca.arestas_do_tipo(BuscaEmProfundidade.CRUZAMENTO), ['a4', 'a6'])
+        self.assertEqual(g.arestas_de_retorno(), [])
+        self.assertFalse(g.ha_ciclo())
+        self.assertEqual(g.ordem_topologica(), ['E', 'A', 'C', 'B', 'D'])
+        self.assertIs(g.busca_em_profundidade(), busca)
+
+        # Uma aresta de volta para um ancestral fecha um ciclo
+        g.adicionaAresta('a7', 'D-A')
+        self.assertIsNot(g.busca_em_profundidade(), busca)
+        self.assertTrue(g.ha_ciclo())
+        self.assertEqual(g.arestas_de_retorno(), ['a7'])
+        self.assertIsNone(g.ordem_topologica())
+
+        # Um laço também é um ciclo
+        g = Grafo(['A', 'B'], {'a1':'A-B', 'a2':'B-B'})
+        self.assertTrue(g.ha_ciclo())
+        self.assertEqual(g.arestas_de_retorno(), ['a2'])
+
+        # Paraíba: as arestas paralelas C-E e C-P são de avanço, não de retorno
+        self.assertFalse(self.g_p.ha_ciclo())
+        self.assertEqual(self.g_p.busca_em_profundidade().arestas_do_tipo(BuscaEmProfundidade.AVANCO), ['a3', 'a5', 'a7'])
+        ordem = self.g_p.ordem_topologica()
+        for a in self.g_p.A.values():
+            v1, v2 = a.split('-')
+            self.assertLess(ordem.index(v1), ordem.index(v2))
+
+    def test_eh_completo(self):
+        self.assertFalse(self.g_p.eh_completo())
+        self.assertTrue(Grafo(['A', 'B']).eh_completo())
+        g = Grafo(['A', 'B', 'C'], {'a1':'A-B', 'a2':'C-B'})
+        self.assertFalse(g.eh_completo())
+        g.adicionaAresta('a3', 'A-C')
+        self.assertTrue(g.eh_completo())
+        g.adicionaAresta('a3', 'A-A')
+        self.assertFalse(g.eh_completo())
+        g.adicionaAresta('a3', 'C-A')
+        self.assertTrue(g.eh_completo())
+        g.adicionaVertice('D')
+        self.assertFalse(g.eh_completo())
+
+        # Alterações feitas diretamente em N e A são percebidas quando mudam os seus tamanhos
+        g.A['a4'] = 'D-A'
+        g.A['a5'] = 'D-B'
+        g.adicionaAresta('a6', 'D-C')
+        self.assertTrue(g.eh_completo())
+        del g.A['a1']
+        g.adicionaAresta('a7', 'B-B')
+        self.assertFalse(g.eh_completo())
+
+        # Compara com a contagem de todos os pares a cada inclusão
+        def completo(g):
+            n = len(g.N)
+            pares = {frozenset(a.split('-')) for a in g.A.values()}
+            return n <= 2 or (len(g.A) == n * (n - 1) // 2 and len({p for p in pares if len(p) == 2}) == len(g.A))
+
+        rng = random.Random(6)
+        for _ in range(100):
+            g = Grafo(['v0'])
+            for _ in range(20):
+                if rng.random() < 0.3:
+                    g.adicionaVertice('v' + str(len(g.N)))
+                else:
+                    g.adicionaAresta('a' + str(rng.randrange(8)), rng.choice(g.N) + '-' + rng.choice(g.N))
+                self.assertEqual(g.eh_completo(), completo(g))
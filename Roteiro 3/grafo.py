@@ -1,3 +1,7 @@
+import time
+from array import array
+
+
 class VerticeInvalidoException(Exception):
     pass
 
@@ -6,28 +10,266 @@ class ArestaInvalidaException(Exception):
     pass
 
 
+class IndiceAlcance:
+    '''
+    Índice de alcançabilidade de um grafo, montado uma vez para responder muitas perguntas "existe caminho de x até y?".
+    No caso não direcionado, basta comparar os rótulos dos componentes conexos. No caso direcionado, os vértices são
+    agrupados em componentes fortemente conexos (algoritmo de Tarjan) e as perguntas são respondidas sobre o grafo
+    acíclico desses componentes, com dois filtros O(1) antes de qualquer busca:
+    - a numeração de Tarjan é uma ordem topológica invertida, então um componente só alcança componentes de número menor;
+    - cada componente recebe o intervalo [pre, pos] de uma busca em profundidade sobre o grafo de componentes, e todo
+      componente com pre dentro desse intervalo é alcançável.
+    Só as perguntas que passam pelos dois filtros fazem uma busca, podada pelos mesmos critérios.
+    '''
+
+    def __init__(self, n, origens, destinos, direcionado):
+        '''
+        :param n: A quantidade de vértices, identificados de 0 a n - 1
+        :param origens: Os vértices de origem das arestas
+        :param destinos: Os vértices de destino das arestas
+        :param direcionado: Se False, as arestas valem nos dois sentidos
+        '''
+        self.direcionado = direcionado
+        if direcionado:
+            self.componente = self.__componentes_fortes(n, origens, destinos)
+        else:
+            self.componente = self.__componentes_conexos(n, origens, destinos)
+            return
+
+        # Grafo dos componentes, sem arestas repetidas e sem laços
+        c = max(self.componente) + 1 if n > 0 else 0
+        sucessores = [set() for _ in range(c)]
+        for k in range(len(origens)):
+            c1 = self.componente[origens[k]]
+            c2 = self.componente[destinos[k]]
+            if c1 != c2:
+                sucessores[c1].add(c2)
+        self.sucessores = [sorted(s, reverse=True) for s in sucessores]
+
+        # Intervalos de uma busca em profundidade começando pelos componentes de maior número (fontes primeiro)
+        self.pre = array('i', [-1]) * c
+        self.pos = array('i', [-1]) * c
+        tempo = 0
+        for raiz in range(c - 1, -1, -1):
+            if self.pre[raiz] != -1:
+                continue
+            self.pre[raiz] = tempo
+            pilha = [(raiz, iter(self.sucessores[raiz]))]
+            while pilha:
+                u, proximos = pilha[-1]
+                for w in proximos:
+                    if self.pre[w] == -1:
+                        tempo += 1
+                        self.pre[w] = tempo
+                        pilha.append((w, iter(self.sucessores[w])))
+                        break
+                else:
+                    self.pos[u] = tempo
+                    pilha.pop()
+            tempo += 1
+
+    @staticmethod
+    def __componentes_conexos(n, origens, destinos):
+        pai = list(range(n))
+        for k in range(len(origens)):
+            r1 = origens[k]
+            while pai[r1] != r1:
+                pai[r1] = pai[pai[r1]]
+                r1 = pai[r1]
+            r2 = destinos[k]
+            while pai[r2] != r2:
+                pai[r2] = pai[pai[r2]]
+                r2 = pai[r2]
+            pai[r1] = r2
+
+        rotulos = array('i', [-1]) * n
+        raizes = {}
+        for v in range(n):
+            r = v
+            while pai[r] != r:
+                r = pai[r]
+            if r not in raizes:
+                raizes[r] = len(raizes)
+            rotulos[v] = raizes[r]
+        return rotulos
+
+    @staticmethod
+    def __componentes_fortes(n, origens, destinos):
+        '''
+        Algoritmo de Tarjan iterativo. Os componentes são numerados na ordem em que terminam, então se o componente
+        c1 alcança o componente c2 != c1, c2 < c1.
+        '''
+        offsets = array('i', [0]) * (n + 1)
+        for o in origens:
+            offsets[o + 1] += 1
+        for i in range(n):
+            offsets[i + 1] += offsets[i]
+        alvos = array('i', [0]) * len(origens)
+        proximo = offsets[:n]
+        for k in range(len(origens)):
+            alvos[proximo[origens[k]]] = destinos[k]
+            proximo[origens[k]] += 1
+
+        indice = array('i', [-1]) * n
+        menor = array('i', [0]) * n
+        na_pilha = bytearray(n)
+        componente = array('i', [-1]) * n
+        pilha_tarjan = []
+        contador = 0
+        qtd_componentes = 0
+        proximo = offsets[:n]
+
+        for raiz in range(n):
+            if indice[raiz] != -1:
+                continue
+            indice[raiz] = menor[raiz] = contador
+            contador += 1
+            pilha_tarjan.append(raiz)
+            na_pilha[raiz] = 1
+            pilha = [raiz]
+            while pilha:
+                u = pilha[-1]
+                p = proximo[u]
+                if p < offsets[u + 1]:
+                    proximo[u] = p + 1
+                    w = alvos[p]
+                    if indice[w] == -1:
+                        indice[w] = menor[w] = contador
+                        contador += 1
+                        pilha_tarjan.append(w)
+                        na_pilha[w] = 1
+                        pilha.append(w)
+                    elif na_pilha[w] and indice[w] < menor[u]:
+                        menor[u] = indice[w]
+                    continue
+
+                pilha.pop()
+                if pilha and menor[u] < menor[pilha[-1]]:
+                    menor[pilha[-1]] = menor[u]
+                if menor[u] == indice[u]:
+                    while True:
+                        w = pilha_tarjan.pop()
+                        na_pilha[w] = 0
+                        componente[w] = qtd_componentes
+                        if w == u:
+                            break
+                    qtd_componentes += 1
+
+        return componente
+
+    def alcanca(self, i, j):
+        '''
+        :param i: O índice do vértice de origem
+        :param j: O índice do vértice de destino
+        :return: Um valor booleano que indica se existe caminho do vértice i até o vértice j
+        '''
+        c1 = self.componente[i]
+        c2 = self.componente[j]
+        if c1 == c2:
+            return True
+        if not self.direcionado or c2 > c1:
+            return False
+        if self.pre[c1] <= self.pre[c2] <= self.pos[c1]:
+            return True
+
+        # Busca podada: componentes de número menor que c2 não alcançam c2
+        alvo = self.pre[c2]
+        visitados = {c1}
+        pilha = [c1]
+        while pilha:
+            u = pilha.pop()
+            for w in self.sucessores[u]:
+                if w < c2:
+                    break
+                if w in visitados:
+                    continue
+                if self.pre[w] <= alvo <= self.pos[w]:
+                    return True
+                visitados.add(w)
+                pilha.append(w)
+        return False
+
+
+    def alcanca_lote(self, origens, destinos):
+        '''
+        Responde várias perguntas de uma vez. As que os filtros O(1) não decidem são agrupadas pelo componente de origem,
+        e cada componente de origem faz uma única busca, que serve para todos os seus destinos.
+        :param origens: Os índices dos vértices de origem
+        :param destinos: Os índices dos vértices de destino, na mesma ordem das origens
+        :return: Uma lista de valores booleanos, um por pergunta
+        '''
+        respostas = [False] * len(origens)
+        pendentes = {}
+        for k in range(len(origens)):
+            c1 = self.componente[origens[k]]
+            c2 = self.componente[destinos[k]]
+            if c1 == c2:
+                respostas[k] = True
+            elif not self.direcionado or c2 > c1:
+                continue
+            elif self.pre[c1] <= self.pre[c2] <= self.pos[c1]:
+                respostas[k] = True
+            else:
+                pendentes.setdefault(c1, []).append(k)
+
+        for c1, perguntas in pendentes.items():
+            # Nenhum caminho até o menor destino passa por componentes de número menor que ele
+            menor = min(self.componente[destinos[k]] for k in perguntas)
+            alcancados = {c1}
+            pilha = [c1]
+            while pilha:
+                u = pilha.pop()
+                for w in self.sucessores[u]:
+                    if w < menor:
+                        break
+                    if w not in alcancados:
+                        alcancados.add(w)
+                        pilha.append(w)
+            for k in perguntas:
+                respostas[k] = self.componente[destinos[k]] in alcancados
+
+        return respostas
+
 class Grafo:
     QTDE_MAX_SEPARADOR = 1
     SEPARADOR_ARESTA = '-'
 
-    def __init__(self, N=[], A={}):
+    def __init__(self, N=None, A=None):
         '''
         Constrói um objeto do tipo Grafo. Se nenhum parâmetro for passado, cria um Grafo vazio.
         Se houver alguma aresta ou algum vértice inválido, uma exceção é lançada.
         :param N: Uma lista dos vértices (ou nodos) do grafo.
         :param V: Uma dicionário que guarda as arestas do grafo. A chave representa o nome da aresta e o valor é uma string que contém dois vértices separados por um traço.
         '''
+
+        if N == None:
+            N = list()
+        if A == None:
+            A = dict()
+
         for v in N:
             if not (Grafo.verticeValido(v)):
                 raise VerticeInvalidoException('O vértice ' + v + ' é inválido')
 
-        self.N = N
+        self.N = list(N)
+
+        # Posição de cada vértice em N, que responde existeVertice() em O(1) e também indexa o union-find
+        self.__indexa_vertices()
 
         for a in A:
             if not (self.arestaValida(A[a])):
                 raise ArestaInvalidaException('A aresta ' + A[a] + ' é inválida')
 
-        self.A = A
+        self.A = dict(A)
+
+        # Lista de adjacência no formato CSR, montada sob demanda por __adjacencia(), e os índices de alcance sobre ela
+        self.__csr = None
+        self.__alcance = {}
+        self.__biconexao = None
+
+        # Estrutura union-find mantida a cada inserção, para responder conexo(), conectados() e existe_ciclo(),
+        # junto com os pares {X, Y} de vértices distintos ligados por alguma aresta, usados por eh_completo()
+        self.__reconstroi_conectividade()
 
     def arestaValida(self, aresta=''):
         '''
@@ -70,11 +312,16 @@ class Grafo:
 
     def existeVertice(self, vertice=''):
         '''
-        Verifica se um vértice passado como parâmetro pertence ao grafo.
+        Verifica se um vértice passado como parâmetro pertence ao grafo, pelo índice de vértices em O(1).
+        Se N foi alterado diretamente e o índice ficou com outro tamanho, a verificação é feita em N.
         :param vertice: O vértice que deve ser verificado.
         :return: Um valor booleano que indica se o vértice existe no grafo.
         '''
-        return Grafo.verticeValido(vertice) and self.N.count(vertice) > 0
+        if not Grafo.verticeValido(vertice):
+            return False
+        if len(self.__indice) == len(self.N):
+            return vertice in self.__indice
+        return vertice in self.N
 
     def existeAresta(self, aresta=''):
         '''
@@ -97,7 +344,15 @@ class Grafo:
         :raises: VerticeInvalidoException se o vértice passado como parâmetro não puder ser adicionado
         '''
         if self.verticeValido(v) and not self.existeVertice(v):
+            # Com o union-find em dia com N e A, basta incluir o vértice nele
+            self.__atualiza_conectividade()
             self.N.append(v)
+            self.__csr = None
+            self.__indice[v] = len(self.__pai_uf)
+            self.__pai_uf.append(len(self.__pai_uf))
+            self.__tamanho_uf.append(1)
+            self.__qtd_componentes += 1
+            self.__tamanhos_uf = (len(self.N), len(self.A))
         else:
             raise VerticeInvalidoException('O vértice ' + v + ' é inválido')
 
@@ -108,9 +363,21 @@ class Grafo:
         :raises: ArestaInvalidaException se a aresta passada como parâmetro não puder ser adicionada
         '''
         if self.arestaValida(a):
+            # Com o union-find em dia com N e A, basta unir os vértices da aresta nova
+            self.__atualiza_conectividade()
+            substitui = nome in self.A
             self.A[nome] = a
+            self.__csr = None
+            if substitui:
+                # Não há como retirar a aresta antiga do union-find; a estrutura é refeita na próxima consulta
+                self.__tamanhos_uf = None
+            else:
+                v1, v2 = a.split(self.SEPARADOR_ARESTA)
+                self.__une(v1, v2)
+                self.__inclui_par(v1, v2)
+                self.__tamanhos_uf = (len(self.N), len(self.A))
         else:
-            ArestaInvalidaException('A aresta ' + self.A[a] + ' é inválida')
+            raise ArestaInvalidaException('A aresta ' + a + ' é inválida')
 
     def vertices_nao_adjacentes(self):
         arestas = self.A.values()
@@ -164,32 +431,22 @@ class Grafo:
         return arestas_final
 
     def eh_completo(self):
-        arestas = list(self.A.values())
-
+        '''
+        Verifica se o grafo é completo: todo par de vértices distintos deve estar ligado por exatamente uma aresta,
+        sem laços. Usa os pares ligados guardados junto com o union-find, que é refeito nos mesmos casos que ele.
+        :return: Um valor booleano que indica se o grafo é completo
+        '''
         verticies = self.N
 
-        lista_completo = []
-
         if len(verticies) == 1:
             return True
         elif len(verticies) == 2:
             return True
 
-        for i in range(len(verticies)):
-            for j in range(i + 1, len(verticies)):
-                lista_completo.append("{}{}{}".format(verticies[i], self.SEPARADOR_ARESTA, verticies[j]))
+        self.__atualiza_conectividade()
 
-        if len(lista_completo) != len(arestas):
-            return False
-        else:
-            for i in range(len(lista_completo)):
-                v1, v2 = lista_completo[i].split("-")
-                if (lista_completo[i] not in arestas):
-                    if "{}{}{}".format(v2, self.SEPARADOR_ARESTA, v1) not in arestas:
-                        return False
-                    continue
-
-            return True
+        necessarias = len(verticies) * (len(verticies) - 1) // 2
+        return len(self.A) == necessarias and len(self.__pares) == necessarias
 
     def DFS(self, verticie, visitados):
 
@@ -202,34 +459,177 @@ class Grafo:
         return visitados
 
 
+    def __adjacencia(self):
+        '''
+        Monta (e guarda até a próxima alteração) a lista de adjacência não direcionada no formato CSR.
+        Os vértices são identificados pela posição em N e as arestas pela posição em A. Os vizinhos do vértice i estão em
+        vizinhos[offsets[i]:offsets[i + 1]] e as arestas correspondentes em arestas[...]. Um laço aparece uma única vez.
+        :return: Uma tupla (indices, nomes, offsets, vizinhos, arestas), onde indices associa cada vértice à sua posição
+        e nomes é a lista dos nomes das arestas
+        '''
+        if self.__csr is None or self.__csr[0] != (len(self.N), len(self.A)):
+            indices = {}
+            for i, v in enumerate(self.N):
+                indices[v] = i
+            n = len(self.N)
+
+            nomes = list(self.A)
+            origens = array('i')
+            destinos = array('i')
+            for a in nomes:
+                v1, v2 = self.A[a].split(self.SEPARADOR_ARESTA)
+                origens.append(indices[v1])
+                destinos.append(indices[v2])
+
+            offsets = array('i', [0]) * (n + 1)
+            for k in range(len(nomes)):
+                offsets[origens[k] + 1] += 1
+                if origens[k] != destinos[k]:
+                    offsets[destinos[k] + 1] += 1
+            for i in range(n):
+                offsets[i + 1] += offsets[i]
+
+            vizinhos = array('i', [0]) * offsets[n]
+            arestas = array('i', [0]) * offsets[n]
+            proximo = offsets[:n]
+            for k in range(len(nomes)):
+                o = origens[k]
+                d = destinos[k]
+                vizinhos[proximo[o]] = d
+                arestas[proximo[o]] = k
+                proximo[o] += 1
+                if o != d:
+                    vizinhos[proximo[d]] = o
+                    arestas[proximo[d]] = k
+                    proximo[d] += 1
+
+            self.__csr = ((len(self.N), len(self.A)), (indices, nomes, offsets, vizinhos, arestas))
+
+        return self.__csr[1]
+
     def ha_ciclo(self):
+        '''
+        Procura um ciclo com uma busca em profundidade iterativa, em O(V + E). Laços e arestas paralelas também formam
+        ciclos. Para apenas saber se existe um ciclo, existe_ciclo() é mais rápido.
+        :return: Uma lista com o ciclo encontrado, com os vértices intercalados com as arestas e começando e terminando
+        no mesmo vértice (ex.: ['A', 'a1', 'B', 'a2', 'C', 'a3', 'A']), ou False se o grafo não tiver ciclos
+        '''
+        indices, nomes, offsets, vizinhos, arestas = self.__adjacencia()
+        n = len(self.N)
+
+        # Para cada vértice descoberto, o vértice e a aresta pelos quais ele foi alcançado (-1 nas raízes)
+        pai = array('i', [-1]) * n
+        aresta_pai = array('i', [-1]) * n
+        descoberto = bytearray(n)
+        proximo = offsets[:n]
+
+        for raiz in range(n):
+            if descoberto[raiz]:
+                continue
+            descoberto[raiz] = 1
+            pilha = [raiz]
+            while pilha:
+                u = pilha[-1]
+                p = proximo[u]
+                if p == offsets[u + 1]:
+                    pilha.pop()
+                    continue
+                proximo[u] = p + 1
 
-        arestas = self.A
-        vertices = self.N
-        vertices_da_arestas = list(arestas.values())
-        # print(arestas)
+                w = vizinhos[p]
+                k = arestas[p]
+                if k == aresta_pai[u]:
+                    continue
+                if not descoberto[w]:
+                    descoberto[w] = 1
+                    pai[w] = u
+                    aresta_pai[w] = k
+                    pilha.append(w)
+                    continue
 
-        # print(vertices_da_arestas)
+                # Em uma busca em profundidade não direcionada, a primeira aresta fora da árvore liga u a um ancestral w
+                ciclo = [self.N[w], nomes[k], self.N[u]]
+                x = u
+                while x != w:
+                    ciclo.append(nomes[aresta_pai[x]])
+                    x = pai[x]
+                    ciclo.append(self.N[x])
+                return ciclo
 
-        for i in range(len(vertices)):
+        return False
 
-            possivel_ciclo = []
-            if (self.grau(vertices[i]) > 1):
-                verticiesPertencentes, arestasPertencentes = self.arestas_e_vertices_pertencentes(vertices[i], '',
-                                                                                                  possivel_ciclo)
+    def existe_ciclo(self):
+        '''
+        Verifica se o grafo tem algum ciclo. A resposta vem da estrutura union-find mantida a cada inserção:
+        há ciclo se alguma aresta ligou dois vértices que já estavam no mesmo componente.
+        :return: Um valor booleano que indica se há ciclo
+        '''
+        self.__atualiza_conectividade()
+        return self.__ciclo_uf
 
-                atual = len(possivel_ciclo)
-                for j in range(len(verticiesPertencentes)):
-                    for k in range(1, len(verticiesPertencentes)):
-                        self.analisar_caminho(vertices[i], verticiesPertencentes[j], verticiesPertencentes[k],
-                                              possivel_ciclo)
-                        if (len(set(possivel_ciclo)) > atual):
-                            return possivel_ciclo
-                        else:
-                            possivel_ciclo = []
+    def __reconstroi_conectividade(self):
+        '''
+        Refaz a estrutura union-find a partir de todos os vértices e arestas do grafo, em O(V + E).
+        '''
+        n = len(self.N)
+        if len(self.__indice) != n:
+            self.__indexa_vertices()
+        self.__pai_uf = array('i', range(n))
+        self.__tamanho_uf = array('i', [1]) * n
+        self.__qtd_componentes = n
+        self.__ciclo_uf = False
+        self.__pares = set()
 
-        return False
+        for a in self.A:
+            v1, v2 = self.A[a].split(self.SEPARADOR_ARESTA)
+            self.__une(v1, v2)
+            self.__inclui_par(v1, v2)
+
+        self.__tamanhos_uf = (len(self.N), len(self.A))
+
+    def __indexa_vertices(self):
+        self.__indice = {}
+        for i, v in enumerate(self.N):
+            self.__indice[v] = i
+
+    def __conectividade_valida(self):
+        '''
+        A estrutura union-find deixa de valer se uma aresta foi substituída ou se N e A foram alterados diretamente.
+        '''
+        return self.__tamanhos_uf == (len(self.N), len(self.A))
+
+    def __atualiza_conectividade(self):
+        if not self.__conectividade_valida():
+            self.__reconstroi_conectividade()
+
+    def __inclui_par(self, v1, v2):
+        if v1 != v2:
+            self.__pares.add((v1, v2) if v1 < v2 else (v2, v1))
 
+    def __encontra(self, i):
+        '''
+        Encontra o representante do conjunto do vértice de índice i, encurtando o caminho pela metade a cada passo.
+        '''
+        pai = self.__pai_uf
+        while pai[i] != i:
+            pai[i] = pai[pai[i]]
+            i = pai[i]
+        return i
+
+    def __une(self, v1, v2):
+        '''
+        Junta os conjuntos dos dois vértices de uma aresta, pendurando o menor no maior.
+        '''
+        r1 = self.__encontra(self.__indice[v1])
+        r2 = self.__encontra(self.__indice[v2])
+        if r1 == r2:
+            self.__ciclo_uf = True
+            return
+        if self.__tamanho_uf[r1] < self.__tamanho_uf[r2]:
+            r1, r2 = r2, r1
+        self.__pai_uf[r2] = r1
+        self.__tamanho_uf[r1] += self.__tamanho_uf[r2]
+        self.__qtd_componentes -= 1
 
     def arestas_e_vertices_pertencentes(self, x, raiz, possivel_ciclo):
         listaVertices = []
@@ -267,27 +667,84 @@ class Grafo:
 
 
 
-    def caminho(self,n):
-
-        n = n + 1
-        passados = []
-        verticies = self.N
-        for i in verticies:
-            passados.append(i)
-            self.vertices_pertencentes(i, passados)
-
-            if len(passados) > n:
-                subtrair = len(passados)- n
-                for j in range(subtrair):
-                    passados.pop()
-                    return " - ".join(passados)
-            elif len(passados) == n:
-                return " - ".join(passados)
-            passados = []
-
-
+    def caminho(self, n, tempo_limite=None):
+        '''
+        Procura um caminho simples (sem repetir vértices) com exatamente n arestas.
+        :param n: A quantidade de arestas do caminho
+        :param tempo_limite: Tempo máximo de busca, em segundos. Se for None, a busca não tem limite de tempo
+        :return: Um string com os vértices do caminho separados por " - ", ou False se não houver um caminho assim
+        ou se o tempo acabar antes de ele ser encontrado
+        '''
+        encontrado, vertices = self.busca_caminho(n, tempo_limite)
+        if encontrado:
+            return " - ".join(vertices)
         return False
 
+    def busca_caminho(self, n, tempo_limite=None):
+        '''
+        Procura um caminho simples com exatamente n arestas por uma busca em profundidade com retrocesso.
+        Os vértices já usados ficam em uma máscara de bits e cada estado (vértice atual, máscara) que não leva a um
+        caminho completo é memorizado, para nunca ser explorado de novo. Vértices de componentes com menos de n + 1
+        vértices nem são tentados como início. Não é color-coding nem uma programação dinâmica completa sobre as máscaras:
+        só os estados visitados são guardados, então o pior caso continua exponencial.
+        :param n: A quantidade de arestas do caminho
+        :param tempo_limite: Tempo máximo de busca, em segundos. Se acabar, a busca para e devolve o melhor caminho
+        parcial encontrado até então. Se for None, a busca não tem limite de tempo
+        :return: Uma tupla (encontrado, vertices). Se encontrado for True, vertices é a lista com os n + 1 vértices
+        do caminho; senão, é o maior caminho simples visto durante a busca
+        '''
+        indices, nomes, offsets, vizinhos, arestas = self.__adjacencia()
+        total = n + 1
+        if n < 0 or total > len(self.N):
+            return False, []
+
+        prazo = None if tempo_limite is None else time.perf_counter() + tempo_limite
+
+        rotulos = self.componentes()
+        tamanho_componente = {}
+        for r in rotulos:
+            tamanho_componente[r] = tamanho_componente.get(r, 0) + 1
+
+        falhas = set()
+        melhor = []
+        passos = 0
+        for inicio in range(len(self.N)):
+            if tamanho_componente[rotulos[inicio]] < total:
+                continue
+
+            caminho = [inicio]
+            mascara = 1 << inicio
+            if len(melhor) == 0:
+                melhor = [inicio]
+            if total == 1:
+                return True, [self.N[inicio]]
+
+            pilha = [iter(vizinhos[offsets[inicio]:offsets[inicio + 1]])]
+            while pilha:
+                passos += 1
+                if prazo is not None and passos % 1024 == 0 and time.perf_counter() > prazo:
+                    return False, [self.N[v] for v in melhor]
+
+                v = caminho[-1]
+                for w in pilha[-1]:
+                    bit = 1 << w
+                    if not mascara & bit and (w, mascara | bit) not in falhas:
+                        mascara |= bit
+                        caminho.append(w)
+                        if len(caminho) == total:
+                            return True, [self.N[u] for u in caminho]
+                        if len(caminho) > len(melhor):
+                            melhor = list(caminho)
+                        pilha.append(iter(vizinhos[offsets[w]:offsets[w + 1]]))
+                        break
+                else:
+                    # Nenhum vizinho completa o caminho a partir deste estado
+                    falhas.add((v, mascara))
+                    pilha.pop()
+                    caminho.pop()
+                    mascara ^= 1 << v
+
+        return False, [self.N[v] for v in melhor]
 
     def vertices_pertencentes(self, x, lista_passados):
         listaVertices = []
@@ -306,35 +763,136 @@ class Grafo:
 
 
 
-    def conexo(self):
-
-        vertices = self.N
-        inicial = vertices[0]
-
-        for x in range(1, len(vertices)):
-            l = []
-            if self.caminho_dois_vertices(inicial, vertices[x], l) == False:
-                return False
-
-        return True
+    def componentes(self):
+        '''
+        Rotula os vértices com o componente conexo a que pertencem, em uma única passada O(V + E) sobre a lista de
+        adjacência. Os componentes são numerados a partir de 0, na ordem em que o primeiro vértice de cada um aparece em N.
+        :return: Um array('i') em que a posição i tem o rótulo do componente do vértice N[i]
+        '''
+        indices, nomes, offsets, vizinhos, arestas = self.__adjacencia()
+        n = len(self.N)
+        rotulos = array('i', [-1]) * n
+
+        rotulo = 0
+        for raiz in range(n):
+            if rotulos[raiz] != -1:
+                continue
+            rotulos[raiz] = rotulo
+            fila = [raiz]
+            for u in fila:
+                for w in vizinhos[offsets[u]:offsets[u + 1]]:
+                    if rotulos[w] == -1:
+                        rotulos[w] = rotulo
+                        fila.append(w)
+            rotulo += 1
+
+        return rotulos
 
+    def conexo(self):
+        '''
+        Verifica se o grafo é conexo, ou seja, se todos os vértices estão no mesmo componente. O grafo vazio é conexo.
+        Usa a quantidade de componentes mantida pela estrutura union-find, então não percorre o grafo.
+        :return: Um valor booleano que indica se o grafo é conexo
+        '''
+        self.__atualiza_conectividade()
+        return self.__qtd_componentes <= 1
 
-    def caminho_dois_vertices(self, x, y, analizados):
+    def conectados(self, u, v):
+        '''
+        Verifica se existe um caminho entre dois vértices, consultando a estrutura union-find.
+        :param u: Um vértice do grafo
+        :param v: Outro vértice do grafo
+        :return: Um valor booleano que indica se u e v estão no mesmo componente
+        :raises: VerticeInvalidoException se algum dos vértices não existir no grafo
+        '''
+        self.__atualiza_conectividade()
+        for x in (u, v):
+            if x not in self.__indice:
+                raise VerticeInvalidoException('O vértice ' + str(x) + ' não existe no grafo')
+        return self.__encontra(self.__indice[u]) == self.__encontra(self.__indice[v])
 
-        analizados.append(x)
-        arestas = self.A.values()
-        a = x + self.SEPARADOR_ARESTA + y
-        if a in arestas or a[::-1] in arestas:
-            return True
+    def caminho_dois_vertices(self, x, y, analizados=None):
+        '''
+        Verifica se existe um caminho entre dois vértices, consultando a estrutura union-find mantida a cada inserção.
+        :param x: Um vértice do grafo
+        :param y: Outro vértice do grafo
+        :param analizados: Mantido por compatibilidade; não é mais usado
+        :return: Um valor booleano que indica se existe caminho entre x e y
+        :raises: VerticeInvalidoException se algum dos vértices não existir no grafo
+        '''
+        return self.conectados(x, y)
 
-        if self.grau(x) == 0 or self.grau(y) == 0:
-            return False
+    def indice_alcance(self, direcionado=False):
+        '''
+        Monta (e guarda até a próxima alteração do grafo) o índice de alcançabilidade, em O(V + E).
+        :param direcionado: Se True, uma aresta X-Y só pode ser percorrida de X para Y
+        :return: Um objeto IndiceAlcance
+        '''
+        adjacencia = self.__adjacencia()
+        guardado = self.__alcance.get(direcionado)
+        if guardado is None or guardado[0] is not adjacencia:
+            indices = adjacencia[0]
+            origens = array('i')
+            destinos = array('i')
+            for a in self.A:
+                v1, v2 = self.A[a].split(self.SEPARADOR_ARESTA)
+                origens.append(indices[v1])
+                destinos.append(indices[v2])
+            self.__alcance[direcionado] = (adjacencia, IndiceAlcance(len(self.N), origens, destinos, direcionado))
+        return self.__alcance[direcionado][1]
+
+    def __indices_pares(self, pares):
+        '''
+        Converte os pares de vértices para dois arrays com as posições em N das origens e dos destinos.
+        :raises: VerticeInvalidoException se algum par não tiver dois vértices ou se algum vértice não existir no grafo
+        '''
+        self.__atualiza_conectividade()
+        indices = self.__indice
+        origens = array('i')
+        destinos = array('i')
+        for par in pares:
+            vertices = par.split(self.SEPARADOR_ARESTA) if isinstance(par, str) else par
+            try:
+                x, y = vertices
+            except (TypeError, ValueError):
+                raise VerticeInvalidoException('O par ' + str(par) + ' não tem dois vértices')
+            for v in (x, y):
+                if not isinstance(v, str) or v not in indices:
+                    raise VerticeInvalidoException('O vértice ' + str(v) + ' não existe no grafo')
+            origens.append(indices[x])
+            destinos.append(indices[y])
+        return origens, destinos
+
+    def alcanca(self, x, y, direcionado=False):
+        '''
+        Verifica se existe um caminho de x até y. No caso não direcionado, consulta a estrutura union-find mantida a
+        cada inserção; no direcionado, usa o índice de alcance, refeito só depois de alguma alteração.
+        :param x: O vértice de origem
+        :param y: O vértice de destino
+        :param direcionado: Se True, uma aresta X-Y só pode ser percorrida de X para Y
+        :return: Um valor booleano que indica se y é alcançável a partir de x
+        :raises: VerticeInvalidoException se algum dos vértices não existir no grafo
+        '''
+        origens, destinos = self.__indices_pares([(x, y)])
+        if not direcionado:
+            return self.__encontra(origens[0]) == self.__encontra(destinos[0])
+        return self.indice_alcance(True).alcanca(origens[0], destinos[0])
 
-        lista_de_verticies_que_meu_x_esta_ligado = self.caminho_dois_vertices_aux(x, analizados)
-        for i in range(len(lista_de_verticies_que_meu_x_esta_ligado)):
-            if self.caminho_dois_vertices(lista_de_verticies_que_meu_x_esta_ligado[i], y, analizados):
-                return True
-        return False
+    def alcanca_lote(self, pares, direcionado=False):
+        '''
+        Responde de uma vez várias perguntas de alcançabilidade. Os pares são convertidos para posições uma única vez e
+        respondidos em bloco: pela estrutura union-find no caso não direcionado, ou por IndiceAlcance.alcanca_lote()
+        no direcionado, que faz uma busca por componente de origem em vez de uma por pergunta.
+        :param pares: Uma sequência de pares de vértices, no formato X-Y ou como tuplas (X, Y)
+        :param direcionado: Se True, uma aresta X-Y só pode ser percorrida de X para Y
+        :return: Uma lista de valores booleanos, um por par, indicando se o segundo vértice é alcançável a partir do primeiro
+        :raises: VerticeInvalidoException se algum par não tiver dois vértices ou se algum vértice não existir no grafo
+        '''
+        origens, destinos = self.__indices_pares(pares)
+        if not direcionado:
+            encontra = self.__encontra
+            return [encontra(origens[k]) == encontra(destinos[k]) for k in range(len(origens))]
+        return self.indice_alcance(True).alcanca_lote(origens, destinos)
 
     def caminho_dois_vertices_aux(self, x, analizados):
         L = []
@@ -348,6 +906,115 @@ class Grafo:
                     L.append(i)
         return L
 
+    def pontes(self):
+        '''
+        Fornece as pontes do grafo: as arestas cuja remoção aumenta a quantidade de componentes conexos.
+        :return: Uma lista com os nomes das pontes, na ordem de A
+        '''
+        return list(self.__calcula_biconexao()[0])
+
+    def pontos_de_articulacao(self):
+        '''
+        Fornece os pontos de articulação do grafo: os vértices cuja remoção aumenta a quantidade de componentes conexos.
+        :return: Uma lista com os vértices, na ordem de N
+        '''
+        return list(self.__calcula_biconexao()[1])
+
+    def componentes_biconexas(self):
+        '''
+        Separa as arestas do grafo em componentes biconexas: duas arestas ficam juntas se estão em um mesmo ciclo simples.
+        Uma ponte forma uma componente sozinha, assim como cada laço.
+        :return: Uma lista de componentes, cada uma com os nomes das suas arestas na ordem de A
+        '''
+        return [list(c) for c in self.__calcula_biconexao()[2]]
+
+    def __calcula_biconexao(self):
+        '''
+        Calcula pontes, pontos de articulação e componentes biconexas em uma única busca em profundidade iterativa
+        (algoritmo de Tarjan com low-link), em O(V + E). A aresta que leva ao pai é reconhecida pelo identificador,
+        então arestas paralelas contam como ciclos. O resultado é guardado até a próxima alteração do grafo.
+        :return: Uma tupla (pontes, pontos de articulação, componentes biconexas)
+        '''
+        indices, nomes, offsets, vizinhos, arestas = self.__adjacencia()
+        if self.__biconexao is not None and self.__biconexao[0] is offsets:
+            return self.__biconexao[1]
+
+        n = len(self.N)
+        indice = array('i', [-1]) * n
+        menor = array('i', [0]) * n
+        aresta_pai = array('i', [-1]) * n
+        articulacao = bytearray(n)
+        proximo = offsets[:n]
+        eh_ponte = bytearray(len(nomes))
+        componentes = []
+        pilha_arestas = []
+        tempo = 0
+
+        for raiz in range(n):
+            if indice[raiz] != -1:
+                continue
+            indice[raiz] = menor[raiz] = tempo
+            tempo += 1
+            filhos_raiz = 0
+            pilha = [raiz]
+
+            while pilha:
+                u = pilha[-1]
+                p = proximo[u]
+                if p < offsets[u + 1]:
+                    proximo[u] = p + 1
+                    w = vizinhos[p]
+                    k = arestas[p]
+                    if k == aresta_pai[u]:
+                        continue
+                    if w == u:
+                        componentes.append([k])
+                    elif indice[w] == -1:
+                        if u == raiz:
+                            filhos_raiz += 1
+                        aresta_pai[w] = k
+                        indice[w] = menor[w] = tempo
+                        tempo += 1
+                        pilha_arestas.append(k)
+                        pilha.append(w)
+                    elif indice[w] < indice[u]:
+                        # Aresta de retorno para um ancestral. Vista do lado do ancestral, ela é ignorada
+                        if indice[w] < menor[u]:
+                            menor[u] = indice[w]
+                        pilha_arestas.append(k)
+                    continue
+
+                pilha.pop()
+                if not pilha:
+                    break
+                pai = pilha[-1]
+                if menor[u] < menor[pai]:
+                    menor[pai] = menor[u]
+
+                if menor[u] >= indice[pai]:
+                    # Nenhum vértice abaixo de u volta para cima de pai: as arestas empilhadas desde (pai, u) formam uma
+                    # componente biconexa, e pai separa u do resto do grafo
+                    componente = []
+                    while True:
+                        k = pilha_arestas.pop()
+                        componente.append(k)
+                        if k == aresta_pai[u]:
+                            break
+                    componentes.append(componente)
+                    if pai != raiz:
+                        articulacao[pai] = 1
+                    if menor[u] > indice[pai]:
+                        eh_ponte[aresta_pai[u]] = 1
+
+            if filhos_raiz > 1:
+                articulacao[raiz] = 1
+
+        pontes = [nomes[k] for k in range(len(nomes)) if eh_ponte[k]]
+        pontos = [self.N[v] for v in range(n) if articulacao[v]]
+        componentes = [[nomes[k] for k in sorted(c)] for c in componentes]
+        self.__biconexao = (offsets, (pontes, pontos, componentes))
+        return self.__biconexao[1]
+
     def __str__(self):
         '''
         Fornece uma representação do tipo String do grafo.
@@ -0,0 +1,362 @@
+import itertools
+import random
+import unittest
+from grafo import *
+
+
+def grafo_aleatorio(rng, n, m):
+    '''
+    Sorteia um multigrafo com n vértices e m arestas, que pode ter laços e arestas paralelas.
+    '''
+    vertices = ['v' + str(i) for i in range(n)]
+    arestas = {}
+    for k in range(m):
+        arestas['a' + str(k)] = rng.choice(vertices) + '-' + rng.choice(vertices)
+    return Grafo(vertices, arestas)
+
+
+def componentes_por_forca_bruta(g):
+    '''
+    Conjunto de vértices de cada componente, achado com uma busca simples sobre A.
+    '''
+    restantes = set(g.N)
+    componentes = []
+    while restantes:
+        componente = {restantes.pop()}
+        mudou = True
+        while mudou:
+            mudou = False
+            for a in g.A.values():
+                v1, v2 = a.split('-')
+                if (v1 in componente) != (v2 in componente):
+                    componente.update((v1, v2))
+                    mudou = True
+        restantes -= componente
+        componentes.append(componente)
+    return componentes
+
+
+class TestGrafo(unittest.TestCase):
+
+    def setUp(self):
+        # Grafo da Paraíba
+        self.g_p = Grafo(['J', 'C', 'E', 'P', 'M', 'T', 'Z'], {'a1':'J-C', 'a2':'C-E', 'a3':'C-E', 'a4':'C-P', 'a5':'C-P', 'a6':'C-M', 'a7':'C-T', 'a8':'M-T', 'a9':'T-Z'})
+
+        # Árvore e grafo com dois componentes
+        self.g_arvore = Grafo(['A', 'B', 'C', 'D', 'E'], {'a1':'A-B', 'a2':'B-C', 'a3':'B-D', 'a4':'D-E'})
+        self.g_desconexo = Grafo(['A', 'B', 'C', 'D', 'E'], {'a1':'A-B', 'a2':'C-D', 'a3':'D-E', 'a4':'E-C'})
+
+        # Grafos com laço
+        self.g_l1 = Grafo(['A', 'B', 'C', 'D'], {'a1':'A-A', 'a2':'B-A', 'a3':'A-A'})
+        self.g_l4 = Grafo(['D'], {'a2':'D-D'})
+
+    def test_conectividade_incremental(self):
+        reconstroi = Grafo._Grafo__reconstroi_conectividade
+        chamadas = [0]
+
+        def conta(grafo):
+            chamadas[0] += 1
+            reconstroi(grafo)
+
+        Grafo._Grafo__reconstroi_conectividade = conta
+        try:
+            # O construtor monta a estrutura uma única vez, já com as arestas
+            g = Grafo(['v0', 'v1'], {'a': 'v0-v1'})
+            self.assertEqual(chamadas[0], 1)
+
+            g = Grafo(['v0'])
+            chamadas[0] = 0
+            for i in range(1, 200):
+                g.adicionaVertice('v' + str(i))
+                self.assertFalse(g.conexo())
+                g.adicionaAresta('a' + str(i), 'v' + str(i - 1) + '-v' + str(i))
+                self.assertTrue(g.conexo())
+                self.assertTrue(g.conectados('v0', 'v' + str(i)))
+                self.assertTrue(g.caminho_dois_vertices('v' + str(i), 'v0'))
+                self.assertFalse(g.existe_ciclo())
+            self.assertEqual(chamadas[0], 0)
+
+            g.adicionaAresta('a0', 'v199-v0')
+            self.assertTrue(g.existe_ciclo())
+            self.assertEqual(chamadas[0], 0)
+
+            # Substituir uma aresta obriga a refazer a estrutura uma única vez
+            g.adicionaAresta('a0', 'v0-v1')
+            self.assertEqual(chamadas[0], 0)
+
+            # Verificar se um vértice existe não refaz a estrutura
+            self.assertTrue(g.existeVertice('v5'))
+            self.assertFalse(g.existeVertice('v200'))
+            self.assertEqual(chamadas[0], 0)
+            self.assertTrue(g.existe_ciclo())
+            self.assertTrue(g.existe_ciclo())
+            self.assertEqual(chamadas[0], 1)
+        finally:
+            Grafo._Grafo__reconstroi_conectividade = reconstroi
+
+    def test_adiciona_invalidos(self):
+        self.assertRaises(ArestaInvalidaException, self.g_p.adicionaAresta, 'a10', 'J-X')
+        self.assertRaises(VerticeInvalidoException, self.g_p.adicionaVertice, 'J')
+        self.assertRaises(VerticeInvalidoException, self.g_p.conectados, 'J', 'X')
+        self.assertNotIn('a10', self.g_p.A)
+
+        # Alterações feitas diretamente em N e A são percebidas quando mudam os seus tamanhos
+        self.g_arvore.N.append('F')
+        self.assertTrue(self.g_arvore.existeVertice('F'))
+        self.assertFalse(self.g_arvore.conexo())
+        self.g_arvore.A['a5'] = 'F-A'
+        self.assertTrue(self.g_arvore.conexo())
+
+    def verifica_ciclo(self, g, ciclo):
+        # Vértices e arestas intercalados, começando e terminando no mesmo vértice, sem repetir arestas nem vértices
+        self.assertEqual(ciclo[0], ciclo[-1])
+        self.assertEqual(len(ciclo) % 2, 1)
+        vertices = ciclo[0:-1:2]
+        arestas = ciclo[1::2]
+        self.assertEqual(len(set(vertices)), len(vertices))
+        self.assertEqual(len(set(arestas)), len(arestas))
+        for k in range(len(arestas)):
+            self.assertEqual(sorted(g.A[arestas[k]].split('-')), sorted([ciclo[2 * k], ciclo[2 * k + 2]]))
+
+    def test_ha_ciclo(self):
+        self.assertFalse(self.g_arvore.ha_ciclo())
+        self.assertFalse(self.g_arvore.existe_ciclo())
+        self.assertEqual(self.g_desconexo.ha_ciclo(), ['C', 'a4', 'E', 'a3', 'D', 'a2', 'C'])
+        self.assertTrue(self.g_desconexo.existe_ciclo())
+
+        # Arestas paralelas e laços formam ciclos
+        ciclo = self.g_p.ha_ciclo()
+        self.verifica_ciclo(self.g_p, ciclo)
+        self.assertEqual(len(ciclo), 5)
+        self.assertEqual(self.g_l4.ha_ciclo(), ['D', 'a2', 'D'])
+        self.assertTrue(self.g_l1.existe_ciclo())
+        self.assertFalse(Grafo().ha_ciclo())
+
+        # Um multigrafo é acíclico se e somente se tem V - (quantidade de componentes) arestas
+        rng = random.Random(14)
+        for _ in range(300):
+            g = grafo_aleatorio(rng, rng.randint(1, 8), rng.randint(0, 9))
+            aciclico = len(g.A) == len(g.N) - len(componentes_por_forca_bruta(g))
+            ciclo = g.ha_ciclo()
+            self.assertEqual(ciclo is False, aciclico)
+            self.assertEqual(g.existe_ciclo(), not aciclico)
+            if ciclo:
+                self.verifica_ciclo(g, ciclo)
+
+    def test_componentes(self):
+        self.assertEqual(list(self.g_desconexo.componentes()), [0, 0, 1, 1, 1])
+        self.assertFalse(self.g_desconexo.conexo())
+        self.assertEqual(list(self.g_l1.componentes()), [0, 0, 1, 2])
+        self.assertEqual(list(self.g_p.componentes()), [0] * 7)
+        self.assertTrue(self.g_p.conexo())
+        self.assertTrue(Grafo().conexo())
+
+        rng = random.Random(15)
+        for _ in range(300):
+            g = grafo_aleatorio(rng, rng.randint(1, 8), rng.randint(0, 8))
+            esperado = componentes_por_forca_bruta(g)
+            rotulos = g.componentes()
+            obtido = {}
+            for i in range(len(g.N)):
+                obtido.setdefault(rotulos[i], set()).add(g.N[i])
+            self.assertEqual(sorted(obtido), list(range(len(esperado))))
+            self.assertEqual(sorted(map(sorted, obtido.values())), sorted(map(sorted, esperado)))
+            self.assertEqual(g.conexo(), len(esperado) == 1)
+            for v in g.N:
+                for w in g.N:
+                    self.assertEqual(g.conectados(v, w), rotulos[g.N.index(v)] == rotulos[g.N.index(w)])
+
+    def test_caminho(self):
+        self.assertEqual(self.g_arvore.caminho(3), 'A - B - D - E')
+        self.assertFalse(self.g_arvore.caminho(4))
+        self.assertEqual(self.g_p.caminho(0), 'J')
+        self.assertFalse(self.g_p.caminho(-1))
+        self.assertFalse(self.g_l4.caminho(1))
+
+        # Nenhum componente tem vértices suficientes, então nenhum início é tentado
+        self.assertEqual(self.g_desconexo.busca_caminho(3), (False, []))
+        self.assertEqual(self.g_desconexo.busca_caminho(2, tempo_limite=10), (True, ['C', 'D', 'E']))
+
+        # Compara com todas as sequências de vértices distintos, em grafos pequenos
+        rng = random.Random(18)
+        for _ in range(200):
+            g = grafo_aleatorio(rng, rng.randint(1, 6), rng.randint(0, 8))
+            pares = set()
+            for a in g.A.values():
+                v1, v2 = a.split('-')
+                pares.update(((v1, v2), (v2, v1)))
+            for n in range(len(g.N) + 1):
+                existe = any(all((p[k], p[k + 1]) in pares for k in range(n))
+                             for p in itertools.permutations(g.N, n + 1))
+                encontrado, vertices = g.busca_caminho(n)
+                self.assertEqual(encontrado, existe)
+                if encontrado:
+                    self.assertEqual(len(set(vertices)), n + 1)
+                    for k in range(n):
+                        self.assertIn((vertices[k], vertices[k + 1]), pares)
+
+    def test_alcanca(self):
+        self.assertTrue(self.g_p.alcanca('Z', 'J'))
+        self.assertFalse(self.g_p.alcanca('Z', 'J', direcionado=True))
+        self.assertTrue(self.g_p.alcanca('J', 'Z', direcionado=True))
+        self.assertEqual(self.g_desconexo.alcanca_lote(['A-B', ('A', 'C'), 'E-C', 'C-C']), [True, False, True, True])
+        self.assertEqual(self.g_desconexo.alcanca_lote(['A-B', 'B-A', 'E-C', 'C-E', 'C-C'], direcionado=True),
+                         [True, False, True, True, True])
+        self.assertEqual(self.g_p.alcanca_lote([]), [])
+
+        for pares in (['J-C-E'], ['JC'], [('J',)], ['J-X'], [('J', 3)], [5]):
+            self.assertRaises(VerticeInvalidoException, self.g_p.alcanca_lote, pares)
+            self.assertRaises(VerticeInvalidoException, self.g_p.alcanca_lote, pares, True)
+
+        # Compara com uma busca por força bruta nos dois sentidos
+        rng = random.Random(19)
+        for _ in range(300):
+            g = grafo_aleatorio(rng, rng.randint(1, 8), rng.randint(0, 10))
+            for direcionado in (False, True):
+                alcancaveis = {v: {v} for v in g.N}
+                mudou = True
+                while mudou:
+                    mudou = False
+                    for a in g.A.values():
+                        v1, v2 = a.split('-')
+                        for x, y in ((v1, v2), (v2, v1)) if not direcionado else ((v1, v2),):
+                            for v in g.N:
+                                if x in alcancaveis[v] and y not in alcancaveis[v]:
+                                    alcancaveis[v].add(y)
+                                    mudou = True
+                pares = [(v, w) for v in g.N for w in g.N]
+                rng.shuffle(pares)
+                esperado = [w in alcancaveis[v] for v, w in pares]
+                self.assertEqual(g.alcanca_lote(pares, direcionado), esperado)
+                self.assertEqual([g.alcanca(v, w, direcionado) for v, w in pares], esperado)
+
+    def test_alcanca_sem_indice(self):
+        # No caso não direcionado, perguntas entre inserções não montam o índice de alcance
+        construtor = IndiceAlcance.__init__
+        chamadas = [0]
+
+        def conta(indice, *args):
+            chamadas[0] += 1
+            construtor(indice, *args)
+
+        IndiceAlcance.__init__ = conta
+        try:
+            g = Grafo(['v0'])
+            for i in range(1, 100):
+                g.adicionaVertice('v' + str(i))
+                g.adicionaAresta('a' + str(i), 'v' + str(i - 1) + '-v' + str(i))
+                self.assertTrue(g.alcanca('v' + str(i), 'v0'))
+                self.assertEqual(g.alcanca_lote(['v0-v' + str(i)]), [True])
+            self.assertEqual(chamadas[0], 0)
+
+            # No caso direcionado, o índice é montado uma vez e reaproveitado até a próxima alteração
+            self.assertEqual(g.alcanca_lote(['v0-v99', 'v99-v0'], True), [True, False])
+            self.assertFalse(g.alcanca('v50', 'v10', True))
+            self.assertEqual(chamadas[0], 1)
+        finally:
+            IndiceAlcance.__init__ = construtor
+
+    def test_biconexao(self):
+        self.assertEqual(self.g_arvore.pontes(), ['a1', 'a2', 'a3', 'a4'])
+        self.assertEqual(self.g_arvore.pontos_de_articulacao(), ['B', 'D'])
+        self.assertEqual(self.g_p.pontes(), ['a1', 'a9'])
+        self.assertEqual(self.g_p.pontos_de_articulacao(), ['C', 'T'])
+        self.assertEqual(sorted(self.g_p.componentes_biconexas()),
+                         [['a1'], ['a2', 'a3'], ['a4', 'a5'], ['a6', 'a7', 'a8'], ['a9']])
+        self.assertEqual(sorted(self.g_l1.componentes_biconexas()), [['a1'], ['a2'], ['a3']])
+        self.assertEqual(self.g_l1.pontes(), ['a2'])
+
+        # Compara com a definição: remover uma ponte ou um ponto de articulação aumenta a quantidade de componentes,
+        # e duas arestas ficam na mesma componente biconexa se nenhum vértice sozinho as separa
+        def rotulos(N, arestas):
+            g = Grafo(N, arestas)
+            return dict(zip(N, g.componentes()))
+
+        rng = random.Random(20)
+        for _ in range(300):
+            g = grafo_aleatorio(rng, rng.randint(1, 7), rng.randint(0, 9))
+            quantidade = len(set(g.componentes()))
+
+            pontes = []
+            for a in g.A:
+                resto = {b: g.A[b] for b in g.A if b != a}
+                if len(set(rotulos(g.N, resto).values())) > quantidade:
+                    pontes.append(a)
+            self.assertEqual(g.pontes(), pontes)
+
+            todos = rotulos(g.N, g.A)
+            articulacoes = []
+            separados = {}
+            for w in g.N:
+                N = [v for v in g.N if v != w]
+                resto = {b: g.A[b] for b in g.A if w not in g.A[b].split('-')}
+                r = rotulos(N, resto)
+                # Um vértice sozinho no seu componente leva o componente junto quando é removido
+                sozinho = list(todos.values()).count(todos[w]) == 1
+                if len(set(r.values())) > quantidade - sozinho:
+                    articulacoes.append(w)
+                separados[w] = r
+            self.assertEqual(g.pontos_de_articulacao(), articulacoes)
+
+            arestas = list(g.A)
+
+            def juntas(a, b):
+                pa = g.A[a].split('-')
+                pb = g.A[b].split('-')
+                if pa[0] == pa[1] or pb[0] == pb[1] or todos[pa[0]] != todos[pb[0]]:
+                    return False
+                for w, r in separados.items():
+                    ra = {r[v] for v in pa if v != w}
+                    rb = {r[v] for v in pb if v != w}
+                    if not ra & rb:
+                        return False
+                return True
+
+            esperado = []
+            for a in arestas:
+                for c in esperado:
+                    if juntas(c[0], a):
+                        c.append(a)
+                        break
+                else:
+                    esperado.append([a])
+            self.assertEqual(sorted(g.componentes_biconexas()), sorted(esperado))
+
+    def test_eh_completo(self):
+        self.assertFalse(self.g_p.eh_completo())
+        self.assertTrue(Grafo(['A', 'B']).eh_completo())
+        g = Grafo(['A', 'B', 'C'], {'a1':'A-B', 'a2':'C-B'})
+        self.assertFalse(g.eh_completo())
+        g.adicionaAresta('a3', 'A-C')
+        self.assertTrue(g.eh_completo())
+        g.adicionaAresta('a3', 'A-A')
+        self.assertFalse(g.eh_completo())
+        g.adicionaAresta('a3', 'C-A')
+        self.assertTrue(g.eh_completo())
+        g.adicionaVertice('D')
+        self.assertFalse(g.eh_completo())
+
+        # Alterações feitas diretamente em N e A são percebidas quando mudam os seus tamanhos
+        g.A['a4'] = 'D-A'
+        g.A['a5'] = 'D-B'
+        g.adicionaAresta('a6', 'D-C')
+        self.assertTrue(g.eh_completo())
+        del g.A['a1']
+        g.adicionaAresta('a7', 'B-B')
+        self.assertFalse(g.eh_completo())
+
+        # Compara com a contagem de todos os pares a cada inclusão
+        def completo(g):
+            n = len(g.N)
+            pares = {frozenset(a.split('-')) for a in g.A.values()}
+            return n <= 2 or (len(g.A) == n * (n - 1) // 2 and len({p for p in pares if len(p) == 2}) == len(g.A))
+
+        rng = random.Random(6)
+        for _ in range(100):
+            g = Grafo(['v0'])
+            for _ in range(20):
+                if rng.random() < 0.3:
+                    g.adicionaVertice('v' + str(len(g.N)))
+                else:
+                    g.adicionaAresta('a' + str(rng.randrange(8)), rng.choice(g.N) + '-' + rng.choice(g.N))
+                self.assertEqual(g.eh_completo(), completo(g))
@@ -0,0 +1,257 @@
+# -*- coding: utf-8 -*-
+from grafo_adj_nao_dir import Grafo, VerticeInvalidoException, ArestaInvalidaException
+
+
+class GrafoBits:
+    '''
+    Grafo simples não direcionado (sem arestas paralelas) guardado como uma matriz de adjacência de bits.
+    Cada vértice tem uma linha, que é um inteiro do Python: o bit j da linha i indica se i e j são adjacentes.
+    A matriz é simétrica e um laço é o bit i da linha i. Com um bit por par, um grafo denso de 50 mil vértices
+    ocupa cerca de 300 MB. O grau é a contagem de bits da linha, a adjacência é um teste de bit e os vizinhos
+    comuns de dois vértices saem de um E entre as duas linhas.
+    '''
+
+    QTDE_MAX_SEPARADOR = 1
+    SEPARADOR_ARESTA = '-'
+
+    def __init__(self, V=None):
+        '''
+        Constrói um grafo sem arestas.
+        :param V: Uma lista dos vértices do grafo
+        :raises: VerticeInvalidoException se algum vértice for inválido ou repetido
+        '''
+        self.N = []
+        self.__indices = {}
+        self.__linhas = []
+        for v in (V if V is not None else []):
+            self.adicionaVertice(v)
+
+    @classmethod
+    def de_grafo(cls, grafo):
+        '''
+        Constrói um GrafoBits com os mesmos vértices e arestas de um Grafo com matriz de adjacência.
+        :param grafo: Um Grafo sem arestas paralelas
+        :return: O GrafoBits equivalente
+        :raises: ArestaInvalidaException se o grafo tiver arestas paralelas
+        '''
+        if grafo.ha_paralelas():
+            raise ArestaInvalidaException('O grafo tem arestas paralelas')
+
+        g = cls(grafo.N)
+        M = grafo.M
+        for i in range(len(M)):
+            for j in range(i, len(M)):
+                if M[i][j]:
+                    g.__liga(i, j)
+        return g
+
+    @classmethod
+    def verticeValido(cls, vertice: str):
+        '''
+        Verifica se um vértice passado como parâmetro está dentro do padrão estabelecido.
+        :param vertice: Um string que representa o vértice a ser analisado.
+        :return: Um valor booleano que indica se o vértice está no formato correto.
+        '''
+        return Grafo.verticeValido(vertice)
+
+    def existeVertice(self, vertice: str):
+        '''
+        :param vertice: O vértice que deve ser verificado.
+        :return: Um valor booleano que indica se o vértice existe no grafo.
+        '''
+        return vertice in self.__indices
+
+    def __par(self, a):
+        '''
+        Dada uma aresta no formato X-Y, retorna os índices de X e de Y, ou None se a aresta for inválida.
+        '''
+        partes = a.split(self.SEPARADOR_ARESTA)
+        if len(partes) != self.QTDE_MAX_SEPARADOR + 1:
+            return None
+        i = self.__indices.get(partes[0])
+        j = self.__indices.get(partes[1])
+        if i is None or j is None:
+            return None
+        return i, j
+
+    def arestaValida(self, aresta=''):
+        '''
+        Verifica se a aresta está no formato X-Y e liga dois vértices existentes no grafo.
+        :param aresta: A aresta que se quer verificar
+        :return: Um valor booleano que indica se a aresta é válida
+        '''
+        return self.__par(aresta) is not None
+
+    def existeAresta(self, a: str):
+        '''
+        Verifica em O(1) se uma aresta pertence ao grafo.
+        :param a: A aresta a ser verificada
+        :return: Um valor booleano que indica se a aresta existe no grafo
+        '''
+        par = self.__par(a)
+        return par is not None and (self.__linhas[par[0]] >> par[1]) & 1 == 1
+
+    def adicionaVertice(self, v):
+        '''
+        Inclui um vértice no grafo, em O(1): a nova linha é o inteiro 0 e as outras linhas não mudam.
+        :param v: O vértice a ser incluído no grafo
+        :raises: VerticeInvalidoException se o vértice já existe ou se ele não estiver no formato válido
+        '''
+        if v in self.__indices:
+            raise VerticeInvalidoException('O vértice {} já existe'.format(v))
+        if not self.verticeValido(v):
+            raise VerticeInvalidoException('O vértice ' + v + ' é inválido')
+
+        self.__indices[v] = len(self.N)
+        self.N.append(v)
+        self.__linhas.append(0)
+
+    def __liga(self, i, j):
+        self.__linhas[i] |= 1 << j
+        self.__linhas[j] |= 1 << i
+
+    def adicionaAresta(self, a):
+        '''
+        Adiciona uma aresta no formato X-Y.
+        :param a: A aresta a ser adicionada
+        :raises: ArestaInvalidaException se a aresta for inválida ou se ela já existir, já que o grafo é simples
+        '''
+        par = self.__par(a)
+        if par is None:
+            raise ArestaInvalidaException('A aresta {} é inválida'.format(a))
+        if (self.__linhas[par[0]] >> par[1]) & 1:
+            raise ArestaInvalidaException('A aresta {} já existe e o grafo não aceita arestas paralelas'.format(a))
+        self.__liga(par[0], par[1])
+
+    def remove_aresta(self, a):
+        '''
+        Remove uma aresta no formato X-Y, se ela existir.
+        :param a: A aresta a ser removida
+        :raises: ArestaInvalidaException se a aresta for inválida
+        '''
+        par = self.__par(a)
+        if par is None:
+            raise ArestaInvalidaException('A aresta {} é inválida'.format(a))
+        i, j = par
+        self.__linhas[i] &= ~(1 << j)
+        self.__linhas[j] &= ~(1 << i)
+
+    @staticmethod
+    def __bits(x):
+        '''
+        Gera as posições dos bits ligados de x, da menor para a maior.
+        '''
+        while x:
+            menor = x & -x
+            yield menor.bit_length() - 1
+            x ^= menor
+
+    def linha(self, vertice):
+        '''
+        :param vertice: Um vértice do grafo
+        :return: O inteiro cujo bit j indica se o vértice é adjacente a N[j]
+        '''
+        return self.__linhas[self.__indices[vertice]]
+
+    def vizinhos(self, vertice):
+        '''
+        :param vertice: Um vértice do grafo
+        :return: Uma lista com os vértices adjacentes, na ordem de N
+        '''
+        return [self.N[j] for j in self.__bits(self.linha(vertice))]
+
+    def vizinhos_comuns(self, v1, v2):
+        '''
+        Fornece os vértices adjacentes aos dois vértices ao mesmo tempo, com um único E entre as duas linhas.
+        :return: Uma lista com os vértices, na ordem de N
+        '''
+        return [self.N[j] for j in self.__bits(self.linha(v1) & self.linha(v2))]
+
+    def quantidade_vizinhos_comuns(self, v1, v2):
+        '''
+        :return: A quantidade de vértices adjacentes aos dois vértices, sem montar a lista
+        '''
+        return bin(self.linha(v1) & self.linha(v2)).count('1')
+
+    def grau(self, vertice):
+        '''
+        Fornece o grau do vértice contando os bits da sua linha. Um laço conta uma única vez.
+        :param vertice: O vértice
+        :return: A quantidade de arestas que incidem sobre o vértice
+        '''
+        return bin(self.linha(vertice)).count('1')
+
+    def ha_laco(self):
+        for i in range(len(self.__linhas)):
+            if (self.__linhas[i] >> i) & 1:
+                return True
+        return False
+
+    def ha_paralelas(self):
+        '''
+        O grafo é simples, então nunca há arestas paralelas.
+        '''
+        return False
+
+    def eh_completo(self):
+        '''
+        Verifica se cada linha tem todos os bits ligados, com exceção talvez do bit do próprio vértice.
+        :return: Um valor booleano que indica se o grafo é completo
+        '''
+        todos = (1 << len(self.N)) - 1
+        for i in range(len(self.__linhas)):
+            if self.__linhas[i] | (1 << i) != todos:
+                return False
+        return True
+
+    def arestas_sobre_vertice(self, vertice):
+        '''
+        Fornece as arestas que incidem sobre o vértice, no formato X-Y com X antes de Y em N.
+        :param vertice: O vértice
+        :return: Uma lista com as arestas
+        '''
+        i = self.__indices[vertice]
+        lista = []
+        for j in self.__bits(self.__linhas[i]):
+            if j >= i:
+                lista.append(self.N[i] + self.SEPARADOR_ARESTA + self.N[j])
+            else:
+                lista.append(self.N[j] + self.SEPARADOR_ARESTA + self.N[i])
+        return lista
+
+    def iter_nao_adjacentes(self):
+        '''
+        Gera os pares X-Y de vértices não adjacentes, olhando a diagonal e a parte acima dela, na mesma ordem do Grafo.
+        '''
+        todos = (1 << len(self.N)) - 1
+        for i in range(len(self.__linhas)):
+            prefixo = self.N[i] + self.SEPARADOR_ARESTA
+            # Bits desligados da linha, a partir da coluna i
+            livres = (~self.__linhas[i] & todos) >> i << i
+            for j in self.__bits(livres):
+                yield prefixo + self.N[j]
+
+    def vertices_nao_adjacentes(self):
+        '''
+        :return: Uma lista com os pares X-Y de vértices não adjacentes
+        '''
+        return list(self.iter_nao_adjacentes())
+
+    def __str__(self):
+        '''
+        Fornece uma representação do tipo String do grafo, no mesmo formato do Grafo com matriz de adjacência.
+        :return: Uma string que representa o grafo
+        '''
+        maior_vertice = max([len(v) for v in self.N] + [0])
+        grafo_str = ' ' * maior_vertice + ' ' + ' '.join(self.N) + '\n'
+
+        for i in range(len(self.N)):
+            grafo_str += self.N[i] + ' '
+            for j in range(len(self.N)):
+                if j < i:
+                    grafo_str += '- '
+                else:
+                    grafo_str += str((self.__linhas[i] >> j) & 1) + ' '
+            grafo_str += '\n'
+
+        return grafo_str
@@ -1,4 +1,6 @@
 # -*- coding: utf-8 -*-
+import operator
+from array import array
 
 class VerticeInvalidoException(Exception):
     pass
@@ -12,23 +14,149 @@ class MatrizInvalidaException(Exception):
     pass
 
 
+def _conectividade_offline(n, intervalos, consultas):
+    '''
+    Responde consultas de conectividade sobre um conjunto de arestas que muda com o tempo, sem refazer a busca a cada
+    mudança. O tempo é medido em consultas: a consulta k acontece no instante k. Cada intervalo de vida de uma aresta
+    é pendurado nos O(log q) nós de uma árvore de segmentos sobre o tempo que o cobrem. Um percurso pela árvore une as
+    arestas de cada nó em uma estrutura union-find com desfazer (união por tamanho, sem compressão de caminho) e
+    desfaz as uniões ao sair do nó, então cada folha vê exatamente as arestas vivas no seu instante.
+    :param n: A quantidade de vértices, identificados de 0 a n - 1
+    :param intervalos: Tuplas (inicio, fim, i, j): a aresta entre i e j existe nos instantes inicio <= k < fim
+    :param consultas: Para cada instante, uma tupla (i, j) para perguntar se i e j estão ligados,
+    ou None para perguntar se o grafo inteiro é conexo
+    :return: Uma lista de valores booleanos com a resposta de cada consulta
+    '''
+    q = len(consultas)
+    respostas = [False] * q
+    if q == 0:
+        return respostas
+
+    tamanho_arvore = 1
+    while tamanho_arvore < q:
+        tamanho_arvore *= 2
+
+    # Arestas de cada nó da árvore de segmentos (o nó 1 é a raiz e as folhas começam em tamanho_arvore)
+    arestas_no = {}
+    for inicio, fim, i, j in intervalos:
+        esquerda = inicio + tamanho_arvore
+        direita = fim + tamanho_arvore
+        while esquerda < direita:
+            if esquerda & 1:
+                arestas_no.setdefault(esquerda, []).append((i, j))
+                esquerda += 1
+            if direita & 1:
+                direita -= 1
+                arestas_no.setdefault(direita, []).append((i, j))
+            esquerda //= 2
+            direita //= 2
+
+    pai = list(range(n))
+    tamanho = [1] * n
+    componentes = n
+    historico = []
+
+    def raiz(v):
+        while pai[v] != v:
+            v = pai[v]
+        return v
+
+    # Cada entrada da pilha é (nó, primeiro instante do nó, quantidade de instantes do nó, marca). A marca é -1 na
+    # entrada do nó e, na saída, a quantidade de uniões que existiam antes de entrar nele, para desfazer as demais.
+    pilha = [(1, 0, tamanho_arvore, -1)]
+    while pilha:
+        no, inicio, largura, marca = pilha.pop()
+
+        if marca >= 0:
+            while len(historico) > marca:
+                r1, r2 = historico.pop()
+                pai[r2] = r2
+                tamanho[r1] -= tamanho[r2]
+                componentes += 1
+            continue
+
+        marca = len(historico)
+        for i, j in arestas_no.get(no, ()):
+            r1 = raiz(i)
+            r2 = raiz(j)
+            if r1 != r2:
+                if tamanho[r1] < tamanho[r2]:
+                    r1, r2 = r2, r1
+                pai[r2] = r1
+                tamanho[r1] += tamanho[r2]
+                componentes -= 1
+                historico.append((r1, r2))
+
+        pilha.append((no, inicio, largura, marca))
+        if largura == 1:
+            consulta = consultas[inicio]
+            if consulta is None:
+                respostas[inicio] = componentes <= 1
+            else:
+                respostas[inicio] = raiz(consulta[0]) == raiz(consulta[1])
+        else:
+            metade = largura // 2
+            # Instantes depois da última consulta não precisam ser visitados
+            if inicio + metade < q:
+                pilha.append((2 * no + 1, inicio + metade, metade, -1))
+            pilha.append((2 * no, inicio, metade, -1))
+
+    return respostas
+
+
+class Complemento:
+    '''
+    Visão dos pares de vértices não adjacentes de um Grafo, calculada sob demanda.
+    Nenhuma lista é montada: a iteração gera os pares um a um, a pertinência é respondida em O(1)
+    e o tamanho vem de um contador mantido pelo próprio Grafo. A visão acompanha as alterações feitas no grafo.
+    '''
+
+    def __init__(self, grafo):
+        self.__grafo = grafo
+
+    def __iter__(self):
+        return self.__grafo.iter_nao_adjacentes()
+
+    def __contains__(self, par):
+        '''
+        :param par: Um par de vértices, no formato X-Y ou como uma tupla (X, Y)
+        '''
+        if isinstance(par, str):
+            par = par.split(Grafo.SEPARADOR_ARESTA)
+            if len(par) != Grafo.QTDE_MAX_SEPARADOR + 1:
+                return False
+        return self.__grafo.sao_nao_adjacentes(par[0], par[1])
+
+    def __len__(self):
+        return self.__grafo.quantidade_nao_adjacentes()
+
+
 class Grafo:
     QTDE_MAX_SEPARADOR = 1
     SEPARADOR_ARESTA = '-'
+    # Códigos de formato de buffer (módulo struct) dos tipos inteiros
+    FORMATOS_INTEIROS = ('b', 'B', 'h', 'H', 'i', 'I', 'l', 'L', 'q', 'Q', 'n', 'N')
     __maior_vertice = 0
 
     def __init__(self, V=None, M=None):
         '''
         Constrói um objeto do tipo Grafo. Se nenhum parâmetro for passado, cria um Grafo vazio.
         Se houver alguma aresta ou algum vértice inválido, uma exceção é lançada.
+        Os nomes dos vértices são validados uma única vez e a matriz só passa por verificações de formato feitas
+        linha a linha sobre fatias, então construir o grafo custa O(V²) operações de C em vez de O(V³) em Python.
         :param V: Uma lista dos vértices (ou nodos) do grafo.
-        :param V: Uma matriz de adjacência que guarda as arestas do grafo. Cada entrada da matriz tem um inteiro que indica a quantidade de arestas que ligam aqueles vértices
+        :param M: A matriz de adjacência que guarda as arestas do grafo. Cada entrada da matriz tem um inteiro que indica a quantidade de arestas que ligam aqueles vértices. Pode ser:
+          uma lista de linhas, com '-' abaixo da diagonal principal, como em M;
+          um array('i') com as V² entradas da matriz simétrica, linha após linha, que passa a ser usado pelo grafo sem cópia;
+          qualquer outro objeto com o protocolo de buffer (memoryview, bytes, array do NumPy) de inteiros, com V² entradas
+          ou com formato V x V, que é copiado de uma vez para um array('i').
+        :raises: VerticeInvalidoException se algum vértice for inválido
+        :raises: MatrizInvalidaException se a matriz não tiver o tamanho correto, não for simétrica ou tiver entradas que
+        não são inteiros não negativos
         '''
 
         if V == None:
             V = list()
-        if M == None:
-            M = list()
 
         for v in V:
             if not (Grafo.verticeValido(v)):
@@ -38,36 +166,153 @@ class Grafo:
 
         self.N = list(V)
 
-        if M == []:
-            for k in range(len(V)):
-                M.append(list())
-                for l in range(len(V)):
-                    if k > l:
-                        M[k].append('-')
-                    else:
-                        M[k].append(0)
+        # Posição de cada vértice na lista de vértices
+        self.__indices = {}
+        for i in range(len(self.N)):
+            self.__indices.setdefault(self.N[i], i)
+
+        # A matriz é guardada em um único array de inteiros, linha após linha, e simétrica: a quantidade de arestas
+        # entre i e j fica tanto em (i, j) quanto em (j, i). Assim cada linha tem o grau completo do vértice e as
+        # consultas viram operações sobre fatias do array, sem testar '-' nem converter células uma a uma.
+        # Cada linha tem espaço para __capacidade vértices; as células além dos vértices existentes ficam zeradas e
+        # só são ocupadas por vértices novos, então a matriz só é recopiada quando a capacidade dobra.
+        n = len(self.N)
+        self.__capacidade = n
+        if M is None or (isinstance(M, list) and M == []):
+            self.__matriz = array('i', [0]) * (n * n)
+        elif isinstance(M, (list, tuple)):
+            self.__matriz = self.__matriz_de_linhas(M, n)
+        else:
+            self.__matriz = self.__matriz_de_buffer(M, n)
 
-        if len(M) != len(V):
+        # Quantidade de células sem arestas na diagonal e acima dela, ou seja, de pares não adjacentes.
+        # Pela simetria, cada par fora da diagonal aparece duas vezes entre os zeros da matriz inteira.
+        self.__qtd_nao_adjacentes = (self.__zeros() + self.__diagonal().count(0)) // 2
+
+    @staticmethod
+    def __matriz_de_linhas(M, n):
+        '''
+        Converte uma matriz no formato de lista de linhas, com '-' abaixo da diagonal, para o array simétrico.
+        Cada linha é verificada e copiada com operações sobre fatias inteiras.
+        :raises: MatrizInvalidaException se a matriz não tiver o formato correto
+        '''
+        if len(M) != n:
             raise MatrizInvalidaException('A matriz passada como parâmetro não tem o tamanho correto')
 
-        for c in M:
-            if len(c) != len(V):
+        matriz = array('i', [0]) * (n * n)
+        for i in range(n):
+            linha = M[i]
+            if len(linha) != n:
                 raise MatrizInvalidaException('A matriz passada como parâmetro não tem o tamanho correto')
+            # Abaixo da diagonal principal só pode haver '-', o que indica que a matriz é não direcionada
+            if list(linha[:i]) != ['-'] * i:
+                raise MatrizInvalidaException('A matriz não representa uma matriz não direcionada')
+            try:
+                acima = array('i', linha[i:])
+            except (TypeError, OverflowError):
+                raise MatrizInvalidaException('A linha {} da matriz tem entradas que não são inteiros'.format(i))
+
+            matriz[i * n + i:(i + 1) * n] = acima
+            matriz[(i + 1) * n + i::n] = acima[1:]  # a mesma linha vira a coluna, abaixo da diagonal
+
+        if len(matriz) > 0 and min(matriz) < 0:
+            raise MatrizInvalidaException('A matriz tem quantidades negativas de arestas')
+        return matriz
+
+    @staticmethod
+    def __matriz_de_buffer(M, n):
+        '''
+        Obtém o array simétrico a partir de um objeto com o protocolo de buffer. Um array('i') é usado como está;
+        outros buffers são copiados de uma vez. A simetria é verificada comparando cada linha com a coluna
+        correspondente, ambas como fatias do array.
+        :raises: MatrizInvalidaException se o buffer não tiver o formato correto
+        '''
+        if isinstance(M, array) and M.typecode == 'i':
+            matriz = M
+        else:
+            try:
+                buffer = memoryview(M)
+            except TypeError:
+                raise MatrizInvalidaException('A matriz passada como parâmetro não é uma lista de linhas nem um buffer')
+
+            if buffer.ndim == 2:
+                if buffer.shape != (n, n):
+                    raise MatrizInvalidaException('A matriz passada como parâmetro não tem o tamanho correto')
+                if not buffer.c_contiguous:
+                    raise MatrizInvalidaException('A matriz passada como parâmetro não está contígua na memória')
+                buffer = buffer.cast('B').cast(buffer.format.lstrip('@=<>!'))
+            elif buffer.ndim != 1:
+                raise MatrizInvalidaException('A matriz passada como parâmetro não tem o tamanho correto')
+
+            if buffer.format.lstrip('@') == 'i' and buffer.c_contiguous:
+                matriz = array('i')
+                matriz.frombytes(buffer.cast('B'))
+            else:
+                try:
+                    matriz = array('i', buffer.tolist())
+                except (TypeError, OverflowError, NotImplementedError):
+                    raise MatrizInvalidaException('A matriz passada como parâmetro não é uma matriz de inteiros')
+
+        if len(matriz) != n * n:
+            raise MatrizInvalidaException('A matriz passada como parâmetro não tem o tamanho correto')
+        for i in range(n):
+            if matriz[i * n:(i + 1) * n] != matriz[i::n]:
+                raise MatrizInvalidaException('A matriz não representa uma matriz não direcionada')
+        if len(matriz) > 0 and min(matriz) < 0:
+            raise MatrizInvalidaException('A matriz tem quantidades negativas de arestas')
+        return matriz
+
+    @property
+    def M(self):
+        '''
+        A matriz de adjacência no formato original: uma lista de linhas com a quantidade de arestas de cada par na
+        diagonal e acima dela e '-' abaixo. A lista é montada a cada acesso, então alterá-la não altera o grafo.
+        '''
+        n = len(self.N)
+        c = self.__capacidade
+        matriz = []
+        for i in range(n):
+            matriz.append(['-'] * i + self.__matriz[i * c + i:i * c + n].tolist())
+        return matriz
+
+    def __linha(self, i):
+        '''
+        :return: Um array com a quantidade de arestas entre o vértice de índice i e cada um dos vértices
+        '''
+        c = self.__capacidade
+        return self.__matriz[i * c:i * c + len(self.N)]
 
-        for i in range(len(V)):
-            for j in range(len(V)):
-                '''
-                Verifica se os índices passados como parâmetro representam um elemento da matriz abaixo da diagonal principal.
-                Além disso, verifica se o referido elemento é um traço "-". Isso indica que a matriz é não direcionada e foi construída corretamente.
-                '''
-                if i > j and not (M[i][j] == '-'):
-                    raise MatrizInvalidaException('A matriz não representa uma matriz não direcionada')
+    def __diagonal(self):
+        '''
+        :return: Um array com a quantidade de laços de cada vértice
+        '''
+        return self.__matriz[:len(self.N) * (self.__capacidade + 1):self.__capacidade + 1]
 
-                aresta = V[i] + Grafo.SEPARADOR_ARESTA + V[j]
-                if not (self.arestaValida(aresta)):
-                    raise ArestaInvalidaException('A aresta ' + aresta + ' é inválida')
+    def __zeros(self):
+        '''
+        :return: A quantidade de células zeradas entre os vértices existentes, sem contar a capacidade livre
+        '''
+        n = len(self.N)
+        return self.__matriz.count(0) - (len(self.__matriz) - n * n)
 
-        self.M = list(M)
+    def __reserva(self, n):
+        '''
+        Garante espaço para n vértices, dobrando a capacidade quantas vezes for preciso e copiando cada linha
+        existente para o começo da sua nova posição. Incluir vértices um a um custa O(V²) amortizado no total.
+        :param n: A quantidade de vértices que a matriz deve comportar
+        '''
+        antiga = self.__capacidade
+        if n <= antiga:
+            return
+        c = max(antiga, 1)
+        while c < n:
+            c *= 2
+
+        matriz = array('i', [0]) * (c * c)
+        for i in range(len(self.N)):
+            matriz[i * c:i * c + len(self.N)] = self.__matriz[i * antiga:i * antiga + len(self.N)]
+        self.__matriz = matriz
+        self.__capacidade = c
 
     def arestaValida(self, aresta=''):
         '''
@@ -113,7 +358,7 @@ class Grafo:
         :param vertice: O vértice que deve ser verificado.
         :return: Um valor booleano que indica se o vértice existe no grafo.
         '''
-        return Grafo.verticeValido(vertice) and self.N.count(vertice) > 0
+        return Grafo.verticeValido(vertice) and vertice in self.__indices
 
     def __primeiro_vertice_aresta(self, a: str):
         '''
@@ -137,7 +382,7 @@ class Grafo:
         :param a: A aresta a ser analisada
         :return: O índice do primeiro vértice da aresta na lista de vértices
         '''
-        return self.N.index(self.__primeiro_vertice_aresta(a))
+        return self.__indices[self.__primeiro_vertice_aresta(a)]
 
     def __indice_segundo_vertice_aresta(self, a: str):
         '''
@@ -145,22 +390,95 @@ class Grafo:
         :param a: A aresta a ser analisada
         :return: O índice do segundo vértice da aresta na lista de vértices
         '''
-        return self.N.index(self.__segundo_vertice_aresta(a))
+        return self.__indices[self.__segundo_vertice_aresta(a)]
 
     def existeAresta(self, a: str):
         '''
-        Verifica se uma aresta passada como parâmetro pertence ao grafo.
-        :param aresta: A aresta a ser verificada
+        Verifica em O(1) se uma aresta passada como parâmetro pertence ao grafo, consultando o índice de cada vértice
+        no dicionário de índices e a célula correspondente da matriz.
+        :param a: A aresta a ser verificada
         :return: Um valor booleano que indica se a aresta existe no grafo.
         '''
-        existe = False
-        if Grafo.arestaValida(self, a):
-            for i in range(len(self.M)):
-                for j in range(len(self.M)):
-                    if self.M[self.__indice_primeiro_vertice_aresta(a)][self.__indice_segundo_vertice_aresta(a)]:
-                        existe = True
+        partes = a.split(Grafo.SEPARADOR_ARESTA)
+        if len(partes) != Grafo.QTDE_MAX_SEPARADOR + 1:
+            return False
+        i = self.__indices.get(partes[0])
+        j = self.__indices.get(partes[1])
+        if i is None or j is None:
+            return False
+        return self.__matriz[i * self.__capacidade + j] > 0
+
+    def existem_arestas(self, pares, destinos=None):
+        '''
+        Verifica de uma vez se várias arestas pertencem ao grafo. Os vértices são convertidos para índices e cada
+        consulta vira a leitura de uma célula da matriz, sem montar nem separar strings para cada aresta.
+        Vértices que não existem no grafo dão False, como em existeAresta.
+        Exemplos: existem_arestas(['A-B', ('B', 'C')]) ou existem_arestas(array('i', [0, 1]), array('i', [1, 2])).
+        :param pares: Uma sequência de arestas, no formato X-Y ou como tuplas (X, Y). Se destinos for passado,
+        uma sequência com as origens das arestas, pelo nome do vértice ou pelo seu índice em N
+        :param destinos: Uma sequência, do mesmo tamanho de pares, com os destinos das arestas
+        :return: Uma lista de valores booleanos, um para cada aresta
+        :raises: ValueError se pares e destinos não tiverem o mesmo tamanho
+        '''
+        if destinos is None:
+            origens, destinos = self.__pares_de_extremidades(pares)
+        else:
+            if len(pares) != len(destinos):
+                raise ValueError('As origens e os destinos não têm o mesmo tamanho')
+            origens = self.__extremidades(pares)
+            destinos = self.__extremidades(destinos)
 
-        return existe
+        matriz = self.__matriz
+        c = self.__capacidade
+        return [i >= 0 and j >= 0 and matriz[i * c + j] > 0 for i, j in zip(origens, destinos)]
+
+    def __extremidades(self, extremidades):
+        '''
+        Converte uma sequência de extremidades de arestas, dadas pelo nome do vértice ou pelo seu índice em N,
+        para uma lista de índices, com -1 nas extremidades que não existem no grafo.
+        Qualquer buffer de inteiros (array, memoryview, array do NumPy) é convertido de uma vez e verificado pelo
+        menor e pelo maior elemento. Nas demais sequências, um índice pode ser qualquer inteiro, inclusive os
+        escalares do NumPy, que não são subclasses de int.
+        '''
+        n = len(self.N)
+        try:
+            buffer = memoryview(extremidades)
+        except TypeError:
+            buffer = None
+        if buffer is not None and buffer.ndim == 1 and buffer.format.lstrip('@=<>!') in Grafo.FORMATOS_INTEIROS:
+            ids = buffer.tolist()
+            if len(ids) == 0 or (min(ids) >= 0 and max(ids) < n):
+                return ids
+            return [i if 0 <= i < n else -1 for i in ids]
+
+        indices = self.__indices
+        ids = []
+        for x in extremidades:
+            if isinstance(x, str):
+                ids.append(indices.get(x, -1))
+                continue
+            try:
+                i = operator.index(x)
+            except TypeError:
+                i = -1
+            ids.append(i if 0 <= i < n else -1)
+        return ids
+
+    def __pares_de_extremidades(self, pares):
+        '''
+        Separa uma sequência de arestas, no formato X-Y ou como tuplas (X, Y), em uma lista com os índices das
+        origens e outra com os índices dos destinos, com -1 nos vértices que não existem no grafo.
+        '''
+        origens = []
+        destinos = []
+        for par in pares:
+            if isinstance(par, str):
+                par = par.split(Grafo.SEPARADOR_ARESTA)
+                if len(par) != Grafo.QTDE_MAX_SEPARADOR + 1:
+                    par = (-1, -1)
+            origens.append(par[0])
+            destinos.append(par[1])
+        return self.__extremidades(origens), self.__extremidades(destinos)
 
     def adicionaVertice(self, v):
         '''
@@ -168,24 +486,31 @@ class Grafo:
         :param v: O vértice a ser incluído no grafo.
         :raises VerticeInvalidoException se o vértice já existe ou se ele não estiver no formato válido.
         '''
-        if v in self.N:
-            raise VerticeInvalidoException('O vértice {} já existe'.format(v))
+        self.adiciona_vertices([v])
+
+    def adiciona_vertices(self, vertices):
+        '''
+        Inclui vários vértices de uma vez, reservando o espaço da matriz uma única vez.
+        Nenhum vértice é incluído se algum deles for inválido.
+        :param vertices: Um iterável com os vértices a serem incluídos no grafo.
+        :raises VerticeInvalidoException se algum vértice já existe, aparece repetido ou não está no formato válido.
+        '''
+        novos = list(vertices)
+        vistos = set()
+        for v in novos:
+            if v in self.__indices or v in vistos:
+                raise VerticeInvalidoException('O vértice {} já existe'.format(v))
+            if not self.verticeValido(v):
+                raise VerticeInvalidoException('O vértice ' + v + ' é inválido')
+            vistos.add(v)
 
-        if self.verticeValido(v):
+        self.__reserva(len(self.N) + len(novos))
+        for v in novos:
             if len(v) > self.__maior_vertice:
                 self.__maior_vertice = len(v)
-
+            self.__indices[v] = len(self.N)
             self.N.append(v)  # Adiciona vértice na lista de vértices
-            self.M.append([])  # Adiciona a linha
-
-            for k in range(len(self.N)):
-                if k != len(self.N) - 1:
-                    self.M[k].append(0)  # adiciona os elementos da coluna do vértice
-                    self.M[self.N.index(v)].append('-')  # adiciona os elementos da linha do vértice
-                else:
-                    self.M[self.N.index(v)].append(0)  # adiciona um zero no último elemento da linha
-        else:
-            raise VerticeInvalidoException('O vértice ' + v + ' é inválido')
+            self.__qtd_nao_adjacentes += len(self.N)  # A nova coluna só tem zeros na diagonal e acima dela
 
     def adicionaAresta(self, a):
         '''
@@ -196,10 +521,12 @@ class Grafo:
         if self.arestaValida(a):
             i_a1 = self.__indice_primeiro_vertice_aresta(a)
             i_a2 = self.__indice_segundo_vertice_aresta(a)
-            if i_a1 < i_a2:
-                self.M[i_a1][i_a2] += 1
-            else:
-                self.M[i_a2][i_a1] += 1
+            c = self.__capacidade
+            if self.__matriz[i_a1 * c + i_a2] == 0:
+                self.__qtd_nao_adjacentes -= 1
+            self.__matriz[i_a1 * c + i_a2] += 1
+            if i_a1 != i_a2:
+                self.__matriz[i_a2 * c + i_a1] += 1
         else:
             raise ArestaInvalidaException('A aresta {} é inválida'.format(a))
 
@@ -213,85 +540,183 @@ class Grafo:
             if self.existeAresta(a):
                 i_a1 = self.__indice_primeiro_vertice_aresta(a)
                 i_a2 = self.__indice_segundo_vertice_aresta(a)
-                if i_a1 < i_a2:
-                    self.M[i_a1][i_a2] -= 1
-                else:
-                    self.M[i_a2][i_a1] -= 1
+                c = self.__capacidade
+                self.__matriz[i_a1 * c + i_a2] -= 1
+                if i_a1 != i_a2:
+                    self.__matriz[i_a2 * c + i_a1] -= 1
+                if self.__matriz[i_a1 * c + i_a2] == 0:
+                    self.__qtd_nao_adjacentes += 1
         else:
             raise ArestaInvalidaException('A aresta {} é inválida'.format(a))
 
     def vertices_nao_adjacentes(self):
-        resultado = []
-        verticies = self.N
-        for i in range(len(self.M)):
-            for j in range(i, len(self.M[i])):
-                if int(self.M[i][j]) == 0:
-                     resultado.append(verticies[i] + self.SEPARADOR_ARESTA + verticies[j])
-        return resultado
-
-
-    def ha_laco(self):
-        for i in range(len(self.M)):
-                if int(self.M[i][i]) >= 1:
-                    return True
-        return False
+        '''
+        Fornece os pares X-Y de vértices não adjacentes, olhando a diagonal e a parte acima dela.
+        Para grafos grandes prefira complemento(), que não monta a lista.
+        :return: Uma lista com os pares no formato X-Y
+        '''
+        return list(self.iter_nao_adjacentes())
 
+    def iter_nao_adjacentes(self):
+        '''
+        Gera, um a um, os pares X-Y de vértices não adjacentes, na mesma ordem de vertices_nao_adjacentes().
+        '''
+        verticies = self.N
+        for i in range(len(verticies)):
+            linha = self.__linha(i)
+            prefixo = verticies[i] + self.SEPARADOR_ARESTA
+            # index() procura o próximo zero da linha sem passar célula por célula em Python
+            j = i
+            while True:
+                try:
+                    j = linha.index(0, j)
+                except ValueError:
+                    break
+                yield prefixo + verticies[j]
+                j += 1
+
+    def sao_nao_adjacentes(self, v1, v2):
+        '''
+        Verifica em O(1) se dois vértices do grafo não são ligados por nenhuma aresta.
+        :param v1: O primeiro vértice
+        :param v2: O segundo vértice
+        :return: Um valor booleano; False se algum dos vértices não existir no grafo
+        '''
+        i = self.__indices.get(v1)
+        j = self.__indices.get(v2)
+        if i is None or j is None:
+            return False
+        return self.__matriz[i * self.__capacidade + j] == 0
 
-    def ha_paralelas(self):
+    def quantidade_nao_adjacentes(self):
+        '''
+        Fornece em O(1) a quantidade de pares de vértices não adjacentes, sem montar a lista.
+        :return: O tamanho que vertices_nao_adjacentes() teria
+        '''
+        return self.__qtd_nao_adjacentes
 
-        for i in range(len(self.M)):
-            for j in range(i, len(self.M[i])):
-                if int(self.M[i][j]) > 1:
-                    return True
-        return False
+    def complemento(self):
+        '''
+        Fornece uma visão preguiçosa dos pares de vértices não adjacentes.
+        :return: Um Complemento ligado a este grafo
+        '''
+        return Complemento(self)
 
 
+    def ha_laco(self):
+        '''
+        Verifica se há algum laço olhando apenas a diagonal da matriz.
+        :return: Um valor booleano que indica se há laço
+        '''
+        return any(self.__diagonal())
 
+    def ha_paralelas(self):
+        '''
+        Verifica se algum par de vértices é ligado por mais de uma aresta.
+        :return: Um valor booleano que indica se há arestas paralelas
+        '''
+        return len(self.__matriz) > 0 and max(self.__matriz) > 1
 
     def grau(self, vertice):
+        '''
+        Fornece o grau do vértice, somando a sua linha da matriz. Cada laço conta uma única vez.
+        :param vertice: O vértice
+        :return: A quantidade de arestas que incidem sobre o vértice
+        '''
+        return sum(self.__linha(self.__indices.get(vertice, 0)))
 
-        index = 0
-        for i in range(len(self.N)):
-            if self.N[i] == vertice:
-                index = i
-                break
-
-        grau = 0
-        for i in range(len(self.M[index])):
-            if self.M[index][i] == self.SEPARADOR_ARESTA:
-                grau += int(self.M[i][index])
-            else:
-                grau += int(self.M[index][i])
-
-        return grau
     def arestas_sobre_vertice(self, vertice):
-
+        '''
+        Fornece as arestas que incidem sobre o vértice, uma por vértice adjacente, no formato X-Y com X antes de Y em N.
+        :param vertice: O vértice
+        :return: Uma lista com as arestas
+        '''
         vertices = self.N
-        index = 0
-        for i in range(len(self.N)):
-            if self.N[i] == vertice:
-                index = i
-                break
+        index = self.__indices.get(vertice, 0)
 
-        lista =[]
-        for i in range(len(self.M[index])):
-            if self.M[index][i] != self.SEPARADOR_ARESTA and self.M[index][i] > 0:
-                lista.append(vertices[index]+self.SEPARADOR_ARESTA+vertices[i])
-            elif self.M[index][i] == self.SEPARADOR_ARESTA and self.M[i][index] > 0:
-                lista.append(vertices[i] + self.SEPARADOR_ARESTA + vertices[index])
+        lista = []
+        for i, quantidade in enumerate(self.__linha(index)):
+            if quantidade > 0:
+                if i >= index:
+                    lista.append(vertices[index] + self.SEPARADOR_ARESTA + vertices[i])
+                else:
+                    lista.append(vertices[i] + self.SEPARADOR_ARESTA + vertices[index])
 
         return lista
 
+    def eh_completo(self):
+        '''
+        Verifica se todo par de vértices distintos é ligado por uma aresta, ou seja, se os únicos zeros da matriz
+        estão na diagonal.
+        :return: Um valor booleano que indica se o grafo é completo
+        '''
+        return self.__zeros() == self.__diagonal().count(0)
 
+    def conectividade_em_lote(self, operacoes):
+        '''
+        Processa de uma vez uma sequência de inclusões, remoções e consultas de conectividade, partindo das arestas
+        atuais e sem alterar o grafo. Custa O(V² + (k + q) log q log V) para k alterações e q consultas,
+        em vez de uma busca completa a cada consulta.
+        :param operacoes: Uma sequência de tuplas:
+          ('adiciona', 'X-Y')  inclui uma aresta X-Y
+          ('remove', 'X-Y')    retira uma aresta X-Y, se houver (como em remove_aresta)
+          ('consulta', 'X-Y')  pergunta se existe caminho entre X e Y
+          ('conexo',)          pergunta se o grafo é conexo
+        :return: Uma lista com a resposta (booleana) de cada consulta, na ordem em que aparecem
+        :raises: ArestaInvalidaException se alguma aresta não for válida
+        :raises: ValueError se alguma operação não for reconhecida
+        '''
+        indices = self.__indices
 
+        # Quantidade de arestas vivas de cada par e o instante em que o par passou a ter alguma
+        multiplicidade = {}
+        inicio = {}
+        for i in range(len(self.N)):
+            linha = self.__linha(i)
+            for j in range(i, len(self.N)):
+                if linha[j] != 0:
+                    multiplicidade[(i, j)] = linha[j]
+                    inicio[(i, j)] = 0
+
+        intervalos = []
+        consultas = []
+        for operacao in operacoes:
+            tipo = operacao[0]
+            if tipo == 'adiciona':
+                par = self.__indices_aresta(operacao[1], indices)
+                if multiplicidade.get(par, 0) == 0:
+                    inicio[par] = len(consultas)
+                multiplicidade[par] = multiplicidade.get(par, 0) + 1
+            elif tipo == 'remove':
+                par = self.__indices_aresta(operacao[1], indices)
+                if multiplicidade.get(par, 0) > 0:
+                    multiplicidade[par] -= 1
+                    if multiplicidade[par] == 0:
+                        intervalos.append((inicio[par], len(consultas), par[0], par[1]))
+            elif tipo == 'consulta':
+                consultas.append(self.__indices_aresta(operacao[1], indices))
+            elif tipo == 'conexo':
+                consultas.append(None)
+            else:
+                raise ValueError('Operação desconhecida: {}'.format(tipo))
 
+        for par in multiplicidade:
+            if multiplicidade[par] > 0:
+                intervalos.append((inicio[par], len(consultas), par[0], par[1]))
 
-    def eh_completo(self):
-        for i in range(len(self.M)):
-            for j in range(i, len(self.M[i])):
-                if int(self.M[i][j]) == 0 and j > i:
-                    return False
-        return True
+        return _conectividade_offline(len(self.N), intervalos, consultas)
+
+    def __indices_aresta(self, a, indices):
+        '''
+        Dada uma aresta no formato X-Y, retorna o par (i, j) de índices dos vértices, com i <= j
+        :raises: ArestaInvalidaException se a aresta não for válida
+        '''
+        partes = a.split(Grafo.SEPARADOR_ARESTA)
+        if len(partes) != Grafo.QTDE_MAX_SEPARADOR + 1 or partes[0] not in indices or partes[1] not in indices:
+            raise ArestaInvalidaException('A aresta {} é inválida'.format(a))
+        i = indices[partes[0]]
+        j = indices[partes[1]]
+        return (i, j) if i <= j else (j, i)
 
 
     def __str__(self):
@@ -313,10 +738,11 @@ class Grafo:
 
         grafo_str += '\n'
 
-        for l in range(len(self.M)):
+        M = self.M
+        for l in range(len(M)):
             grafo_str += self.N[l] + ' '
-            for c in range(len(self.M)):
-                grafo_str += str(self.M[l][c]) + ' '
+            for c in range(len(M)):
+                grafo_str += str(M[l][c]) + ' '
             grafo_str += '\n'
 
         return grafo_str
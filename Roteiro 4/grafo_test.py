@@ -1,5 +1,19 @@
 import unittest
-from grafo_adj_nao_dir import Grafo
+from array import array
+from grafo_adj_nao_dir import Grafo, ArestaInvalidaException, VerticeInvalidoException, MatrizInvalidaException
+from grafo_adj_bits import GrafoBits
+
+class Indice:
+    '''
+    Inteiro que não é subclasse de int, como os escalares do NumPy.
+    '''
+
+    def __init__(self, valor):
+        self.valor = valor
+
+    def __index__(self):
+        return self.valor
+
 
 class TestGrafo(unittest.TestCase):
 
@@ -128,4 +142,156 @@ class TestGrafo(unittest.TestCase):
         self.assertFalse((self.g_l2.eh_completo()))
         self.assertFalse((self.g_l3.eh_completo()))
         self.assertTrue((self.g_l4.eh_completo()))
-        self.assertTrue((self.g_l5.eh_completo()))
\ No newline at end of file
+        self.assertTrue((self.g_l5.eh_completo()))
+
+    def test_complemento(self):
+        complemento = self.g_p.complemento()
+        self.assertEqual(list(complemento), self.g_p.vertices_nao_adjacentes())
+        self.assertEqual(len(complemento), 21)
+        self.assertIn('J-E', complemento)
+        self.assertIn(('Z', 'C'), complemento)
+        self.assertNotIn('C-J', complemento)
+        self.assertNotIn('J-X', complemento)
+
+        self.assertEqual(len(self.g_l1.complemento()), 8)
+        self.assertNotIn('A-A', self.g_l1.complemento())
+
+        # A visão acompanha as alterações no grafo
+        g = Grafo(['J'])
+        complemento_g = g.complemento()
+        g.adicionaVertice('K')
+        self.assertEqual(len(complemento_g), 3)
+        g.adicionaAresta('K-J')
+        g.adicionaAresta('J-K')
+        self.assertEqual(list(complemento_g), ['J-J', 'K-K'])
+        g.remove_aresta('J-K')
+        self.assertEqual(len(complemento_g), 2)
+        g.remove_aresta('K-J')
+        self.assertEqual(list(complemento_g), ['J-J', 'J-K', 'K-K'])
+        self.assertEqual(len(complemento_g), 3)
+
+    def test_adiciona_vertices(self):
+        g = Grafo(['J'])
+        g.adiciona_vertices(['C', 'E'])
+        g.adicionaVertice('P')
+        g.adicionaAresta('C-J')
+        g.adiciona_vertices(iter(['M', 'T', 'Z']))
+        g.adicionaAresta('Z-P')
+        self.assertEqual(g.N, ['J', 'C', 'E', 'P', 'M', 'T', 'Z'])
+        self.assertTrue(g.existeAresta('J-C'))
+        self.assertTrue(g.existeAresta('P-Z'))
+        self.assertEqual(g.grau('J'), 1)
+        self.assertEqual(g.quantidade_nao_adjacentes(), len(g.vertices_nao_adjacentes()))
+        self.assertEqual(g.M[6], ['-'] * 6 + [0])
+
+        # Nenhum vértice é incluído se algum for inválido
+        self.assertRaises(VerticeInvalidoException, g.adiciona_vertices, ['A', 'A'])
+        self.assertRaises(VerticeInvalidoException, g.adiciona_vertices, ['A', 'J'])
+        self.assertRaises(VerticeInvalidoException, g.adiciona_vertices, ['A', 'B-C'])
+        self.assertEqual(len(g.N), 7)
+
+    def test_construtor_matriz(self):
+        self.assertEqual(Grafo(['J', 'C', 'E', 'P'], self.g_c.M).M, self.g_c.M)
+
+        # Matriz simétrica em um array, usada pelo grafo sem cópia
+        matriz = array('i', [1, 2, 0,
+                             2, 0, 1,
+                             0, 1, 0])
+        g = Grafo(['A', 'B', 'C'], matriz)
+        self.assertEqual(g.M, [[1, 2, 0], ['-', 0, 1], ['-', '-', 0]])
+        self.assertEqual(g.grau('B'), 3)
+        g.adicionaAresta('C-A')
+        self.assertEqual(matriz[2], 1)
+        self.assertEqual(matriz[6], 1)
+
+        self.assertEqual(Grafo(['A', 'B', 'C'], memoryview(matriz).cast('B').cast('i', [3, 3])).M, g.M)
+        self.assertEqual(Grafo(['A', 'B'], bytes([0, 1, 1, 0])).M, [[0, 1], ['-', 0]])
+
+        self.assertRaises(MatrizInvalidaException, Grafo, ['A', 'B'], [[0, 1], [1, 0]])
+        self.assertRaises(MatrizInvalidaException, Grafo, ['A', 'B'], [[0, 1]])
+        self.assertRaises(MatrizInvalidaException, Grafo, ['A', 'B'], [[0, 'x'], ['-', 0]])
+        self.assertRaises(MatrizInvalidaException, Grafo, ['A', 'B'], array('i', [0, 1, 2, 0]))
+        self.assertRaises(MatrizInvalidaException, Grafo, ['A', 'B'], array('i', [0, 1, 1]))
+        self.assertRaises(MatrizInvalidaException, Grafo, ['A', 'B'], array('i', [0, -1, -1, 0]))
+        self.assertRaises(VerticeInvalidoException, Grafo, ['A', 'B-C'])
+
+    def test_existem_arestas(self):
+        self.assertTrue(self.g_p.existeAresta('E-C'))
+        self.assertFalse(self.g_p.existeAresta('J-E'))
+        self.assertFalse(self.g_p.existeAresta('J-X'))
+        self.assertFalse(self.g_p.existeAresta('J-C-E'))
+
+        self.assertEqual(self.g_p.existem_arestas(['J-C', 'C-J', ('T', 'Z'), 'J-E', 'J-X', 'JC']),
+                         [True, True, True, False, False, False])
+        # Vértices pelo índice em N: J=0, C=1, E=2, Z=6
+        self.assertEqual(self.g_p.existem_arestas(array('i', [0, 1, 0, 6, 7]), array('i', [1, 2, 2, 5, 0])),
+                         [True, True, False, True, False])
+        self.assertEqual(self.g_p.existem_arestas([0, 'C'], ['C', -1]), [True, False])
+        self.assertEqual(self.g_p.existem_arestas([]), [])
+
+        # Pares de índices, buffers que não são array e inteiros que não são int (como os escalares do NumPy)
+        self.assertEqual(self.g_p.existem_arestas([(0, 1), (1, 0), (0, 2), (6, 5), (0, 7)]),
+                         [True, True, False, True, False])
+        self.assertEqual(self.g_p.existem_arestas(bytes([0, 1, 6]), memoryview(bytes([1, 2, 5]))), [True, True, True])
+        self.assertEqual(self.g_p.existem_arestas(memoryview(array('q', [0, 8])), memoryview(array('q', [1, 1]))),
+                         [True, False])
+        self.assertEqual(self.g_p.existem_arestas([(Indice(0), Indice(1)), (Indice(1), 'E')]), [True, True])
+        self.assertEqual(self.g_p.existem_arestas([Indice(0), Indice(0)], [Indice(1), Indice(2)]), [True, False])
+        self.assertRaises(ValueError, self.g_p.existem_arestas, [0], [1, 2])
+
+    def test_conectividade_em_lote(self):
+        operacoes = [
+            ('conexo',),
+            ('consulta', 'J-Z'),
+            ('remove', 'T-Z'),
+            ('consulta', 'J-Z'),
+            ('remove', 'C-E'),
+            ('consulta', 'E-J'),
+            ('remove', 'C-E'),
+            ('consulta', 'E-J'),
+            ('adiciona', 'Z-E'),
+            ('consulta', 'E-Z'),
+            ('adiciona', 'M-Z'),
+            ('conexo',),
+            ('remove', 'X-X'),
+        ]
+        self.assertRaises(ArestaInvalidaException, self.g_p.conectividade_em_lote, operacoes)
+        self.assertEqual(self.g_p.conectividade_em_lote(operacoes[:-1]),
+                         [True, True, False, True, False, True, True])
+
+        # O grafo não é alterado
+        self.assertTrue(self.g_p.existeAresta('T-Z'))
+        self.assertEqual(self.g_p.grau('E'), 2)
+
+        self.assertEqual(Grafo().conectividade_em_lote([('conexo',)]), [True])
+        self.assertEqual(self.g_l5.conectividade_em_lote([('remove', 'C-D'), ('consulta', 'D-C'), ('conexo',)]),
+                         [False, False])
+
+    def test_grafo_bits(self):
+        g = GrafoBits.de_grafo(self.g_p_sem_paralelas)
+        self.assertRaises(ArestaInvalidaException, GrafoBits.de_grafo, self.g_p)
+        self.assertRaises(ArestaInvalidaException, g.adicionaAresta, 'E-C')
+        self.assertRaises(ArestaInvalidaException, g.adicionaAresta, 'J-X')
+
+        self.assertEqual(g.vertices_nao_adjacentes(), self.g_p_sem_paralelas.vertices_nao_adjacentes())
+        self.assertEqual(str(g), str(self.g_p_sem_paralelas))
+        for v in g.N:
+            self.assertEqual(g.grau(v), self.g_p_sem_paralelas.grau(v))
+        self.assertTrue(g.existeAresta('C-J'))
+        self.assertFalse(g.existeAresta('J-E'))
+        self.assertFalse(g.ha_paralelas())
+        self.assertFalse(g.eh_completo())
+        self.assertEqual(set(g.arestas_sobre_vertice('M')), set(['C-M', 'M-T']))
+
+        self.assertEqual(g.vizinhos('T'), ['C', 'M', 'Z'])
+        self.assertEqual(g.vizinhos_comuns('M', 'T'), ['C'])
+        self.assertEqual(g.quantidade_vizinhos_comuns('J', 'E'), 1)
+
+        g.remove_aresta('Z-T')
+        self.assertEqual(g.grau('Z'), 0)
+        g.adicionaAresta('Z-Z')
+        self.assertTrue(g.ha_laco())
+        self.assertEqual(g.grau('Z'), 1)
+
+        self.assertTrue(GrafoBits.de_grafo(self.g_c).eh_completo())
+        self.assertTrue(GrafoBits.de_grafo(self.g_l5).eh_completo())
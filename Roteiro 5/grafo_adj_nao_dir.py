@@ -38,6 +38,11 @@ class Grafo:
 
         self.N = list(V)
 
+        # Posição de cada vértice na lista de vértices
+        self.__indices = {}
+        for i in range(len(self.N)):
+            self.__indices.setdefault(self.N[i], i)
+
         if M == []:
             for k in range(len(V)):
                 M.append(list())
@@ -113,7 +118,7 @@ class Grafo:
         :param vertice: O vértice que deve ser verificado.
         :return: Um valor booleano que indica se o vértice existe no grafo.
         '''
-        return Grafo.verticeValido(vertice) and self.N.count(vertice) > 0
+        return Grafo.verticeValido(vertice) and vertice in self.__indices
 
     def __primeiro_vertice_aresta(self, a: str):
         '''
@@ -137,7 +142,7 @@ class Grafo:
         :param a: A aresta a ser analisada
         :return: O índice do primeiro vértice da aresta na lista de vértices
         '''
-        return self.N.index(self.__primeiro_vertice_aresta(a))
+        return self.__indices[self.__primeiro_vertice_aresta(a)]
 
     def __indice_segundo_vertice_aresta(self, a: str):
         '''
@@ -145,7 +150,7 @@ class Grafo:
         :param a: A aresta a ser analisada
         :return: O índice do segundo vértice da aresta na lista de vértices
         '''
-        return self.N.index(self.__segundo_vertice_aresta(a))
+        return self.__indices[self.__segundo_vertice_aresta(a)]
 
     def existeAresta(self, a: str):
         '''
@@ -168,24 +173,38 @@ class Grafo:
         :param v: O vértice a ser incluído no grafo.
         :raises VerticeInvalidoException se o vértice já existe ou se ele não estiver no formato válido.
         '''
-        if v in self.N:
-            raise VerticeInvalidoException('O vértice {} já existe'.format(v))
+        self.adiciona_vertices([v])
+
+    def adiciona_vertices(self, vertices):
+        '''
+        Inclui vários vértices de uma vez. Cada linha existente ganha todas as colunas novas de uma só vez e nenhum
+        índice é procurado na lista de vértices, então incluir n vértices custa O(n²) no total.
+        Nenhum vértice é incluído se algum deles for inválido.
+        :param vertices: Um iterável com os vértices a serem incluídos no grafo.
+        :raises VerticeInvalidoException se algum vértice já existe, aparece repetido ou não está no formato válido.
+        '''
+        novos = list(vertices)
+        vistos = set()
+        for v in novos:
+            if v in self.__indices or v in vistos:
+                raise VerticeInvalidoException('O vértice {} já existe'.format(v))
+            if not self.verticeValido(v):
+                raise VerticeInvalidoException('O vértice ' + v + ' é inválido')
+            vistos.add(v)
+
+        total = len(self.N) + len(novos)
+        colunas = [0] * len(novos)
+        for linha in self.M:
+            linha.extend(colunas)  # adiciona os elementos das colunas dos vértices novos
 
-        if self.verticeValido(v):
+        for v in novos:
             if len(v) > self.__maior_vertice:
                 self.__maior_vertice = len(v)
 
+            # A linha nova tem '-' abaixo da diagonal e zeros da diagonal em diante
+            self.M.append(['-'] * len(self.N) + [0] * (total - len(self.N)))  # Adiciona a linha
+            self.__indices[v] = len(self.N)
             self.N.append(v)  # Adiciona vértice na lista de vértices
-            self.M.append([])  # Adiciona a linha
-
-            for k in range(len(self.N)):
-                if k != len(self.N) - 1:
-                    self.M[k].append(0)  # adiciona os elementos da coluna do vértice
-                    self.M[self.N.index(v)].append('-')  # adiciona os elementos da linha do vértice
-                else:
-                    self.M[self.N.index(v)].append(0)  # adiciona um zero no último elemento da linha
-        else:
-            raise VerticeInvalidoException('O vértice ' + v + ' é inválido')
 
     def adiciona_aresta(self, a):
         '''
@@ -0,0 +1,79 @@
+import copy
+import unittest
+from grafo_adj_nao_dir import Grafo, VerticeInvalidoException
+
+
+class TestGrafo(unittest.TestCase):
+
+    def setUp(self):
+        # Grafo da Paraíba
+        self.g_p = Grafo(['J', 'C', 'E', 'P', 'M', 'T', 'Z'])
+        for a in ['J-C', 'C-E', 'C-E', 'C-P', 'C-P', 'C-M', 'C-T', 'M-T', 'T-Z']:
+            self.g_p.adiciona_aresta(a)
+
+    def verifica_triangular(self, g):
+        # Abaixo da diagonal só há '-', da diagonal em diante só inteiros
+        self.assertEqual(len(g.M), len(g.N))
+        for i in range(len(g.M)):
+            self.assertEqual(len(g.M[i]), len(g.N))
+            for j in range(len(g.M)):
+                if i > j:
+                    self.assertEqual(g.M[i][j], '-')
+                else:
+                    self.assertIsInstance(g.M[i][j], int)
+
+    def test_adiciona_vertices(self):
+        self.g_p.adiciona_vertices(['A', 'B', 'D'])
+        self.assertEqual(self.g_p.N, ['J', 'C', 'E', 'P', 'M', 'T', 'Z', 'A', 'B', 'D'])
+        self.verifica_triangular(self.g_p)
+        for v in ['A', 'B', 'D']:
+            self.assertEqual(self.g_p.grau(v), 0)
+
+        # As arestas já existentes continuam no lugar e os vértices novos aceitam arestas
+        self.assertEqual(self.g_p.grau('C'), 7)
+        self.g_p.adiciona_aresta('D-A')
+        self.g_p.adiciona_aresta('B-C')
+        self.assertEqual(self.g_p.M[7][9], 1)
+        self.assertEqual(self.g_p.M[1][8], 1)
+        self.assertTrue(self.g_p.existeAresta('A-D'))
+        self.assertEqual(self.g_p.grau('C'), 8)
+
+        # Incluir de uma vez ou um por um dá a mesma matriz que o construtor monta
+        em_lote = Grafo()
+        em_lote.adiciona_vertices(['A', 'B', 'C', 'D'])
+        um_por_um = Grafo(['A'])
+        for v in ['B', 'C', 'D']:
+            um_por_um.adiciona_vertice(v)
+        construido = Grafo(['A', 'B', 'C', 'D'])
+        self.assertEqual(em_lote.M, construido.M)
+        self.assertEqual(um_por_um.M, construido.M)
+        self.assertEqual(str(em_lote), str(construido))
+        self.verifica_triangular(em_lote)
+
+        # Uma lista vazia não altera o grafo
+        antes = copy.deepcopy(self.g_p.M)
+        self.g_p.adiciona_vertices([])
+        self.assertEqual(self.g_p.M, antes)
+
+    def test_adiciona_vertices_invalidos(self):
+        N = list(self.g_p.N)
+        M = copy.deepcopy(self.g_p.M)
+        texto = str(self.g_p)
+
+        # O vértice com problema vem depois de vértices válidos, que também não podem ser incluídos
+        for vertices in (['A', 'J'], ['A', 'B', 'A'], ['A', ''], ['A', 'B-C']):
+            with self.subTest(vertices=vertices):
+                self.assertRaises(VerticeInvalidoException, self.g_p.adiciona_vertices, vertices)
+                self.assertEqual(self.g_p.N, N)
+                self.assertEqual(self.g_p.M, M)
+                self.assertEqual(str(self.g_p), texto)
+                self.assertFalse(self.g_p.existeVertice('A'))
+
+        self.assertRaises(VerticeInvalidoException, self.g_p.adiciona_vertice, 'C')
+        self.assertRaises(VerticeInvalidoException, self.g_p.adiciona_vertice, 'C-E')
+        self.assertEqual(self.g_p.M, M)
+
+        # Depois das tentativas inválidas, o grafo continua aceitando vértices
+        self.g_p.adiciona_vertices(['A', 'B'])
+        self.assertEqual(self.g_p.N, N + ['A', 'B'])
+        self.verifica_triangular(self.g_p)
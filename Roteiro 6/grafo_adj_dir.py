@@ -1,3 +1,4 @@
+import operator
 from copy import deepcopy
 
 
@@ -10,10 +11,102 @@ class ArestaInvalidaException(Exception):
 class MatrizInvalidaException(Exception):
     pass
 
+def _conectividade_offline(n, intervalos, consultas):
+    '''
+    Responde consultas de conectividade sobre um conjunto de arestas que muda com o tempo, sem refazer a busca a cada
+    mudança. O tempo é medido em consultas: a consulta k acontece no instante k. Cada intervalo de vida de uma aresta
+    é pendurado nos O(log q) nós de uma árvore de segmentos sobre o tempo que o cobrem. Um percurso pela árvore une as
+    arestas de cada nó em uma estrutura union-find com desfazer (união por tamanho, sem compressão de caminho) e
+    desfaz as uniões ao sair do nó, então cada folha vê exatamente as arestas vivas no seu instante.
+    :param n: A quantidade de vértices, identificados de 0 a n - 1
+    :param intervalos: Tuplas (inicio, fim, i, j): a aresta entre i e j existe nos instantes inicio <= k < fim
+    :param consultas: Para cada instante, uma tupla (i, j) para perguntar se i e j estão ligados,
+    ou None para perguntar se o grafo inteiro é conexo
+    :return: Uma lista de valores booleanos com a resposta de cada consulta
+    '''
+    q = len(consultas)
+    respostas = [False] * q
+    if q == 0:
+        return respostas
+
+    tamanho_arvore = 1
+    while tamanho_arvore < q:
+        tamanho_arvore *= 2
+
+    # Arestas de cada nó da árvore de segmentos (o nó 1 é a raiz e as folhas começam em tamanho_arvore)
+    arestas_no = {}
+    for inicio, fim, i, j in intervalos:
+        esquerda = inicio + tamanho_arvore
+        direita = fim + tamanho_arvore
+        while esquerda < direita:
+            if esquerda & 1:
+                arestas_no.setdefault(esquerda, []).append((i, j))
+                esquerda += 1
+            if direita & 1:
+                direita -= 1
+                arestas_no.setdefault(direita, []).append((i, j))
+            esquerda //= 2
+            direita //= 2
+
+    pai = list(range(n))
+    tamanho = [1] * n
+    componentes = n
+    historico = []
+
+    def raiz(v):
+        while pai[v] != v:
+            v = pai[v]
+        return v
+
+    # Cada entrada da pilha é (nó, primeiro instante do nó, quantidade de instantes do nó, marca). A marca é -1 na
+    # entrada do nó e, na saída, a quantidade de uniões que existiam antes de entrar nele, para desfazer as demais.
+    pilha = [(1, 0, tamanho_arvore, -1)]
+    while pilha:
+        no, inicio, largura, marca = pilha.pop()
+
+        if marca >= 0:
+            while len(historico) > marca:
+                r1, r2 = historico.pop()
+                pai[r2] = r2
+                tamanho[r1] -= tamanho[r2]
+                componentes += 1
+            continue
+
+        marca = len(historico)
+        for i, j in arestas_no.get(no, ()):
+            r1 = raiz(i)
+            r2 = raiz(j)
+            if r1 != r2:
+                if tamanho[r1] < tamanho[r2]:
+                    r1, r2 = r2, r1
+                pai[r2] = r1
+                tamanho[r1] += tamanho[r2]
+                componentes -= 1
+                historico.append((r1, r2))
+
+        pilha.append((no, inicio, largura, marca))
+        if largura == 1:
+            consulta = consultas[inicio]
+            if consulta is None:
+                respostas[inicio] = componentes <= 1
+            else:
+                respostas[inicio] = raiz(consulta[0]) == raiz(consulta[1])
+        else:
+            metade = largura // 2
+            # Instantes depois da última consulta não precisam ser visitados
+            if inicio + metade < q:
+                pilha.append((2 * no + 1, inicio + metade, metade, -1))
+            pilha.append((2 * no, inicio, metade, -1))
+
+    return respostas
+
+
 class Grafo:
 
     QTDE_MAX_SEPARADOR = 1
     SEPARADOR_ARESTA = '-'
+    # Códigos de formato de buffer (módulo struct) dos tipos inteiros
+    FORMATOS_INTEIROS = ('b', 'B', 'h', 'H', 'i', 'I', 'l', 'L', 'q', 'Q', 'n', 'N')
     __maior_vertice = 0
 
     def __init__(self, V=None, M=None):
@@ -37,6 +130,11 @@ class Grafo:
 
         self.N = list(V)
 
+        # Posição de cada vértice na lista de vértices
+        self.__indices = {}
+        for i in range(len(self.N)):
+            self.__indices.setdefault(self.N[i], i)
+
         if M == []:
             for k in range(len(V)):
                 M.append(list())
@@ -111,7 +209,7 @@ class Grafo:
         :param vertice: O vértice que deve ser verificado.
         :return: Um valor booleano que indica se o vértice existe no grafo.
         '''
-        return Grafo.verticeValido(vertice) and self.N.count(vertice) > 0
+        return Grafo.verticeValido(vertice) and vertice in self.__indices
 
     def __primeiro_vertice_aresta(self, a: str):
         '''
@@ -135,7 +233,7 @@ class Grafo:
         :param a: A aresta a ser analisada
         :return: O índice do primeiro vértice da aresta na lista de vértices
         '''
-        return self.N.index(self.__primeiro_vertice_aresta(a))
+        return self.__indices[self.__primeiro_vertice_aresta(a)]
 
     def __indice_segundo_vertice_aresta(self, a: str):
         '''
@@ -143,22 +241,94 @@ class Grafo:
         :param a: A aresta a ser analisada
         :return: O índice do segundo vértice da aresta na lista de vértices
         '''
-        return self.N.index(self.__segundo_vertice_aresta(a))
+        return self.__indices[self.__segundo_vertice_aresta(a)]
 
     def existeAresta(self, a: str):
         '''
-        Verifica se uma aresta passada como parâmetro pertence ao grafo.
-        :param aresta: A aresta a ser verificada
+        Verifica em O(1) se uma aresta passada como parâmetro pertence ao grafo, consultando o índice de cada vértice
+        no dicionário de índices e a célula correspondente da matriz.
+        :param a: A aresta a ser verificada
         :return: Um valor booleano que indica se a aresta existe no grafo.
         '''
-        existe = False
-        if Grafo.arestaValida(self, a):
-            for i in range(len(self.M)):
-                for j in range(len(self.M)):
-                    if self.M[self.__indice_primeiro_vertice_aresta(a)][self.__indice_segundo_vertice_aresta(a)]:
-                        existe = True
+        partes = a.split(Grafo.SEPARADOR_ARESTA)
+        if len(partes) != Grafo.QTDE_MAX_SEPARADOR + 1:
+            return False
+        i = self.__indices.get(partes[0])
+        j = self.__indices.get(partes[1])
+        if i is None or j is None:
+            return False
+        return self.M[i][j] > 0
 
-        return existe
+    def existem_arestas(self, pares, destinos=None):
+        '''
+        Verifica de uma vez se várias arestas pertencem ao grafo. Os vértices são convertidos para índices e cada
+        consulta vira a leitura de uma célula da matriz, sem montar nem separar strings para cada aresta.
+        Vértices que não existem no grafo dão False, como em existeAresta.
+        Exemplos: existem_arestas(['A-B', ('B', 'C')]) ou existem_arestas(array('i', [0, 1]), array('i', [1, 2])).
+        :param pares: Uma sequência de arestas, no formato X-Y ou como tuplas (X, Y). Se destinos for passado,
+        uma sequência com as origens das arestas, pelo nome do vértice ou pelo seu índice em N
+        :param destinos: Uma sequência, do mesmo tamanho de pares, com os destinos das arestas
+        :return: Uma lista de valores booleanos, um para cada aresta, no sentido da origem para o destino
+        :raises: ValueError se pares e destinos não tiverem o mesmo tamanho
+        '''
+        if destinos is None:
+            origens, destinos = self.__pares_de_extremidades(pares)
+        else:
+            if len(pares) != len(destinos):
+                raise ValueError('As origens e os destinos não têm o mesmo tamanho')
+            origens = self.__extremidades(pares)
+            destinos = self.__extremidades(destinos)
+
+        M = self.M
+        return [i >= 0 and j >= 0 and M[i][j] > 0 for i, j in zip(origens, destinos)]
+
+    def __extremidades(self, extremidades):
+        '''
+        Converte uma sequência de extremidades de arestas, dadas pelo nome do vértice ou pelo seu índice em N,
+        para uma lista de índices, com -1 nas extremidades que não existem no grafo.
+        Qualquer buffer de inteiros (array, memoryview, array do NumPy) é convertido de uma vez e verificado pelo
+        menor e pelo maior elemento. Nas demais sequências, um índice pode ser qualquer inteiro, inclusive os
+        escalares do NumPy, que não são subclasses de int.
+        '''
+        n = len(self.N)
+        try:
+            buffer = memoryview(extremidades)
+        except TypeError:
+            buffer = None
+        if buffer is not None and buffer.ndim == 1 and buffer.format.lstrip('@=<>!') in Grafo.FORMATOS_INTEIROS:
+            ids = buffer.tolist()
+            if len(ids) == 0 or (min(ids) >= 0 and max(ids) < n):
+                return ids
+            return [i if 0 <= i < n else -1 for i in ids]
+
+        indices = self.__indices
+        ids = []
+        for x in extremidades:
+            if isinstance(x, str):
+                ids.append(indices.get(x, -1))
+                continue
+            try:
+                i = operator.index(x)
+            except TypeError:
+                i = -1
+            ids.append(i if 0 <= i < n else -1)
+        return ids
+
+    def __pares_de_extremidades(self, pares):
+        '''
+        Separa uma sequência de arestas, no formato X-Y ou como tuplas (X, Y), em uma lista com os índices das
+        origens e outra com os índices dos destinos, com -1 nos vértices que não existem no grafo.
+        '''
+        origens = []
+        destinos = []
+        for par in pares:
+            if isinstance(par, str):
+                par = par.split(Grafo.SEPARADOR_ARESTA)
+                if len(par) != Grafo.QTDE_MAX_SEPARADOR + 1:
+                    par = (-1, -1)
+            origens.append(par[0])
+            destinos.append(par[1])
+        return self.__extremidades(origens), self.__extremidades(destinos)
 
     def adicionaVertice(self, v):
         '''
@@ -166,25 +336,38 @@ class Grafo:
         :param v: O vértice a ser incluído no grafo.
         :raises VerticeInvalidoException se o vértice já existe ou se ele não estiver no formato válido.
         '''
-        if v in self.N:
-            raise VerticeInvalidoException('O vértice {} já existe'.format(v))
+        self.adiciona_vertices([v])
 
-        if self.verticeValido(v):
-            if len(v) > self.__maior_vertice:
-                self.__maior_vertice = len(v)
+    def adiciona_vertices(self, vertices):
+        '''
+        Inclui vários vértices de uma vez. Cada linha existente ganha todas as colunas novas de uma só vez e nenhum
+        índice é procurado na lista de vértices, então incluir n vértices custa O(n²) no total.
+        Nenhum vértice é incluído se algum deles for inválido.
+        :param vertices: Um iterável com os vértices a serem incluídos no grafo.
+        :raises VerticeInvalidoException se algum vértice já existe, aparece repetido ou não está no formato válido.
+        '''
+        novos = list(vertices)
+        vistos = set()
+        for v in novos:
+            if v in self.__indices or v in vistos:
+                raise VerticeInvalidoException('O vértice {} já existe'.format(v))
+            if not self.verticeValido(v):
+                raise VerticeInvalidoException('O vértice ' + v + ' é inválido')
+            vistos.add(v)
 
-            self.N.append(v) # Adiciona vértice na lista de vértices
-            self.M.append([]) # Adiciona a linha
+        total = len(self.N) + len(novos)
+        colunas = [0] * len(novos)
+        for linha in self.M:
+            linha.extend(colunas)  # adiciona os elementos das colunas dos vértices novos
 
-            for k in range(len(self.N)):
-                if k != len(self.N) -1:
-                    self.M[k].append(0) # adiciona os elementos da coluna do vértice
-                    self.M[self.N.index(v)].append(0)  # adiciona os elementos da linha do vértice
-                else:
-                    self.M[self.N.index(v)].append(0) # adiciona os elementos da linha do vértice
+        for v in novos:
+            if len(v) > self.__maior_vertice:
+                self.__maior_vertice = len(v)
 
-        else:
-            raise VerticeInvalidoException('O vértice ' + v + ' é inválido')
+            # A linha nova tem uma célula para cada vértice, inclusive os que ainda serão incluídos
+            self.M.append([0] * total)  # Adiciona a linha
+            self.__indices[v] = len(self.N)
+            self.N.append(v)  # Adiciona vértice na lista de vértices
 
     def adicionaAresta(self, a):
         '''
@@ -237,6 +420,73 @@ class Grafo:
 
 
 
+    def conectividade_em_lote(self, operacoes):
+        '''
+        Processa de uma vez uma sequência de inclusões, remoções e consultas de conectividade, partindo das arestas
+        atuais e sem alterar o grafo. Como o grafo é direcionado, a conectividade respondida é a fraca: o sentido das
+        arestas é ignorado. Custa O(V² + (k + q) log q log V) para k alterações e q consultas, em vez de uma busca
+        completa a cada consulta.
+        :param operacoes: Uma sequência de tuplas:
+          ('adiciona', 'X-Y')  inclui uma aresta X-Y
+          ('remove', 'X-Y')    retira uma aresta X-Y, se houver (como em remove_aresta)
+          ('consulta', 'X-Y')  pergunta se existe caminho entre X e Y
+          ('conexo',)          pergunta se o grafo é conexo
+        :return: Uma lista com a resposta (booleana) de cada consulta, na ordem em que aparecem
+        :raises: ArestaInvalidaException se alguma aresta não for válida
+        :raises: ValueError se alguma operação não for reconhecida
+        '''
+        indices = self.__indices
+
+        # Quantidade de arestas vivas de cada par e o instante em que o par passou a ter alguma
+        multiplicidade = {}
+        inicio = {}
+        for i in range(len(self.N)):
+            for j in range(0, len(self.N)):
+                if self.M[i][j] != 0:
+                    multiplicidade[(i, j)] = self.M[i][j]
+                    inicio[(i, j)] = 0
+
+        intervalos = []
+        consultas = []
+        for operacao in operacoes:
+            tipo = operacao[0]
+            if tipo == 'adiciona':
+                par = self.__indices_aresta(operacao[1], indices)
+                if multiplicidade.get(par, 0) == 0:
+                    inicio[par] = len(consultas)
+                multiplicidade[par] = multiplicidade.get(par, 0) + 1
+            elif tipo == 'remove':
+                par = self.__indices_aresta(operacao[1], indices)
+                if multiplicidade.get(par, 0) > 0:
+                    multiplicidade[par] -= 1
+                    if multiplicidade[par] == 0:
+                        intervalos.append((inicio[par], len(consultas), par[0], par[1]))
+            elif tipo == 'consulta':
+                consultas.append(self.__indices_aresta(operacao[1], indices))
+            elif tipo == 'conexo':
+                consultas.append(None)
+            else:
+                raise ValueError('Operação desconhecida: {}'.format(tipo))
+
+        for par in multiplicidade:
+            if multiplicidade[par] > 0:
+                intervalos.append((inicio[par], len(consultas), par[0], par[1]))
+
+        return _conectividade_offline(len(self.N), intervalos, consultas)
+
+    def __indices_aresta(self, a, indices):
+        '''
+        Dada uma aresta no formato X-Y, retorna o par (i, j) com os índices de X e de Y
+        :raises: ArestaInvalidaException se a aresta não for válida
+        '''
+        partes = a.split(Grafo.SEPARADOR_ARESTA)
+        if len(partes) != Grafo.QTDE_MAX_SEPARADOR + 1 or partes[0] not in indices or partes[1] not in indices:
+            raise ArestaInvalidaException('A aresta {} é inválida'.format(a))
+        i = indices[partes[0]]
+        j = indices[partes[1]]
+        return (i, j)
+
+
     def __str__(self):
             '''
             Fornece uma representação do tipo String do grafo.
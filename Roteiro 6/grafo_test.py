@@ -0,0 +1,111 @@
+import random
+import unittest
+from array import array
+from grafo_adj_dir import Grafo, ArestaInvalidaException, VerticeInvalidoException
+
+
+class Indice:
+    '''
+    Inteiro que não é subclasse de int, como os escalares do NumPy.
+    '''
+
+    def __init__(self, valor):
+        self.valor = valor
+
+    def __index__(self):
+        return self.valor
+
+
+class TestGrafo(unittest.TestCase):
+
+    def setUp(self):
+        # Grafo da Paraíba, com as arestas no sentido em que foram escritas
+        self.g_p = Grafo(['J', 'C', 'E', 'P', 'M', 'T', 'Z'])
+        for a in ['J-C', 'C-E', 'C-E', 'C-P', 'C-P', 'C-M', 'C-T', 'M-T', 'T-Z']:
+            self.g_p.adicionaAresta(a)
+
+    def test_existeAresta(self):
+        self.assertTrue(self.g_p.existeAresta('J-C'))
+        self.assertFalse(self.g_p.existeAresta('C-J'))
+        self.assertFalse(self.g_p.existeAresta('J-X'))
+        self.assertFalse(self.g_p.existeAresta('J-C-E'))
+
+    def test_existem_arestas(self):
+        self.assertEqual(self.g_p.existem_arestas(['J-C', 'C-J', ('T', 'Z'), 'J-X', 'JC']),
+                         [True, False, True, False, False])
+        # Vértices pelo índice em N: J=0, C=1, E=2, T=5, Z=6
+        self.assertEqual(self.g_p.existem_arestas([(0, 1), (1, 0), (5, 6), (6, 5), (0, 7)]),
+                         [True, False, True, False, False])
+        self.assertEqual(self.g_p.existem_arestas(array('i', [0, 1, 1]), array('i', [1, 0, 2])), [True, False, True])
+        self.assertEqual(self.g_p.existem_arestas(bytes([0, 5]), memoryview(bytes([1, 6]))), [True, True])
+        self.assertEqual(self.g_p.existem_arestas([(Indice(0), Indice(1)), (Indice(1), 'J')]), [True, False])
+        self.assertEqual(self.g_p.existem_arestas([]), [])
+        self.assertRaises(ValueError, self.g_p.existem_arestas, [0], [1, 2])
+
+    def test_adiciona_vertices(self):
+        g = Grafo(['A'])
+        g.adiciona_vertices(['B', 'C'])
+        g.adicionaAresta('C-A')
+        self.assertEqual(g.M, [[0, 0, 0], [0, 0, 0], [1, 0, 0]])
+        self.assertRaises(VerticeInvalidoException, g.adiciona_vertices, ['D', 'A'])
+        self.assertRaises(ArestaInvalidaException, g.adicionaAresta, 'C-D')
+        self.assertEqual(g.N, ['A', 'B', 'C'])
+
+    def test_conectividade_em_lote(self):
+        # A conectividade é a fraca, mas remover uma aresta respeita o sentido: só T-Z existe, não Z-T
+        operacoes = [
+            ('conexo',),
+            ('consulta', 'Z-J'),
+            ('remove', 'Z-T'),
+            ('consulta', 'Z-J'),
+            ('remove', 'T-Z'),
+            ('consulta', 'J-Z'),
+            ('adiciona', 'Z-E'),
+            ('consulta', 'J-Z'),
+            ('remove', 'C-E'),
+            ('remove', 'C-E'),
+            ('consulta', 'E-J'),
+            ('conexo',),
+            ('remove', 'X-X'),
+        ]
+        self.assertRaises(ArestaInvalidaException, self.g_p.conectividade_em_lote, operacoes)
+        self.assertEqual(self.g_p.conectividade_em_lote(operacoes[:-1]), [True, True, True, False, True, False, False])
+
+        # O grafo não é alterado
+        self.assertTrue(self.g_p.existeAresta('T-Z'))
+        self.assertFalse(self.g_p.existeAresta('Z-E'))
+        self.assertRaises(ValueError, self.g_p.conectividade_em_lote, [('inverte', 'J-C')])
+
+        # Compara com uma busca que ignora o sentido das arestas, refeita a cada consulta
+        rng = random.Random(17)
+        for _ in range(100):
+            N = ['v' + str(i) for i in range(rng.randint(1, 6))]
+            g = Grafo(list(N))
+            arestas = []
+            for _ in range(rng.randint(0, 6)):
+                a = rng.choice(N) + '-' + rng.choice(N)
+                g.adicionaAresta(a)
+                arestas.append(a)
+
+            operacoes = []
+            esperado = []
+            for _ in range(15):
+                tipo = rng.choice(['adiciona', 'remove', 'consulta', 'conexo'])
+                a = rng.choice(N) + '-' + rng.choice(N)
+                if tipo == 'adiciona':
+                    arestas.append(a)
+                elif tipo == 'remove' and a in arestas:
+                    arestas.remove(a)
+                if tipo in ('consulta', 'conexo'):
+                    alcancados = {a.split('-')[0] if tipo == 'consulta' else N[0]}
+                    mudou = True
+                    while mudou:
+                        mudou = False
+                        for b in arestas:
+                            v1, v2 = b.split('-')
+                            if (v1 in alcancados) != (v2 in alcancados):
+                                alcancados.update((v1, v2))
+                                mudou = True
+                    esperado.append(a.split('-')[1] in alcancados if tipo == 'consulta' else len(alcancados) == len(N))
+                operacoes.append((tipo, a) if tipo != 'conexo' else (tipo,))
+            self.assertEqual(g.conectividade_em_lote(operacoes), esperado)
@@ -11,24 +11,32 @@ class Grafo:
     QTDE_MAX_SEPARADOR = 1
     SEPARADOR_ARESTA = '-'
 
-    def __init__(self, N=[], A={}):
+    def __init__(self, N=None, A=None):
         '''
         Constrói um objeto do tipo Grafo. Se nenhum parâmetro for passado, cria um Grafo vazio.
         Se houver alguma aresta ou algum vértice inválido, uma exceção é lançada.
         :param N: Uma lista dos vértices (ou nodos) do grafo.
         :param V: Uma dicionário que guarda as arestas do grafo. A chave representa o nome da aresta e o valor é uma string que contém dois vértices separados por um traço.
         '''
+
+        if N == None:
+            N = list()
+        if A == None:
+            A = dict()
+
         for v in N:
             if not(Grafo.verticeValido(v)):
                 raise VerticeInvalidoException('O vértice ' + v + ' é inválido')
 
-        self.N = N
+        self.N = list(N)
 
         for a in A:
             if not(self.arestaValida(A[a])):
                 raise ArestaInvalidaException('A aresta ' + A[a] + ' é inválida')
 
-        self.A = A
+        self.A = dict(A)
+
+        self.__conta_pares()
 
     def arestaValida(self, aresta=''):
         '''
@@ -98,7 +106,9 @@ class Grafo:
         :raises: VerticeInvalidoException se o vértice passado como parâmetro não puder ser adicionado
         '''
         if self.verticeValido(v) and not self.existeVertice(v):
+            em_dia = self.__tamanhos_pares == (len(self.N), len(self.A))
             self.N.append(v)
+            self.__tamanhos_pares = (len(self.N), len(self.A)) if em_dia else None
         else:
             raise VerticeInvalidoException('O vértice ' + v + ' é inválido')
 
@@ -109,7 +119,14 @@ class Grafo:
         :raises: ArestaInvalidaException se a aresta passada como parâmetro não puder ser adicionada
         '''
         if self.arestaValida(a):
+            # Trocar uma aresta existente obriga a refazer os pares, já que o par antigo pode continuar ligado
+            em_dia = nome not in self.A and self.__tamanhos_pares == (len(self.N), len(self.A))
             self.A[nome] = a
+            if em_dia:
+                self.__inclui_par(a)
+                self.__tamanhos_pares = (len(self.N), len(self.A))
+            else:
+                self.__tamanhos_pares = None
         else:
             ArestaInvalidaException('A aresta ' + self.A[a] + ' é inválida')
 
@@ -165,35 +182,40 @@ class Grafo:
                 arestas_final.append(i)
         return arestas_final
 
-    def eh_completo(self):
-        arestas = list(self.A.values())
+    def __conta_pares(self):
+        '''
+        Refaz, em O(E), o conjunto de pares de vértices distintos ligados por alguma aresta.
+        '''
+        self.__pares = set()
+        for a in self.A.values():
+            self.__inclui_par(a)
+        self.__tamanhos_pares = (len(self.N), len(self.A))
 
-        verticies = self.N
+    def __inclui_par(self, aresta):
+        v1, v2 = aresta.split(self.SEPARADOR_ARESTA)
+        if v1 != v2:
+            self.__pares.add((v1, v2) if v1 < v2 else (v2, v1))
 
-        lista_completo = []
+    def eh_completo(self):
+        '''
+        Verifica se o grafo é completo: todo par de vértices distintos deve estar ligado por exatamente uma aresta,
+        sem laços. Custa O(1) com o conjunto de pares mantido por adicionaAresta(), que só é refeito depois que uma
+        aresta é trocada ou que os tamanhos de N ou A mudam por uma alteração direta. Uma alteração direta que mantém
+        os tamanhos (como trocar o valor de A[nome]) não é percebida.
+        :return: Um valor booleano que indica se o grafo é completo
+        '''
+        verticies = self.N
 
         if len(verticies) == 1:
             return True
         elif len(verticies) == 2:
             return True
 
-        for i in range(len(verticies)):
-            for j in range(i+1 , len(verticies)):
-                    lista_completo.append("{}{}{}".format(verticies[i],self.SEPARADOR_ARESTA,verticies[j]))
-
-
-        if len(lista_completo) != len(arestas):
-            return False
-        else:
-            for i in range(len(lista_completo)):
-                v1,v2 = lista_completo[i].split("-")
-                if (lista_completo[i] not in arestas):
-                    if "{}{}{}".format(v2,self.SEPARADOR_ARESTA, v1) not in arestas:
-                        return False
-                    continue
-
-            return True
+        if self.__tamanhos_pares != (len(self.N), len(self.A)):
+            self.__conta_pares()
 
+        necessarias = len(verticies) * (len(verticies) - 1) // 2
+        return len(self.A) == necessarias and len(self.__pares) == necessarias
 
     def DFS(self, verticie, visitados):
 
@@ -0,0 +1,574 @@
+from array import array
+from collections.abc import Mapping
+import heapq
+
+from grafo import VerticeInvalidoException, ArestaInvalidaException
+
+
+class ArestasCompactas(Mapping):
+    '''
+    Visão das arestas de um GrafoCompacto no formato do Grafo (nome da aresta -> X-Y), sem montar um dicionário.
+    Consultar uma aresta pelo nome custa O(1) e só o string X-Y pedido é montado. A visão acompanha as alterações
+    feitas no grafo e não pode ser alterada diretamente.
+    '''
+
+    def __init__(self, grafo):
+        self.__grafo = grafo
+
+    def __getitem__(self, nome):
+        i = self.__grafo.id_aresta(nome)
+        if i is None:
+            raise KeyError(nome)
+        return self.__grafo.aresta(i)
+
+    def __iter__(self):
+        grafo = self.__grafo
+        for i in range(len(self)):
+            yield grafo.nome_aresta(i)
+
+    def __len__(self):
+        return len(self.__grafo.arrays_arestas()[0])
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+
+class GrafoCompacto:
+    '''
+    Representação compacta do Grafo baseado em dicionário de arestas.
+    Cada vértice recebe um identificador inteiro sequencial e as arestas são guardadas apenas como pares desses
+    identificadores em arrays de inteiros, sem um string X-Y por aresta. A interface pública é a mesma do Grafo.
+    Os arrays suportam o protocolo de buffer, então podem ser lidos sem cópia por outras bibliotecas (ex.: numpy.frombuffer).
+    '''
+
+    QTDE_MAX_SEPARADOR = 1
+    SEPARADOR_ARESTA = '-'
+    PREFIXO_ARESTA = 'a'
+
+    def __init__(self, N=None, A=None):
+        '''
+        Constrói um objeto do tipo GrafoCompacto. Se nenhum parâmetro for passado, cria um grafo vazio.
+        Se houver alguma aresta ou algum vértice inválido, uma exceção é lançada.
+        :param N: Uma lista dos vértices (ou nodos) do grafo.
+        :param A: Um dicionário que guarda as arestas do grafo. A chave representa o nome da aresta e o valor é uma string que contém dois vértices separados por um traço.
+        '''
+        self.__nomes = []
+        self.__ids = {}
+
+        self.__origens = array('i')
+        self.__destinos = array('i')
+        self.__graus = array('i')
+
+        # Só os nomes de arestas fora do padrão a1, a2, ... (pela posição) são guardados
+        self.__nomes_arestas = {}
+        self.__ids_arestas = {}
+
+        # Listas de adjacência no formato CSR, montadas sob demanda, e as arestas incluídas depois de cada montagem,
+        # guardadas por vértice (identificador do vértice -> identificadores das arestas)
+        self.__csr_saida = None
+        self.__csr_incidencia = None
+        self.__pendentes_saida = {}
+        self.__pendentes_incidencia = {}
+
+        if N is not None:
+            for v in N:
+                if not(GrafoCompacto.verticeValido(v)):
+                    raise VerticeInvalidoException('O vértice ' + v + ' é inválido')
+                if v not in self.__ids:
+                    self.__novo_vertice(v)
+
+        if A is not None:
+            for a in A:
+                par = self.__separa_aresta(A[a])
+                if par is None:
+                    raise ArestaInvalidaException('A aresta ' + A[a] + ' é inválida')
+                self.__nova_aresta(a, par[0], par[1])
+
+    @classmethod
+    def de_grafo(cls, grafo):
+        '''
+        Converte um Grafo baseado em dicionário de arestas para a representação compacta.
+        :param grafo: O Grafo a ser convertido
+        :return: Um GrafoCompacto com os mesmos vértices e arestas
+        '''
+        return cls(grafo.N, grafo.A)
+
+    @property
+    def N(self):
+        '''
+        A lista de vértices, na ordem dos identificadores. Não deve ser alterada diretamente.
+        '''
+        return self.__nomes
+
+    @property
+    def A(self):
+        '''
+        As arestas no formato do Grafo (nome da aresta -> X-Y), como uma visão somente leitura: A[nome] custa O(1)
+        e nenhum dicionário é montado. Para alterar as arestas use adicionaAresta.
+        '''
+        return ArestasCompactas(self)
+
+    def id_vertice(self, vertice):
+        '''
+        Fornece o identificador inteiro de um vértice.
+        :param vertice: O nome do vértice
+        :return: O identificador do vértice ou None se ele não existir
+        '''
+        return self.__ids.get(vertice)
+
+    def id_aresta(self, nome):
+        '''
+        Fornece o identificador inteiro de uma aresta, que é a sua posição na ordem de inserção.
+        :param nome: O nome da aresta
+        :return: O identificador da aresta ou None se não houver aresta com esse nome
+        '''
+        i = self.__ids_arestas.get(nome)
+        if i is not None:
+            return i
+
+        # Um nome no padrão a1, a2, ... é da aresta daquela posição se ela não tiver recebido outro nome
+        prefixo = GrafoCompacto.PREFIXO_ARESTA
+        if isinstance(nome, str) and nome.startswith(prefixo) and nome[len(prefixo):].isdigit():
+            i = int(nome[len(prefixo):]) - 1
+            if 0 <= i < len(self.__origens) and i not in self.__nomes_arestas and self.__nome_padrao(i) == nome:
+                return i
+        return None
+
+    def nome_aresta(self, i):
+        '''
+        :param i: O identificador de uma aresta
+        :return: O nome da aresta
+        '''
+        return self.__nome_aresta(i)
+
+    def aresta(self, i):
+        '''
+        :param i: O identificador de uma aresta
+        :return: A aresta no formato X-Y
+        '''
+        return self.__aresta_str(i)
+
+    def arrays_arestas(self):
+        '''
+        Fornece os arrays de origens e destinos das arestas, indexados pelo identificador da aresta.
+        :return: Uma tupla (origens, destinos) de array('i')
+        '''
+        return self.__origens, self.__destinos
+
+    def __novo_vertice(self, v):
+        self.__ids[v] = len(self.__nomes)
+        self.__nomes.append(v)
+        self.__graus.append(0)
+
+    def __nova_aresta(self, nome, u, v):
+        i = self.id_aresta(nome)
+        if i is not None:
+            # Como no Grafo, um nome repetido troca a aresta, que continua na mesma posição
+            self.__graus[self.__origens[i]] -= 1
+            if self.__origens[i] != self.__destinos[i]:
+                self.__graus[self.__destinos[i]] -= 1
+            self.__origens[i] = u
+            self.__destinos[i] = v
+            self.__graus[u] += 1
+            if u != v:
+                self.__graus[v] += 1
+            self.__csr_saida = None
+            self.__csr_incidencia = None
+            return
+
+        i = len(self.__origens)
+        if nome != self.__nome_padrao(i):
+            self.__nomes_arestas[i] = nome
+            self.__ids_arestas[nome] = i
+
+        self.__origens.append(u)
+        self.__destinos.append(v)
+        self.__graus[u] += 1
+        if u != v:
+            self.__graus[v] += 1
+
+        # Os CSRs já montados continuam valendo; a aresta nova fica pendente até a próxima montagem
+        if self.__csr_saida is not None:
+            self.__pendentes_saida.setdefault(u, []).append(i)
+        if self.__csr_incidencia is not None:
+            self.__pendentes_incidencia.setdefault(u, []).append(i)
+            if u != v:
+                self.__pendentes_incidencia.setdefault(v, []).append(i)
+
+    def __nome_padrao(self, i):
+        return GrafoCompacto.PREFIXO_ARESTA + str(i + 1)
+
+    def __nome_aresta(self, i):
+        nome = self.__nomes_arestas.get(i)
+        return self.__nome_padrao(i) if nome is None else nome
+
+    def __aresta_str(self, i):
+        return self.__nomes[self.__origens[i]] + GrafoCompacto.SEPARADOR_ARESTA + self.__nomes[self.__destinos[i]]
+
+    def __separa_aresta(self, aresta):
+        '''
+        Separa uma aresta no formato X-Y nos identificadores dos seus dois vértices, validando-a ao mesmo tempo.
+        :param aresta: A aresta a ser separada
+        :return: Uma tupla (id de X, id de Y) ou None se a aresta não for válida neste grafo
+        '''
+        partes = aresta.split(GrafoCompacto.SEPARADOR_ARESTA)
+        if len(partes) != GrafoCompacto.QTDE_MAX_SEPARADOR + 1:
+            return None
+
+        u = self.__ids.get(partes[0])
+        v = self.__ids.get(partes[1])
+        if u is None or v is None:
+            return None
+
+        return u, v
+
+    def __csr(self, direcionado, com_pendentes=False):
+        '''
+        Monta (e guarda) a lista de adjacência no formato CSR:
+        os vizinhos do vértice i estão em alvos[offsets[i]:offsets[i + 1]] e as arestas correspondentes em arestas[...].
+        A ordem das arestas de cada vértice é a ordem de inserção. As arestas incluídas depois da montagem ficam
+        pendentes, por vértice, e o CSR só é remontado quando uma busca precisa dele completo ou quando as pendentes
+        passam das arestas já montadas. Assim, intercalar inclusões com consultas a um vértice custa O(1) amortizado
+        por inclusão.
+        :param direcionado: Se True, considera apenas as arestas que saem de cada vértice. Se False, todas as que incidem.
+        :param com_pendentes: Se True, aceita um CSR sem as últimas arestas e vértices incluídos; quem o usa também
+        consulta as arestas pendentes
+        :return: Uma tupla (offsets, alvos, arestas) de array('i')
+        '''
+        csr = self.__csr_saida if direcionado else self.__csr_incidencia
+        if csr is not None:
+            faltam = len(self.__origens) - csr[3]
+            if faltam == 0 and len(csr[0]) == len(self.__nomes) + 1:
+                return csr[:3]
+            if com_pendentes and faltam <= csr[3]:
+                return csr[:3]
+
+        n = len(self.__nomes)
+        origens = self.__origens
+        destinos = self.__destinos
+
+        offsets = array('i', [0]) * (n + 1)
+        if direcionado:
+            for u in origens:
+                offsets[u + 1] += 1
+        else:
+            for i in range(n):
+                offsets[i + 1] = self.__graus[i]
+        for i in range(n):
+            offsets[i + 1] += offsets[i]
+
+        total = offsets[n]
+        alvos = array('i', [0]) * total
+        arestas = array('i', [0]) * total
+        proximo = array('i', offsets[:n])
+
+        for i in range(len(origens)):
+            u = origens[i]
+            v = destinos[i]
+            alvos[proximo[u]] = v
+            arestas[proximo[u]] = i
+            proximo[u] += 1
+            if not direcionado and u != v:
+                alvos[proximo[v]] = u
+                arestas[proximo[v]] = i
+                proximo[v] += 1
+
+        csr = (offsets, alvos, arestas, len(origens))
+        if direcionado:
+            self.__csr_saida = csr
+            self.__pendentes_saida = {}
+        else:
+            self.__csr_incidencia = csr
+            self.__pendentes_incidencia = {}
+        return csr[:3]
+
+    def arestaValida(self, aresta=''):
+        '''
+        Verifica se uma aresta passada como parâmetro está no formato X-Y e liga dois vértices existentes no grafo.
+        :param aresta: A aresta que se quer verificar se está no formato correto.
+        :return: Um valor booleano que indica se a aresta está no formato correto.
+        '''
+        return self.__separa_aresta(aresta) is not None
+
+    @classmethod
+    def verticeValido(self, vertice=''):
+        '''
+        Verifica se um vértice passado como parâmetro está dentro do padrão estabelecido.
+        Um vértice é um string qualquer que não pode ser vazio e nem conter o caractere separador.
+        :param vertice: Um string que representa o vértice a ser analisado.
+        :return: Um valor booleano que indica se o vértice está no formato correto.
+        '''
+        return vertice != '' and vertice.count(GrafoCompacto.SEPARADOR_ARESTA) == 0
+
+    def existeVertice(self, vertice=''):
+        '''
+        Verifica se um vértice passado como parâmetro pertence ao grafo.
+        :param vertice: O vértice que deve ser verificado.
+        :return: Um valor booleano que indica se o vértice existe no grafo.
+        '''
+        return vertice in self.__ids
+
+    def existeAresta(self, aresta=''):
+        '''
+        Verifica se uma aresta X-Y pertence ao grafo, exatamente nessa orientação.
+        :param aresta: A aresta a ser verificada
+        :return: Um valor booleano que indica se a aresta existe no grafo.
+        '''
+        par = self.__separa_aresta(aresta)
+        if par is None:
+            return False
+
+        u, v = par
+        offsets, alvos, _ = self.__csr(True, com_pendentes=True)
+        if u < len(offsets) - 1 and v in alvos[offsets[u]:offsets[u + 1]]:
+            return True
+        destinos = self.__destinos
+        for i in self.__pendentes_saida.get(u, ()):
+            if destinos[i] == v:
+                return True
+        return False
+
+    def adicionaVertice(self, v):
+        '''
+        Adiciona um vértice no grafo caso o vértice seja válido e não exista outro vértice com o mesmo nome
+        :param v: O vértice a ser adicionado
+        :raises: VerticeInvalidoException se o vértice passado como parâmetro não puder ser adicionado
+        '''
+        if self.verticeValido(v) and not self.existeVertice(v):
+            self.__novo_vertice(v)
+        else:
+            raise VerticeInvalidoException('O vértice ' + v + ' é inválido')
+
+    def adicionaAresta(self, nome, a):
+        '''
+        Adiciona uma aresta no grafo caso a aresta seja válida. Como no Grafo, se já houver uma aresta com o mesmo nome,
+        ela é trocada pela nova
+        :param nome: O nome da aresta
+        :param a: A aresta a ser adicionada, no formato X-Y
+        :raises: ArestaInvalidaException se a aresta passada como parâmetro não puder ser adicionada
+        '''
+        par = self.__separa_aresta(a)
+        if par is None:
+            raise ArestaInvalidaException('A aresta ' + a + ' é inválida')
+        self.__nova_aresta(nome, par[0], par[1])
+
+    def vertices_nao_adjacentes(self):
+        '''
+        Fornece os pares X-Y de vértices que não são ligados por nenhuma aresta, em nenhum dos sentidos.
+        :return: Uma lista com os pares, na ordem de N
+        '''
+        n = len(self.__nomes)
+        ligados = set()
+        for u, v in zip(self.__origens, self.__destinos):
+            ligados.add(u * n + v)
+            ligados.add(v * n + u)
+
+        resultado = []
+        for u in range(n):
+            prefixo = self.__nomes[u] + GrafoCompacto.SEPARADOR_ARESTA
+            for v in range(n):
+                if u * n + v not in ligados:
+                    resultado.append(prefixo + self.__nomes[v])
+        return resultado
+
+    def ha_laco(self):
+        origens = self.__origens
+        destinos = self.__destinos
+        for i in range(len(origens)):
+            if origens[i] == destinos[i]:
+                return True
+        return False
+
+    def ha_paralelas(self):
+        '''
+        Verifica se existem duas arestas X-Y iguais, na mesma orientação.
+        :return: Um valor booleano que indica se há arestas paralelas
+        '''
+        n = len(self.__nomes)
+        pares = set()
+        for u, v in zip(self.__origens, self.__destinos):
+            chave = u * n + v
+            if chave in pares:
+                return True
+            pares.add(chave)
+        return False
+
+    def grau(self, vertice):
+        '''
+        Fornece o grau de um vértice. Cada laço conta uma única vez.
+        :param vertice: O vértice a ser analisado
+        :return: A quantidade de arestas que incidem sobre o vértice
+        '''
+        i = self.__ids.get(vertice)
+        if i is None:
+            return 0
+        return self.__graus[i]
+
+    def arestas_sobre_vertice(self, vertice):
+        '''
+        Fornece os nomes das arestas que incidem sobre um vértice, na ordem em que foram adicionadas.
+        :param vertice: O vértice a ser analisado
+        :return: Uma lista com os nomes das arestas
+        '''
+        i = self.__ids.get(vertice)
+        if i is None:
+            return []
+
+        offsets, _, arestas = self.__csr(False, com_pendentes=True)
+        resultado = []
+        if i < len(offsets) - 1:
+            resultado = [self.__nome_aresta(a) for a in arestas[offsets[i]:offsets[i + 1]]]
+        for a in self.__pendentes_incidencia.get(i, ()):
+            resultado.append(self.__nome_aresta(a))
+        return resultado
+
+    def eh_completo(self):
+        n = len(self.__nomes)
+        if n <= 2:
+            return True
+
+        necessarias = n * (n - 1) // 2
+        if len(self.__origens) != necessarias:
+            return False
+
+        pares = set()
+        for u, v in zip(self.__origens, self.__destinos):
+            if u != v:
+                pares.add(u * n + v if u < v else v * n + u)
+        return len(pares) == necessarias
+
+    def DFS(self, verticie, visitados):
+        '''
+        Busca em profundidade seguindo as arestas no sentido X -> Y, a partir de um vértice.
+        O resultado intercala os vértices visitados com os nomes das arestas usadas para chegar a eles.
+        :param verticie: O vértice inicial
+        :param visitados: Uma lista onde o resultado é acumulado
+        :return: A lista visitados
+        '''
+        offsets, alvos, arestas = self.__csr(True)
+        visitado = bytearray(len(self.__nomes))
+        for v in visitados:
+            i = self.__ids.get(v)
+            if i is not None:
+                visitado[i] = 1
+
+        inicio = self.__ids[verticie]
+        visitado[inicio] = 1
+        visitados.append(verticie)
+
+        # Cada item da pilha é (vértice, posição da próxima aresta a ser analisada)
+        pilha = [[inicio, offsets[inicio]]]
+        while pilha:
+            topo = pilha[-1]
+            u, k = topo
+            if k == offsets[u + 1]:
+                pilha.pop()
+                continue
+
+            topo[1] = k + 1
+            v = alvos[k]
+            if not visitado[v]:
+                visitado[v] = 1
+                visitados.append(self.__nome_aresta(arestas[k]))
+                visitados.append(self.__nomes[v])
+                pilha.append([v, offsets[v]])
+
+        return visitados
+
+    def dijkstra(self, origem, destino):
+        '''
+        Menor caminho entre dois vértices seguindo as arestas no sentido X -> Y, com peso 1 em cada aresta.
+        :param origem: O vértice de partida
+        :param destino: O vértice de chegada
+        :return: Uma tupla (quantidade de vértices do caminho, lista de vértices do caminho) ou False se não houver caminho
+        '''
+        offsets, alvos, _ = self.__csr(True)
+        n = len(self.__nomes)
+
+        s = self.__ids[origem]
+        t = self.__ids[destino]
+
+        beta = [-1] * n
+        pi = array('i', [-1]) * n
+        fechado = bytearray(n)
+
+        beta[s] = 0
+        fila = [(0, s)]
+        while fila:
+            b, w = heapq.heappop(fila)
+            if fechado[w]:
+                continue
+            fechado[w] = 1
+            if w == t:
+                break
+
+            for k in range(offsets[w], offsets[w + 1]):
+                v = alvos[k]
+                if not fechado[v] and (beta[v] == -1 or beta[v] > b + 1):
+                    beta[v] = b + 1
+                    pi[v] = w
+                    heapq.heappush(fila, (b + 1, v))
+
+        if not fechado[t]:
+            return False
+
+        resultado = []
+        atual = t
+        while atual != s:
+            resultado.append(self.__nomes[atual])
+            atual = pi[atual]
+        resultado.append(origem)
+
+        return len(resultado), resultado[::-1]
+
+    def dijkstraDrone(self, origem, destino, cargaAtual, pontosDeRecarga):
+        '''
+        Menor caminho de um drone entre dois vértices, que só pode percorrer cargaAtual arestas antes de passar por um
+        ponto de recarga, onde a carga volta a ser 5. Segue o mesmo algoritmo do Grafo: monta um grafo entre a origem,
+        os pontos de recarga e o destino e liga dois deles quando o menor caminho entre eles cabe na carga.
+        :param origem: O vértice de partida
+        :param destino: O vértice de chegada
+        :param cargaAtual: A carga inicial do drone, em arestas
+        :param pontosDeRecarga: Os vértices de recarga. Assim como no Grafo, a lista recebe a origem e o destino.
+        :return: A lista de vértices do caminho ou uma mensagem se não houver caminho
+        '''
+        inicial = origem
+        pontosDeRecarga.insert(0, origem)
+        pontosDeRecarga.append(destino)
+
+        possibilidades = {}
+
+        for i in range(len(pontosDeRecarga)):
+            for j in range(len(pontosDeRecarga)):
+                if origem == pontosDeRecarga[j]:
+                    continue
+                caminho = self.dijkstra(origem, pontosDeRecarga[j])
+                if caminho == False:
+                    continue
+                if caminho[0] <= cargaAtual:
+                    possibilidades['a' + str(i + j)] = origem + GrafoCompacto.SEPARADOR_ARESTA + pontosDeRecarga[j]
+            origem = pontosDeRecarga[i]
+            if i > 0:
+                cargaAtual = 5
+
+        lista = GrafoCompacto(pontosDeRecarga, possibilidades).dijkstra(inicial, destino)
+
+        if lista == False:
+            return "Não há caminhos possíveis !!"
+
+        Final = []
+        for i in range(len(lista[1]) - 1):
+            for v in self.dijkstra(lista[1][i], lista[1][i + 1])[1]:
+                if v not in Final:
+                    Final.append(v)
+
+        return Final
+
+    def __str__(self):
+        '''
+        Fornece uma representação do tipo String do grafo.
+        O String contém um sequência dos vértices separados por vírgula, seguido de uma sequência das arestas no formato padrão.
+        :return: Uma string que representa o grafo
+        '''
+        arestas = (self.__aresta_str(i) for i in range(len(self.__origens)))
+        return ", ".join(self.__nomes) + '\n' + ", ".join(arestas)
@@ -0,0 +1,150 @@
+import unittest
+from grafo import Grafo, VerticeInvalidoException, ArestaInvalidaException
+from grafo_compacto import GrafoCompacto
+
+class TestGrafoCompacto(unittest.TestCase):
+
+    def setUp(self):
+        # Grafos do main.py
+        self.vertices_teste = ["A", "B", "C", "D", "E"]
+        self.arestas_teste = {'a1':'A-B', 'a2':'A-C', 'a4':'B-D', 'a5':'D-C', 'a6':'E-D', 'a7':'E-C'}
+
+        self.vertices_drone = ["A", "B", "C", "D", "E", "F", "G", "H", "I", "J", "K", "L", "M", "N", "O", "P", "Q", "R",
+                               "S", "T", "U", "V", "W", "X", "Y", "Z", "1", "2", "3", "4", "5", "6", "7"]
+        self.arestas_drone = {'a1':"A-B", 'a2':"A-C", 'a3':"A-D", 'a4':"B-H", 'a5':"B-I", 'a6':"C-F", 'a7':"D-C", 'a8':"D-E",
+                              'a9':"H-G", 'a10':"G-B", 'a11':"G-J", 'a12':"F-G", 'a13':"F-J", 'a14':"F-K", 'a15':"E-F",
+                              'a16':"E-L", 'a17':"I-P", 'a18':"J-I", 'a19':"J-O", 'a20':"K-N", 'a21':"L-M", 'a22':"M-Q",
+                              'a23':"N-R", 'a24':"O-R", 'a25':"O-Q", 'a26':"O-5", 'a27':"P-T", 'a28':"P-R", 'a29':"T-U",
+                              'a30':"5-T", 'a31':"5-Y", 'a32':"Q-R", 'a33':"R-5", 'a34':"U-7", 'a35':"U-W", 'a36':"Y-W",
+                              'a37':"Y-2", 'a38':"Y-X", 'a39':"X-R", 'a40':"R-Y", 'a41':"X-4", 'a42':"Y-1", 'a43':"Y-Z",
+                              'a44':"1-3", 'a45':"3-4", 'a46':"7-6", 'a47':"6-3", 'a48':"3-S"}
+
+        # Grafo com laço, arestas paralelas e nomes fora do padrão
+        self.vertices_laco = ['A', 'B', 'C']
+        self.arestas_laco = {'a1':'A-A', 'x':'A-B', 'a3':'A-B', 'a2':'C-B'}
+
+        self.pares = [
+            (Grafo(self.vertices_teste, self.arestas_teste), GrafoCompacto(self.vertices_teste, self.arestas_teste)),
+            (Grafo(self.vertices_drone, self.arestas_drone), GrafoCompacto(self.vertices_drone, self.arestas_drone)),
+            (Grafo(self.vertices_laco, self.arestas_laco), GrafoCompacto(self.vertices_laco, self.arestas_laco)),
+            (Grafo(['J']), GrafoCompacto(['J'])),
+        ]
+
+    def test_vertices_e_arestas(self):
+        for g, c in self.pares:
+            self.assertEqual(c.N, g.N)
+            self.assertEqual(c.A, g.A)
+            self.assertEqual(list(c.A), list(g.A))
+            self.assertEqual(str(c), str(g))
+            for k in g.A:
+                self.assertEqual(c.A[k], g.A[k])
+            for v in g.N:
+                self.assertTrue(c.existeVertice(v))
+                for w in g.N:
+                    self.assertEqual(c.existeAresta(v + '-' + w), g.existeAresta(v + '-' + w))
+
+        c = self.pares[2][1]
+        self.assertNotIn('a2', GrafoCompacto(['A'], {'a1': 'A-A'}).A)
+        self.assertEqual(c.A['a2'], 'C-B')
+        self.assertRaises(KeyError, lambda: c.A['a4'])
+        self.assertFalse(c.existeVertice('X'))
+
+    def test_metodos(self):
+        for g, c in self.pares:
+            self.assertEqual(c.vertices_nao_adjacentes(), g.vertices_nao_adjacentes())
+            self.assertEqual(c.ha_laco(), g.ha_laco())
+            self.assertEqual(c.ha_paralelas(), g.ha_paralelas())
+            self.assertEqual(c.eh_completo(), g.eh_completo())
+            for v in g.N:
+                self.assertEqual(c.grau(v), g.grau(v))
+                self.assertEqual(sorted(c.arestas_sobre_vertice(v)), sorted(g.arestas_sobre_vertice(v)))
+                self.assertEqual(c.DFS(v, []), g.DFS(v, []))
+
+    def test_dijkstra(self):
+        for g, c in self.pares:
+            for v in g.N:
+                for w in g.N:
+                    self.assertEqual(c.dijkstra(v, w), g.dijkstra(v, w))
+
+        g, c = self.pares[1]
+        for carga in (5, 3, 1):
+            self.assertEqual(c.dijkstraDrone('A', 'S', carga, ['L', 'R', 'U', '6']),
+                             g.dijkstraDrone('A', 'S', carga, ['L', 'R', 'U', '6']))
+
+    def test_alteracoes(self):
+        g = Grafo(list(self.vertices_teste), dict(self.arestas_teste))
+        c = GrafoCompacto(self.vertices_teste, self.arestas_teste)
+        arestas = c.A
+        for nome, a in [('a3', 'C-E'), ('a8', 'B-B')]:
+            g.adicionaAresta(nome, a)
+            c.adicionaAresta(nome, a)
+        g.adicionaVertice('F')
+        c.adicionaVertice('F')
+
+        # A visão das arestas acompanha o grafo
+        self.assertEqual(arestas, g.A)
+        self.assertEqual(c.vertices_nao_adjacentes(), g.vertices_nao_adjacentes())
+        self.assertEqual(c.DFS('A', []), g.DFS('A', []))
+
+        self.assertRaises(ArestaInvalidaException, c.adicionaAresta, 'a9', 'A-X')
+        self.assertRaises(VerticeInvalidoException, c.adicionaVertice, 'A')
+
+        # Um nome repetido troca a aresta, como no Grafo
+        for nome, a in [('a1', 'A-C'), ('a8', 'F-A'), ('a3', 'C-C')]:
+            g.adicionaAresta(nome, a)
+            c.adicionaAresta(nome, a)
+            self.assertEqual(list(c.A.items()), list(g.A.items()))
+            for v in g.N:
+                self.assertEqual(c.grau(v), g.grau(v))
+                self.assertEqual(c.arestas_sobre_vertice(v), g.arestas_sobre_vertice(v))
+                self.assertEqual(c.DFS(v, []), g.DFS(v, []))
+
+        # Nomes que valem False também são guardados
+        c = GrafoCompacto(['A', 'B'], {'': 'A-B', 0: 'B-A'})
+        self.assertEqual(list(c.A), ['', 0])
+        self.assertEqual(c.arestas_sobre_vertice('A'), ['', 0])
+
+    def test_inclusoes_intercaladas(self):
+        g = Grafo(['v0'])
+        c = GrafoCompacto(['v0'])
+        c.DFS('v0', [])
+        c.arestas_sobre_vertice('v0')
+        montagens = []
+        for i in range(1, 300):
+            v = 'v' + str(i)
+            g.adicionaVertice(v)
+            c.adicionaVertice(v)
+            a = 'v' + str(i // 2) + '-' + v
+            g.adicionaAresta('a' + str(i), a)
+            c.adicionaAresta('a' + str(i), a)
+            self.assertTrue(c.existeAresta(a))
+            self.assertFalse(c.existeAresta(v + '-v' + str(i // 2)))
+            self.assertEqual(c.arestas_sobre_vertice(v), g.arestas_sobre_vertice(v))
+            self.assertEqual(c.arestas_sobre_vertice('v' + str(i // 2)), g.arestas_sobre_vertice('v' + str(i // 2)))
+            csr = c._GrafoCompacto__csr_saida
+            if not montagens or montagens[-1] is not csr:
+                montagens.append(csr)
+
+        # O CSR só é remontado quando as arestas pendentes passam das já montadas
+        self.assertLess(len(montagens), 12)
+        self.assertEqual(c.DFS('v0', []), g.DFS('v0', []))
+
+    def test_eh_completo(self):
+        g = Grafo(['A', 'B', 'C'], {'a1':'A-B', 'a2':'C-B'})
+        c = GrafoCompacto(['A', 'B', 'C'], {'a1':'A-B', 'a2':'C-B'})
+        self.assertFalse(g.eh_completo())
+        self.assertFalse(c.eh_completo())
+        g.adicionaAresta('a3', 'A-C')
+        c.adicionaAresta('a3', 'A-C')
+        self.assertTrue(g.eh_completo())
+        self.assertTrue(c.eh_completo())
+        g.adicionaAresta('a4', 'B-A')
+        c.adicionaAresta('a4', 'B-A')
+        self.assertFalse(g.eh_completo())
+        self.assertFalse(c.eh_completo())
+
+        # O Grafo também acompanha a troca de uma aresta e as alterações feitas diretamente em A
+        g.adicionaAresta('a4', 'A-A')
+        self.assertFalse(g.eh_completo())
+        del g.A['a4']
+        self.assertTrue(g.eh_completo())
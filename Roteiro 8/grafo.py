@@ -1,4 +1,6 @@
 import time
+from contextlib import contextmanager
+from types import MappingProxyType
 
 
 class VerticeInvalidoException(Exception):
@@ -9,28 +11,99 @@ class ArestaInvalidaException(Exception):
     pass
 
 
+class GrafoCongeladoException(Exception):
+    pass
+
+
+@contextmanager
+def _abre_arquivo(arquivo, modo):
+    '''
+    Abre o arquivo se for passado um caminho. Se já for um objeto de arquivo, ele é usado como está e não é fechado.
+    '''
+    if hasattr(arquivo, 'read') or hasattr(arquivo, 'write'):
+        yield arquivo
+    else:
+        with open(arquivo, modo, encoding='utf-8') as f:
+            yield f
+
+
 class Grafo:
     QTDE_MAX_SEPARADOR = 1
     SEPARADOR_ARESTA = '-'
 
-    def __init__(self, N=[], A={}):
+    def __init__(self, N=None, A=None):
         '''
         Constrói um objeto do tipo Grafo. Se nenhum parâmetro for passado, cria um Grafo vazio.
         Se houver alguma aresta ou algum vértice inválido, uma exceção é lançada.
         :param N: Uma lista dos vértices (ou nodos) do grafo.
         :param V: Uma dicionário que guarda as arestas do grafo. A chave representa o nome da aresta e o valor é uma string que contém dois vértices separados por um traço.
         '''
+
+        if N == None:
+            N = list()
+        if A == None:
+            A = dict()
+
         for v in N:
             if not (Grafo.verticeValido(v)):
                 raise VerticeInvalidoException('O vértice ' + v + ' é inválido')
 
-        self.N = N
+        self.N = list(N)
 
         # for a in A:
         #     if not (self.arestaValida(A[a])):
         #         raise ArestaInvalidaException('A aresta ' + A[a] + ' é inválida')
 
-        self.A = A
+        self.A = dict(A)
+
+        # Contador de eh_completo(), feito sob demanda: [tamanhos de N e A na última contagem, quantidade de pares
+        # {X, Y} com X != Y ligados]. Fica em uma lista para que um GrafoCongelado, que não aceita atribuições,
+        # também possa refazer a contagem.
+        self.__pares = [None, 0]
+
+        # Indica se N e A são compartilhados com um grafo congelado ou derivado e precisam ser copiados antes de alterar
+        self.__compartilhado = False
+
+    @classmethod
+    def _compartilhando(cls, N, A):
+        '''
+        Cria um grafo que usa as listas de vértices e arestas passadas sem copiá-las.
+        A cópia só é feita se o grafo criado for alterado.
+        '''
+        g = cls.__new__(cls)
+        g.N = N
+        g.A = A
+        g.__pares = [None, 0]
+        g.__compartilhado = True
+        return g
+
+    def __antes_de_alterar(self):
+        '''
+        Copia os vértices e as arestas se eles ainda forem compartilhados, para que a alteração não seja vista
+        pelos grafos congelados ou derivados deste.
+        '''
+        if self.__compartilhado:
+            self.N = list(self.N)
+            self.A = dict(self.A)
+            self.__compartilhado = False
+
+    def freeze(self):
+        '''
+        Fornece uma cópia imutável do grafo no estado atual. As arestas não são copiadas: o grafo congelado usa o mesmo
+        dicionário e o grafo original só faz uma cópia se for alterado depois, por meio dos seus métodos.
+        :return: Um GrafoCongelado com os vértices e as arestas atuais
+        '''
+        self.__compartilhado = True
+        return GrafoCongelado._congelando(tuple(self.N), self.A)
+
+    def derivar(self):
+        '''
+        Fornece um novo grafo, que pode ser alterado, com os mesmos vértices e arestas deste.
+        Os dois grafos compartilham as arestas até que um deles seja alterado (cópia na escrita).
+        :return: Um Grafo independente deste
+        '''
+        self.__compartilhado = True
+        return Grafo._compartilhando(self.N, self.A)
 
     def arestaValida(self, aresta=''):
         '''
@@ -100,18 +173,31 @@ class Grafo:
         :raises: VerticeInvalidoException se o vértice passado como parâmetro não puder ser adicionado
         '''
         if self.verticeValido(v) and not self.existeVertice(v):
+            self.__antes_de_alterar()
+            em_dia = self.__pares[0] == (len(self.N), len(self.A))
             self.N.append(v)
+            self.__pares[0] = (len(self.N), len(self.A)) if em_dia else None
         else:
             raise VerticeInvalidoException('O vértice ' + v + ' é inválido')
 
     def adicionaAresta(self, nome, a):
         '''
         Adiciona uma aresta no Grafo caso a aresta seja válida e não exista outra aresta com o mesmo nome
+        :param nome: A chave da aresta em A, que neste grafo é a própria aresta X-Y
         :param v: A aresta a ser adicionada
         :raises: ArestaInvalidaException se a aresta passada como parâmetro não puder ser adicionada
         '''
+        if not self.arestaValida(nome):
+            raise ArestaInvalidaException('A aresta ' + str(nome) + ' é inválida')
         if self.arestaValida(a):
+            self.__antes_de_alterar()
+            em_dia = self.__pares[0] == (len(self.N), len(self.A))
+            if em_dia and nome not in self.A:
+                v1, v2 = nome.split(self.SEPARADOR_ARESTA)
+                if v1 != v2 and v2 + self.SEPARADOR_ARESTA + v1 not in self.A:
+                    self.__pares[1] += 1
             self.A[nome] = a
+            self.__pares[0] = (len(self.N), len(self.A)) if em_dia else None
         else:
             ArestaInvalidaException('A aresta ' + self.A[a] + ' é inválida')
 
@@ -166,33 +252,37 @@ class Grafo:
                 arestas_final.append(i)
         return arestas_final
 
-    def eh_completo(self):
-        arestas = list(self.A.values())
+    def __conta_pares(self):
+        '''
+        Refaz, em O(E), a contagem de pares de vértices distintos ligados por alguma aresta.
+        '''
+        pares = set()
+        for a in self.A:
+            v1, v2 = a.split(self.SEPARADOR_ARESTA)
+            if v1 != v2:
+                pares.add((v1, v2) if v1 < v2 else (v2, v1))
+        self.__pares[0] = (len(self.N), len(self.A))
+        self.__pares[1] = len(pares)
 
+    def eh_completo(self):
+        '''
+        Verifica se o grafo é completo: todo par de vértices distintos deve estar ligado por exatamente uma aresta,
+        sem laços. A primeira chamada faz a contagem em O(E); depois ela é mantida por adicionaAresta(). Uma alteração
+        direta em N ou A só é percebida se mudar os seus tamanhos.
+        :return: Um valor booleano que indica se o grafo é completo
+        '''
         verticies = self.N
 
-        lista_completo = []
-
         if len(verticies) == 1:
             return True
         elif len(verticies) == 2:
             return True
 
-        for i in range(len(verticies)):
-            for j in range(i + 1, len(verticies)):
-                lista_completo.append("{}{}{}".format(verticies[i], self.SEPARADOR_ARESTA, verticies[j]))
+        if self.__pares[0] != (len(self.N), len(self.A)):
+            self.__conta_pares()
 
-        if len(lista_completo) != len(arestas):
-            return False
-        else:
-            for i in range(len(lista_completo)):
-                v1, v2 = lista_completo[i].split("-")
-                if (lista_completo[i] not in arestas):
-                    if "{}{}{}".format(v2, self.SEPARADOR_ARESTA, v1) not in arestas:
-                        return False
-                    continue
-
-            return True
+        necessarias = len(verticies) * (len(verticies) - 1) // 2
+        return len(self.A) == necessarias and self.__pares[1] == necessarias
 
     def DFS(self, verticie, visitados):
 
@@ -485,7 +575,8 @@ class Grafo:
 
         print("Algoritimo de PRIM")
         verticesOriginais = self.N
-        arestasOriginais = self.A
+        # As arestas escolhidas são retiradas de uma cópia, para não alterar o grafo
+        arestasOriginais = dict(self.A)
 
         verticesVerificados = []
         arestasSelecionadas = {}
@@ -556,24 +647,135 @@ class Grafo:
 
 
 
+    @classmethod
+    def carregar(cls, arquivo):
+        '''
+        Constrói um grafo ponderado a partir de um arquivo texto com uma lista de arestas, lido linha a linha.
+        Formato de cada linha:
+          X          declara o vértice X (útil para vértices isolados e para fixar a ordem dos vértices)
+          X-Y        uma aresta com peso 1
+          X-Y peso   uma aresta com o peso indicado (inteiro ou decimal)
+        Linhas vazias ou começadas por # são ignoradas. Vértices que aparecem apenas em arestas são incluídos
+        automaticamente, na ordem em que aparecem. Cada linha é incluída direto no grafo, sem montar antes um
+        dicionário de arestas que o construtor copiaria de novo.
+        :param arquivo: O caminho do arquivo ou um objeto de arquivo aberto para leitura
+        :return: O Grafo lido
+        :raises: ArestaInvalidaException se alguma linha não estiver no formato ou se uma aresta X-Y se repetir
+        '''
+        # Um GrafoCongelado não aceita inclusões: ele é montado como Grafo e congelado no fim, sem copiar as arestas
+        congelar = issubclass(cls, GrafoCongelado)
+        g = Grafo() if congelar else cls()
+        vistos = set()
+
+        with _abre_arquivo(arquivo, 'r') as f:
+            for num_linha, linha in enumerate(f, 1):
+                campos = linha.split()
+                if not campos or campos[0].startswith('#'):
+                    continue
+
+                if len(campos) == 1 and cls.SEPARADOR_ARESTA not in campos[0]:
+                    v = campos[0]
+                    if v not in vistos:
+                        vistos.add(v)
+                        g.N.append(v)
+                    continue
+
+                if len(campos) > 2:
+                    raise ArestaInvalidaException('Linha {} inválida: {}'.format(num_linha, linha.strip()))
+
+                aresta = campos[0]
+                partes = aresta.split(cls.SEPARADOR_ARESTA)
+                if len(partes) != cls.QTDE_MAX_SEPARADOR + 1 or '' in partes:
+                    raise ArestaInvalidaException('A aresta {} é inválida (linha {})'.format(aresta, num_linha))
+
+                peso = 1
+                if len(campos) == 2:
+                    try:
+                        peso = int(campos[1])
+                    except ValueError:
+                        try:
+                            peso = float(campos[1])
+                        except ValueError:
+                            raise ArestaInvalidaException('O peso {} é inválido (linha {})'.format(campos[1], num_linha))
+
+                if aresta in g.A:
+                    raise ArestaInvalidaException('A aresta {} já existe (linha {})'.format(aresta, num_linha))
+                for v in partes:
+                    if v not in vistos:
+                        vistos.add(v)
+                        g.N.append(v)
+                g.A[aresta] = peso
+
+        return g.freeze() if congelar else g
+
+    def salvar(self, arquivo):
+        '''
+        Grava o grafo no formato lido por carregar(), uma linha por vez, sem montar o texto inteiro em memória.
+        Primeiro são gravados todos os vértices, na ordem de N, e depois as arestas com os seus pesos.
+        :param arquivo: O caminho do arquivo ou um objeto de arquivo aberto para escrita
+        '''
+        with _abre_arquivo(arquivo, 'w') as f:
+            for v in self.N:
+                f.write(v + '\n')
+            for aresta in self.A:
+                f.write(aresta + ' ' + str(self.A[aresta]) + '\n')
+
     def __str__(self):
         '''
         Fornece uma representação do tipo String do grafo.
         O String contém um sequência dos vértices separados por vírgula, seguido de uma sequência das arestas no formato padrão.
         :return: Uma string que representa o grafo
         '''
-        grafo_str = ''
+        return ", ".join(self.N) + '\n' + ", ".join(self.A)
 
-        for v in range(len(self.N)):
-            grafo_str += self.N[v]
-            if v < (len(self.N) - 1):  # Só coloca a vírgula se não for o último vértice
-                grafo_str += ", "
 
-        grafo_str += '\n'
+class GrafoCongelado(Grafo):
+    '''
+    Grafo imutável, obtido com Grafo.freeze(). Os vértices ficam em uma tupla e as arestas são expostas como um
+    dicionário somente leitura, que pode ser compartilhado com outros grafos. Todas as consultas e algoritmos
+    de Grafo funcionam normalmente; qualquer tentativa de alteração lança GrafoCongeladoException.
+    '''
 
-        for i, a in enumerate(self.A):
-            grafo_str += self.A[a]
-            if not (i == len(self.A) - 1):  # Só coloca a vírgula se não for a última aresta
-                grafo_str += ", "
+    def __init__(self, N=None, A=None):
+        '''
+        Constrói um grafo congelado com cópias dos vértices e arestas passados.
+        '''
+        g = Grafo(N, A)
+        object.__setattr__(self, 'N', tuple(g.N))
+        object.__setattr__(self, '_GrafoCongelado__arestas', g.A)
+        object.__setattr__(self, 'A', MappingProxyType(g.A))
+        object.__setattr__(self, '_Grafo__pares', [None, 0])
+
+    @classmethod
+    def _congelando(cls, N, A):
+        g = cls.__new__(cls)
+        object.__setattr__(g, 'N', N)
+        object.__setattr__(g, '_GrafoCongelado__arestas', A)
+        object.__setattr__(g, 'A', MappingProxyType(A))
+        object.__setattr__(g, '_Grafo__pares', [None, 0])
+        return g
+
+    def __setattr__(self, nome, valor):
+        raise GrafoCongeladoException('O grafo congelado não pode ser alterado')
+
+    def __delattr__(self, nome):
+        raise GrafoCongeladoException('O grafo congelado não pode ser alterado')
+
+    def adicionaVertice(self, v):
+        raise GrafoCongeladoException('O grafo congelado não pode ser alterado')
 
-        return grafo_str
+    def adicionaAresta(self, nome, a):
+        raise GrafoCongeladoException('O grafo congelado não pode ser alterado')
+
+    def freeze(self):
+        '''
+        Um grafo congelado já é imutável, então é devolvido ele mesmo.
+        '''
+        return self
+
+    def derivar(self):
+        '''
+        Fornece um Grafo que pode ser alterado, compartilhando as arestas deste até a primeira alteração.
+        :return: Um Grafo com os mesmos vértices e arestas
+        '''
+        return Grafo._compartilhando(list(self.N), self.__arestas)
@@ -0,0 +1,160 @@
+import io
+import unittest
+from contextlib import redirect_stdout
+from grafo import ArestaInvalidaException, Grafo, GrafoCongelado, GrafoCongeladoException
+
+
+def saida(metodo):
+    '''
+    Executa um método que imprime o seu resultado e devolve o texto impresso.
+    '''
+    texto = io.StringIO()
+    with redirect_stdout(texto):
+        metodo()
+    return texto.getvalue()
+
+
+class TestGrafo(unittest.TestCase):
+
+    def setUp(self):
+        # Grafos do main.py
+        self.g_google = Grafo(["A", "B", "C", "D", "E", "F", "G"], {'A-B': 1, 'A-C': 4, 'B-F': 2, 'C-G': 2, 'G-F': 1, 'F-E': 2, 'D-E': 3, 'D-G': 4})
+        self.g_professor1 = Grafo(["A", "B", "C", "D", "E", "F", "G"], {'A-G': 1, 'A-B': 5, 'B-C': 4, 'D-B': 3, 'C-G': 2, 'D-F': 2, 'F-E': 2, 'E-B': 2, "G-F": 1})
+        self.g_professor2 = Grafo(["A", "B", "C", "D", "E", "F"], {'A-C': 2, 'A-E': 3, 'B-C': 5, 'D-B': 2, 'C-D': 1, 'B-F': 3, 'F-E': 7, 'E-D': 4})
+        self.g_triangulo = Grafo(['A', 'B', 'C'], {'A-B': 1, 'C-B': 2})
+
+    def test_eh_completo(self):
+        self.assertFalse(self.g_google.eh_completo())
+        self.assertFalse(self.g_triangulo.eh_completo())
+
+        # Nas arestas deste roteiro, a chave é a aresta X-Y
+        self.g_triangulo.adicionaAresta('A-C', 'A-C')
+        self.assertTrue(self.g_triangulo.eh_completo())
+        self.g_triangulo.adicionaAresta('A-C', 'A-C')
+        self.assertTrue(self.g_triangulo.eh_completo())
+        self.g_triangulo.adicionaAresta('C-A', 'C-A')
+        self.assertFalse(self.g_triangulo.eh_completo())
+
+        # Alterações feitas diretamente em N e A são percebidas quando mudam os seus tamanhos
+        del self.g_triangulo.A['A-C']
+        self.assertTrue(self.g_triangulo.eh_completo())
+        self.g_triangulo.N.append('D')
+        self.g_triangulo.adicionaAresta('D-A', 'D-A')
+        self.assertFalse(self.g_triangulo.eh_completo())
+
+        # A chave tem que ser uma aresta válida, e nada é alterado se não for
+        g = Grafo(['A', 'B', 'C'], {'A-B': 1})
+        self.assertFalse(g.eh_completo())
+        self.assertRaises(ArestaInvalidaException, g.adicionaAresta, 'x', 'B-C')
+        self.assertRaises(ArestaInvalidaException, g.adicionaAresta, 'B-Z', 'B-C')
+        self.assertEqual(g.A, {'A-B': 1})
+        g.adicionaAresta('B-C', 'B-C')
+        g.adicionaAresta('C-A', 'C-A')
+        self.assertTrue(g.eh_completo())
+
+        # Grafos congelados e derivados têm os seus próprios contadores
+        g = Grafo(['A', 'B', 'C'], {'A-B': 1, 'B-C': 2, 'C-A': 3})
+        congelado = g.freeze()
+        derivado = g.derivar()
+        derivado.adicionaVertice('D')
+        self.assertTrue(congelado.eh_completo())
+        self.assertTrue(GrafoCongelado(['A', 'B', 'C'], {'A-B': 1, 'B-C': 2, 'C-A': 3}).eh_completo())
+        self.assertFalse(derivado.eh_completo())
+        self.assertTrue(g.eh_completo())
+
+    def test_congelado_nao_muda(self):
+        congelado = self.g_google.freeze()
+        self.assertIsInstance(congelado, GrafoCongelado)
+        self.assertIs(congelado.freeze(), congelado)
+        self.assertRaises(GrafoCongeladoException, congelado.adicionaVertice, 'H')
+        self.assertRaises(GrafoCongeladoException, congelado.adicionaAresta, 'A-D', 'A-D')
+        self.assertRaises(GrafoCongeladoException, setattr, congelado, 'N', [])
+        self.assertRaises(GrafoCongeladoException, delattr, congelado, 'A')
+        with self.assertRaises(TypeError):
+            congelado.A['A-D'] = 1
+        with self.assertRaises(AttributeError):
+            congelado.N.append('H')
+
+        # O grafo original continua podendo ser alterado, sem que o congelado perceba
+        self.g_google.adicionaVertice('H')
+        self.g_google.adicionaAresta('H-A', 'H-A')
+        self.assertEqual(congelado.N, ('A', 'B', 'C', 'D', 'E', 'F', 'G'))
+        self.assertNotIn('H-A', congelado.A)
+        self.assertEqual(len(congelado.A), 8)
+
+    def test_derivar(self):
+        derivado = self.g_google.derivar()
+        self.assertIs(derivado.A, self.g_google.A)
+        self.assertIs(derivado.N, self.g_google.N)
+
+        # A primeira alteração faz a cópia e o grafo original não muda mais
+        derivado.adicionaAresta('A-D', 'A-D')
+        self.assertIsNot(derivado.A, self.g_google.A)
+        self.assertIn('A-D', derivado.A)
+        self.assertNotIn('A-D', self.g_google.A)
+        derivado.adicionaVertice('H')
+        self.assertNotIn('H', self.g_google.N)
+
+        # Alterar o original depois de derivar também não afeta o derivado
+        outro = self.g_google.derivar()
+        self.g_google.adicionaVertice('I')
+        self.assertNotIn('I', outro.N)
+        self.assertEqual(len(outro.A), 8)
+
+        # Um grafo derivado de um congelado pode ser alterado
+        congelado = self.g_google.freeze()
+        derivado = congelado.derivar()
+        derivado.adicionaVertice('J')
+        self.assertIn('J', derivado.N)
+        self.assertNotIn('J', congelado.N)
+
+    def test_arvore_geradora_congelado(self):
+        for g in (self.g_google, self.g_professor1, self.g_professor2):
+            congelado = g.freeze()
+            self.assertEqual(saida(congelado.algoritimo_de_PRIM), saida(g.algoritimo_de_PRIM))
+            self.assertEqual(saida(congelado.algoritmo_de_KRUSKAL), saida(g.algoritmo_de_KRUSKAL))
+            self.assertEqual(saida(g.derivar().algoritimo_de_PRIM), saida(g.algoritimo_de_PRIM))
+            self.assertEqual(dict(congelado.A), g.A)
+
+        self.assertEqual(saida(self.g_google.freeze().algoritimo_de_PRIM),
+                         "Algoritimo de PRIM\n{'A-B': 1, 'G-F': 1, 'B-F': 2, 'C-G': 2, 'F-E': 2, 'D-E': 3}\n")
+
+    def test_carregar_e_salvar(self):
+        arquivo = io.StringIO()
+        self.g_google.salvar(arquivo)
+        arquivo.seek(0)
+        g = Grafo.carregar(arquivo)
+        self.assertEqual(g.N, self.g_google.N)
+        self.assertEqual(g.A, self.g_google.A)
+
+        g = Grafo.carregar(io.StringIO('# Paraíba\nZ\nJ-C\n\nC-E 2.5\nE-J 3\n'))
+        self.assertEqual(g.N, ['Z', 'J', 'C', 'E'])
+        self.assertEqual(g.A, {'J-C': 1, 'C-E': 2.5, 'E-J': 3})
+        self.assertFalse(g.eh_completo())
+        g.adicionaAresta('Z-J', 'Z-J')
+        self.assertIn('Z-J', g.A)
+
+        self.assertRaises(ArestaInvalidaException, Grafo.carregar, io.StringIO('J-C-E\n'))
+        self.assertRaises(ArestaInvalidaException, Grafo.carregar, io.StringIO('J-C x\n'))
+
+        # Uma aresta repetida não sobrescreve o peso lido antes
+        self.assertRaises(ArestaInvalidaException, Grafo.carregar, io.StringIO('J-C 1\nC-E\nJ-C 5\n'))
+
+        # As arestas não passam pelo construtor, que faria uma segunda cópia delas
+        construtor = Grafo.__init__
+        arestas_no_construtor = []
+
+        def registra(grafo, N=None, A=None):
+            arestas_no_construtor.append(A)
+            construtor(grafo, N, A)
+
+        Grafo.__init__ = registra
+        try:
+            Grafo.carregar(io.StringIO('J-C 1\nC-E 2\n'))
+        finally:
+            Grafo.__init__ = construtor
+        self.assertEqual(arestas_no_construtor, [None])
+
+        congelado = GrafoCongelado.carregar(io.StringIO('J-C 1\nC-E 2\n'))
+        self.assertIsInstance(congelado, GrafoCongelado)
+        self.assertEqual(dict(congelado.A), {'J-C': 1, 'C-E': 2})
@@ -0,0 +1,267 @@
+'''
+Benchmark dos algoritmos dos roteiros em grafos aleatórios gerados a partir de uma semente.
+
+Cada roteiro é carregado direto do seu diretório, então o script pode ser executado a partir da raiz do repositório:
+
+    python benchmark.py --tamanhos 10 50 100 --densidade 0.1 --saida resultados.jsonl
+    python benchmark.py --comparar resultados.jsonl
+
+Cada medição é gravada como uma linha JSON, para que os resultados possam ser guardados e comparados entre versões.
+'''
+
+import argparse
+import contextlib
+import importlib.util
+import io
+import json
+import os
+import random
+import statistics
+import sys
+import time
+
+RAIZ = os.path.dirname(os.path.abspath(__file__))
+
+_modulos = {}
+
+
+def carrega_roteiro(numero, arquivo):
+    '''
+    Importa o módulo de um roteiro pelo caminho do arquivo, com um nome único, já que vários roteiros usam grafo.py.
+    '''
+    chave = (numero, arquivo)
+    if chave not in _modulos:
+        caminho = os.path.join(RAIZ, 'Roteiro {}'.format(numero), arquivo)
+        spec = importlib.util.spec_from_file_location('roteiro{}_{}'.format(numero, arquivo[:-3]), caminho)
+        modulo = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(modulo)
+        _modulos[chave] = modulo
+    return _modulos[chave]
+
+
+def gera_arestas(n, densidade, semente):
+    '''
+    Gera as arestas de um grafo conexo aleatório com n vértices.
+    Primeiro é sorteada uma árvore geradora e depois são acrescentados pares distintos até atingir a densidade pedida,
+    que é a fração dos n(n-1)/2 pares possíveis ligados por uma aresta. Densidades acima de 1 geram o grafo completo.
+    :return: Uma tupla (lista de vértices, lista de pares (i, j) com i != j)
+    '''
+    aleatorio = random.Random(semente)
+    vertices = ['v' + str(i) for i in range(n)]
+
+    ordem = list(range(n))
+    aleatorio.shuffle(ordem)
+    pares = []
+    usados = set()
+    for k in range(1, n):
+        i = ordem[k]
+        j = ordem[aleatorio.randrange(k)]
+        pares.append((j, i))
+        usados.add((min(i, j), max(i, j)))
+
+    maximo = n * (n - 1) // 2
+    alvo = min(maximo, max(n - 1, int(round(densidade * maximo))))
+    while len(pares) < alvo:
+        i = aleatorio.randrange(n)
+        j = aleatorio.randrange(n)
+        if i != j and (min(i, j), max(i, j)) not in usados:
+            usados.add((min(i, j), max(i, j)))
+            pares.append((i, j))
+
+    return vertices, pares
+
+
+def grafo_dicionario(numero, vertices, pares):
+    modulo = carrega_roteiro(numero, 'grafo.py')
+    A = {}
+    for k, (i, j) in enumerate(pares):
+        A['a' + str(k + 1)] = vertices[i] + '-' + vertices[j]
+    return modulo.Grafo(list(vertices), A)
+
+
+def grafo_ponderado(vertices, pares, semente):
+    modulo = carrega_roteiro(8, 'grafo.py')
+    aleatorio = random.Random(semente)
+    A = {}
+    for i, j in pares:
+        A[vertices[i] + '-' + vertices[j]] = aleatorio.randint(1, 10)
+    return modulo.Grafo(list(vertices), A)
+
+
+def grafo_matriz(numero, arquivo, vertices, pares, adiciona_aresta):
+    modulo = carrega_roteiro(numero, arquivo)
+    g = modulo.Grafo(list(vertices))
+    for i, j in pares:
+        getattr(g, adiciona_aresta)(vertices[i] + '-' + vertices[j])
+    return g
+
+
+def _silencioso(funcao):
+    '''
+    Executa uma função descartando o que ela imprimir (Kruskal e Prim imprimem o resultado).
+    '''
+    with contextlib.redirect_stdout(io.StringIO()):
+        return funcao()
+
+
+def _percorre_graus(g, vertices):
+    for v in vertices:
+        g.grau(v)
+
+
+def _consulta_arestas(g, vertices, pares):
+    for i, j in pares:
+        g.existeAresta(vertices[i] + '-' + vertices[j])
+        g.existeAresta(vertices[j] + '-' + vertices[i])
+
+
+# Cada benchmark: (algoritmo, roteiro, maior quantidade de vértices por padrão, preparação, execução).
+# A preparação não é cronometrada e é refeita a cada repetição, porque alguns algoritmos alteram o grafo.
+# conexo() responde pelo union-find montado no construtor, então o grafo é criado dentro da medição.
+BENCHMARKS = [
+    ('grau', 1, None,
+     lambda V, P, s: grafo_dicionario(1, V, P),
+     lambda g, V, P: _percorre_graus(g, V)),
+    ('existeAresta', 1, None,
+     lambda V, P, s: grafo_dicionario(1, V, P),
+     lambda g, V, P: _consulta_arestas(g, V, P)),
+    ('DFS', 2, None,
+     lambda V, P, s: grafo_dicionario(2, V, P),
+     lambda g, V, P: g.DFS(V[0], [])),
+    ('ha_ciclo', 3, None,
+     lambda V, P, s: grafo_dicionario(3, V, P),
+     lambda g, V, P: g.ha_ciclo()),
+    ('conexo', 3, None,
+     lambda V, P, s: None,
+     lambda g, V, P: grafo_dicionario(3, V, P).conexo()),
+    ('caminho_euleriano', 5, 60,
+     lambda V, P, s: grafo_matriz(5, 'grafo_adj_nao_dir.py', V, P, 'adiciona_aresta'),
+     lambda g, V, P: g.caminho_euleriano()),
+    ('ciclo_hamiltoniano', 5, 12,
+     lambda V, P, s: grafo_matriz(5, 'grafo_adj_nao_dir.py', V, P, 'adiciona_aresta'),
+     lambda g, V, P: g.ciclo_hamiltoniano()),
+    ('warshall', 6, 200,
+     lambda V, P, s: grafo_matriz(6, 'grafo_adj_dir.py', V, P, 'adicionaAresta'),
+     lambda g, V, P: g.warshall()),
+    ('dijkstra', 7, None,
+     lambda V, P, s: grafo_dicionario(7, V, P),
+     lambda g, V, P: g.dijkstra(V[0], V[-1])),
+    ('algoritmo_de_KRUSKAL', 8, 300,
+     lambda V, P, s: grafo_ponderado(V, P, s),
+     lambda g, V, P: _silencioso(g.algoritmo_de_KRUSKAL)),
+    ('algoritimo_de_PRIM', 8, 300,
+     lambda V, P, s: grafo_ponderado(V, P, s),
+     lambda g, V, P: _silencioso(g.algoritimo_de_PRIM)),
+]
+
+
+def executa(tamanhos, densidade, semente, repeticoes, algoritmos=None, sem_limites=False):
+    '''
+    Roda os benchmarks pedidos para cada tamanho e gera um dicionário de resultado por medição.
+    '''
+    for n in tamanhos:
+        vertices, pares = gera_arestas(n, densidade, semente)
+        for algoritmo, roteiro, limite, prepara, roda in BENCHMARKS:
+            if algoritmos and algoritmo not in algoritmos:
+                continue
+            if limite is not None and n > limite and not sem_limites:
+                continue
+
+            resultado = {
+                'algoritmo': algoritmo,
+                'roteiro': roteiro,
+                'vertices': n,
+                'arestas': len(pares),
+                'densidade': densidade,
+                'semente': semente,
+                'repeticoes': repeticoes,
+            }
+
+            tempos = []
+            try:
+                for _ in range(repeticoes):
+                    g = prepara(vertices, pares, semente)
+                    inicio = time.perf_counter()
+                    roda(g, vertices, pares)
+                    tempos.append(time.perf_counter() - inicio)
+            except Exception as e:
+                resultado['erro'] = '{}: {}'.format(type(e).__name__, e)
+
+            if tempos:
+                resultado['tempo_min'] = min(tempos)
+                resultado['tempo_mediana'] = statistics.median(tempos)
+            yield resultado
+
+
+def compara(resultados, arquivo_base, tolerancia):
+    '''
+    Compara os resultados com os de uma execução anterior e devolve as medições que ficaram mais lentas que a tolerância.
+    '''
+    base = {}
+    with open(arquivo_base, encoding='utf-8') as f:
+        for linha in f:
+            if linha.strip():
+                r = json.loads(linha)
+                base[(r['algoritmo'], r['vertices'], r['arestas'], r['semente'])] = r
+
+    regressoes = []
+    for r in resultados:
+        anterior = base.get((r['algoritmo'], r['vertices'], r['arestas'], r['semente']))
+        if anterior is None or 'tempo_mediana' not in r or 'tempo_mediana' not in anterior:
+            continue
+        if r['tempo_mediana'] > anterior['tempo_mediana'] * (1 + tolerancia):
+            regressoes.append((r, anterior))
+    return regressoes
+
+
+def _densidade(texto):
+    densidade = float(texto)
+    if not 0 <= densidade <= 1:
+        raise argparse.ArgumentTypeError('a densidade deve estar entre 0 e 1: {}'.format(texto))
+    return densidade
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark dos algoritmos de grafos dos roteiros.')
+    parser.add_argument('--tamanhos', type=int, nargs='+', default=[10, 20, 40, 80, 160],
+                        help='quantidades de vértices a testar')
+    parser.add_argument('--densidade', type=_densidade, default=0.1,
+                        help='fração dos pares de vértices ligados por aresta (o grafo é sempre conexo)')
+    parser.add_argument('--semente', type=int, default=2019, help='semente do gerador de grafos')
+    parser.add_argument('--repeticoes', type=int, default=3, help='execuções por medição')
+    parser.add_argument('--algoritmos', nargs='+', help='roda apenas estes algoritmos')
+    parser.add_argument('--sem-limites', action='store_true',
+                        help='ignora o tamanho máximo dos algoritmos exponenciais ou muito lentos')
+    parser.add_argument('--saida', help='arquivo onde gravar os resultados (JSON lines); padrão: saída padrão')
+    parser.add_argument('--comparar', help='resultados anteriores (JSON lines) para detectar regressões')
+    parser.add_argument('--tolerancia', type=float, default=0.25,
+                        help='aumento relativo de tempo aceito antes de acusar regressão')
+    args = parser.parse_args(argv)
+
+    # Várias implementações dos roteiros são recursivas
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 10 * max(args.tamanhos) + 1000))
+
+    saida = open(args.saida, 'w', encoding='utf-8') if args.saida else sys.stdout
+    resultados = []
+    try:
+        for resultado in executa(args.tamanhos, args.densidade, args.semente, args.repeticoes,
+                                 args.algoritmos, args.sem_limites):
+            resultados.append(resultado)
+            saida.write(json.dumps(resultado, ensure_ascii=False) + '\n')
+            saida.flush()
+    finally:
+        if saida is not sys.stdout:
+            saida.close()
+
+    if args.comparar:
+        regressoes = compara(resultados, args.comparar, args.tolerancia)
+        for atual, anterior in regressoes:
+            sys.stderr.write('Regressão em {} com {} vértices: {:.6f}s -> {:.6f}s\n'.format(
+                atual['algoritmo'], atual['vertices'], anterior['tempo_mediana'], atual['tempo_mediana']))
+        if regressoes:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,343 @@
+'''
+Instrumentação opcional das classes de grafo dos roteiros.
+
+Depois de instrumentar(Grafo), cada chamada a um método público da classe registra a quantidade de chamadas,
+o tempo total e o maior tempo de uma chamada, além de quantas arestas (ou linhas da matriz de adjacência)
+o método percorreu. Exemplo, a partir do diretório de um roteiro com a raiz do repositório no sys.path:
+
+    import instrumentacao
+    from grafo import Grafo
+
+    instrumentacao.instrumentar(Grafo)
+    g = Grafo(['A', 'B'], {'a1': 'A-B'})
+    g.grau('A')
+    print(instrumentacao.stats())
+    instrumentacao.reset()
+
+Classes não instrumentadas não têm custo nenhum. Uma classe instrumentada pode ser pausada com desativar(),
+quando o custo por chamada se resume a um teste de booleano, ou restaurada com desinstrumentar().
+
+A contagem de arestas percorridas funciona trocando, no construtor, o dicionário A (ou a matriz M) do grafo
+por uma subclasse que conta os elementos visitados. As classes que percorrem estruturas privadas no lugar de A ou M
+(a matriz em um único array, __matriz, o índice de incidência de cada vértice, __incidencia, as listas de adjacência
+no formato CSR, __csr, __csr_saida e __csr_incidencia, ou os arrays de arestas de GrafoCompacto) têm esses atributos
+trocados por descritores, que convertem todo valor atribuído, inclusive a matriz recriada quando a capacidade cresce
+e o CSR remontado depois de uma alteração, para uma versão que conta. Como o array é copiado nessa conversão, um array
+passado ao construtor deixa de ser compartilhado com o grafo. A contagem vale para os grafos criados depois de
+instrumentar().
+'''
+
+import functools
+from array import array
+from collections.abc import ItemsView, KeysView, ValuesView
+from time import perf_counter
+
+# Índices das estatísticas de cada método
+_CHAMADAS, _TEMPO_TOTAL, _TEMPO_MAX, _VARREDURAS, _PROFUNDIDADE = range(5)
+
+_ativo = True
+_estatisticas = {}
+_varreduras = [0]
+_originais = {}
+
+# Marca, em _originais, os atributos que não existiam na classe antes de instrumentar()
+_AUSENTE = object()
+
+
+class ArestasContadas(dict):
+    '''
+    Dicionário de arestas que conta quantos elementos são percorridos por iterações sobre ele.
+    Consultas diretas por chave não são contadas.
+    '''
+
+    def __iter__(self):
+        contador = _varreduras
+        for chave in dict.__iter__(self):
+            contador[0] += 1
+            yield chave
+
+    def keys(self):
+        return KeysView(self)
+
+    def values(self):
+        return ValuesView(self)
+
+    def items(self):
+        return ItemsView(self)
+
+
+class MatrizContada(list):
+    '''
+    Matriz de adjacência que conta cada acesso a uma linha, ou seja, cada célula lida em M[i][j].
+    '''
+
+    def __getitem__(self, indice):
+        _varreduras[0] += 1
+        return list.__getitem__(self, indice)
+
+    def __iter__(self):
+        contador = _varreduras
+        for linha in list.__iter__(self):
+            contador[0] += 1
+            yield linha
+
+
+class MatrizPlanaContada(array):
+    '''
+    Matriz de adjacência guardada em um único array que conta cada célula lida, seja por índice, por fatia,
+    por iteração ou por uma busca em todo o array.
+    '''
+
+    def __getitem__(self, indice):
+        valor = array.__getitem__(self, indice)
+        _varreduras[0] += len(valor) if isinstance(indice, slice) else 1
+        return valor
+
+    def __iter__(self):
+        contador = _varreduras
+        for celula in array.__iter__(self):
+            contador[0] += 1
+            yield celula
+
+    def count(self, valor):
+        _varreduras[0] += len(self)
+        return array.count(self, valor)
+
+    def index(self, valor, *limites):
+        _varreduras[0] += len(self)
+        return array.index(self, valor, *limites)
+
+
+class IncidenciaContada(dict):
+    '''
+    Índice de incidência (vértice -> arestas que incidem sobre ele) em que o dicionário de cada vértice é um
+    ArestasContadas, para contar as arestas percorridas a partir de um vértice.
+    '''
+
+    def __init__(self, *args, **kwargs):
+        dict.__init__(self)
+        self.update(*args, **kwargs)
+
+    def __setitem__(self, vertice, arestas):
+        if type(arestas) is dict:
+            arestas = ArestasContadas(arestas)
+        dict.__setitem__(self, vertice, arestas)
+
+    def update(self, *args, **kwargs):
+        for vertice, arestas in dict(*args, **kwargs).items():
+            self[vertice] = arestas
+
+    def setdefault(self, vertice, arestas=None):
+        if vertice not in self:
+            self[vertice] = arestas
+        return dict.__getitem__(self, vertice)
+
+
+def _conta_matriz(valor):
+    return MatrizPlanaContada(valor.typecode, valor) if type(valor) is array else valor
+
+
+def _conta_incidencia(valor):
+    return IncidenciaContada(valor) if type(valor) is dict else valor
+
+
+def _conta_csr(valor):
+    '''
+    Converte os arrays de uma tupla CSR, inclusive os de tuplas aninhadas, deixando os demais elementos como estão.
+    '''
+    if type(valor) is tuple:
+        return tuple(_conta_csr(elemento) for elemento in valor)
+    return _conta_matriz(valor)
+
+
+# Atributos privados (sem o prefixo da classe) percorridos no lugar de A ou M, com a conversão de cada um
+_CONVERSORES = {
+    '__matriz': _conta_matriz,
+    '__incidencia': _conta_incidencia,
+    '__csr': _conta_csr,
+    '__csr_saida': _conta_csr,
+    '__csr_incidencia': _conta_csr,
+    '__origens': _conta_matriz,
+    '__destinos': _conta_matriz,
+}
+
+
+class _AtributoContado:
+    '''
+    Descritor colocado na classe no lugar de um atributo privado de _CONVERSORES. Todo valor atribuído é convertido
+    para a versão que conta e guardado no dicionário da instância.
+    '''
+
+    def __init__(self, nome, converte):
+        self.nome = nome
+        self.converte = converte
+
+    def __get__(self, grafo, classe=None):
+        if grafo is None:
+            return self
+        try:
+            return vars(grafo)[self.nome]
+        except KeyError:
+            raise AttributeError(self.nome)
+
+    def __set__(self, grafo, valor):
+        vars(grafo)[self.nome] = self.converte(valor)
+
+
+def _atributos_contados(classe):
+    '''
+    Fornece os atributos de _CONVERSORES usados pelos métodos da classe, com o nome já prefixado pela classe
+    (como o Python faz com atributos que começam com __) e o conversor de cada um. Nomes que na classe são métodos
+    (como o __csr() de GrafoCompacto) ficam de fora.
+    '''
+    prefixo = '_' + classe.__name__.lstrip('_')
+    usados = set()
+    for funcao in vars(classe).values():
+        codigo = getattr(funcao, '__code__', None)
+        if codigo is not None:
+            usados.update(nome for nome in _CONVERSORES if prefixo + nome in codigo.co_names)
+    usados = {nome for nome in usados if not callable(vars(classe).get(prefixo + nome))}
+    return [(prefixo + nome, _CONVERSORES[nome]) for nome in sorted(usados)]
+
+
+def _nome_completo(classe, metodo):
+    return '{}.{}.{}'.format(classe.__module__, classe.__qualname__, metodo)
+
+
+def _envolve(nome, funcao):
+    '''
+    Cria a versão instrumentada de um método. Chamadas recursivas são contadas, mas o tempo e as arestas percorridas
+    só são somados na chamada mais externa, para não contar o mesmo trabalho mais de uma vez.
+    '''
+    @functools.wraps(funcao)
+    def instrumentado(*args, **kwargs):
+        if not _ativo:
+            return funcao(*args, **kwargs)
+
+        estatistica = _estatisticas.get(nome)
+        if estatistica is None:
+            estatistica = _estatisticas[nome] = [0, 0.0, 0.0, 0, 0]
+
+        estatistica[_CHAMADAS] += 1
+        if estatistica[_PROFUNDIDADE] > 0:
+            return funcao(*args, **kwargs)
+
+        estatistica[_PROFUNDIDADE] += 1
+        varreduras_antes = _varreduras[0]
+        inicio = perf_counter()
+        try:
+            return funcao(*args, **kwargs)
+        finally:
+            duracao = perf_counter() - inicio
+            estatistica[_PROFUNDIDADE] -= 1
+            estatistica[_TEMPO_TOTAL] += duracao
+            if duracao > estatistica[_TEMPO_MAX]:
+                estatistica[_TEMPO_MAX] = duracao
+            estatistica[_VARREDURAS] += _varreduras[0] - varreduras_antes
+
+    return instrumentado
+
+
+def _envolve_construtor(nome, funcao):
+    instrumentado = _envolve(nome, funcao)
+
+    @functools.wraps(funcao)
+    def construtor(self, *args, **kwargs):
+        instrumentado(self, *args, **kwargs)
+
+        # Só troca os atributos guardados na instância; propriedades (como em GrafoCompacto) ficam como estão
+        atributos = vars(self)
+        if type(atributos.get('A')) is dict:
+            self.A = ArestasContadas(self.A)
+        if type(atributos.get('M')) is list:
+            self.M = MatrizContada(self.M)
+
+    return construtor
+
+
+def instrumentar(*classes):
+    '''
+    Instrumenta os métodos públicos (e o construtor) das classes passadas. Instrumentar de novo não tem efeito.
+    :param classes: As classes de grafo a serem instrumentadas
+    '''
+    for classe in classes:
+        if classe in _originais:
+            continue
+
+        # Os atributos contados são procurados no código dos métodos antes que eles sejam envolvidos
+        contados = _atributos_contados(classe)
+
+        originais = {}
+        for metodo, funcao in list(vars(classe).items()):
+            if not callable(funcao) or isinstance(funcao, type):
+                continue
+            if metodo.startswith('_') and metodo not in ('__init__', '__str__'):
+                continue
+
+            originais[metodo] = funcao
+            nome = _nome_completo(classe, metodo)
+            if metodo == '__init__':
+                setattr(classe, metodo, _envolve_construtor(nome, funcao))
+            else:
+                setattr(classe, metodo, _envolve(nome, funcao))
+
+        for atributo, converte in contados:
+            originais[atributo] = vars(classe).get(atributo, _AUSENTE)
+            setattr(classe, atributo, _AtributoContado(atributo, converte))
+
+        _originais[classe] = originais
+
+
+def desinstrumentar(*classes):
+    '''
+    Restaura os métodos originais das classes. As estatísticas já coletadas são mantidas.
+    :param classes: As classes a serem restauradas
+    '''
+    for classe in classes:
+        originais = _originais.pop(classe, {})
+        for metodo, funcao in originais.items():
+            if funcao is _AUSENTE:
+                delattr(classe, metodo)
+            else:
+                setattr(classe, metodo, funcao)
+
+
+def ativar():
+    '''
+    Volta a registrar as chamadas das classes instrumentadas.
+    '''
+    global _ativo
+    _ativo = True
+
+
+def desativar():
+    '''
+    Pausa o registro das chamadas sem desfazer a instrumentação.
+    '''
+    global _ativo
+    _ativo = False
+
+
+def stats():
+    '''
+    Fornece uma cópia das estatísticas coletadas até agora.
+    :return: Um dicionário com o nome completo do método (módulo.Classe.método) como chave e um dicionário com
+    chamadas, tempo_total, tempo_max (em segundos) e arestas_percorridas como valor
+    '''
+    resultado = {}
+    for nome, estatistica in _estatisticas.items():
+        resultado[nome] = {
+            'chamadas': estatistica[_CHAMADAS],
+            'tempo_total': estatistica[_TEMPO_TOTAL],
+            'tempo_max': estatistica[_TEMPO_MAX],
+            'arestas_percorridas': estatistica[_VARREDURAS],
+        }
+    return resultado
+
+
+def reset():
+    '''
+    Zera todas as estatísticas coletadas.
+    '''
+    _estatisticas.clear()
+    _varreduras[0] = 0
@@ -0,0 +1,181 @@
+import importlib.util
+import os
+import sys
+import unittest
+from array import array
+
+import instrumentacao
+
+RAIZ = os.path.dirname(os.path.abspath(__file__))
+
+
+def carrega_roteiro(numero, arquivo):
+    '''
+    Importa o módulo de um roteiro pelo caminho do arquivo, com um nome próprio, como em benchmark.py.
+    '''
+    caminho = os.path.join(RAIZ, 'Roteiro {}'.format(numero), arquivo)
+    spec = importlib.util.spec_from_file_location('teste_roteiro{}_{}'.format(numero, arquivo[:-3]), caminho)
+    modulo = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(modulo)
+    return modulo
+
+
+def carrega_grafo_compacto():
+    '''
+    Importa o grafo_compacto.py do Roteiro 7, que importa as exceções do grafo.py do mesmo roteiro pelo nome grafo.
+    '''
+    anterior = sys.modules.get('grafo')
+    sys.modules['grafo'] = carrega_roteiro(7, 'grafo.py')
+    try:
+        return carrega_roteiro(7, 'grafo_compacto.py')
+    finally:
+        if anterior is None:
+            del sys.modules['grafo']
+        else:
+            sys.modules['grafo'] = anterior
+
+
+def caminho(n):
+    '''
+    Vértices e arestas de um caminho v0-v1-...-v(n-1).
+    '''
+    N = ['v' + str(i) for i in range(n)]
+    return N, ['v{}-v{}'.format(i, i + 1) for i in range(n - 1)]
+
+
+def com_nomes(N, arestas):
+    return N, {'a' + str(k + 1): a for k, a in enumerate(arestas)}
+
+
+def com_pesos(N, arestas):
+    return N, {a: k + 1 for k, a in enumerate(arestas)}
+
+
+def sem_arestas(N, arestas):
+    return (N,)
+
+
+# Para cada roteiro: o arquivo, como montar os parâmetros do construtor, se as arestas são incluídas depois
+# por um método e uma consulta que percorre arestas
+ROTEIROS = {
+    1: ('grafo.py', com_nomes, None, lambda g: g.existeAresta('C-D')),
+    2: ('grafo.py', com_nomes, None, lambda g: g.vertices_nao_adjacentes()),
+    3: ('grafo.py', com_nomes, None, lambda g: g.vertices_nao_adjacentes()),
+    4: ('grafo_adj_nao_dir.py', sem_arestas, 'adicionaAresta', lambda g: g.grau('B')),
+    5: ('grafo_adj_nao_dir.py', sem_arestas, 'adiciona_aresta', lambda g: g.grau('B')),
+    6: ('grafo_adj_dir.py', sem_arestas, 'adicionaAresta', lambda g: g.existeAresta('C-D')),
+    7: ('grafo.py', com_nomes, None, lambda g: g.vertices_nao_adjacentes()),
+    8: ('grafo.py', com_pesos, None, lambda g: g.vertices_nao_adjacentes()),
+}
+
+
+class TestInstrumentacao(unittest.TestCase):
+
+    def setUp(self):
+        instrumentacao.reset()
+        self.classes = []
+
+    def tearDown(self):
+        instrumentacao.desinstrumentar(*self.classes)
+        instrumentacao.reset()
+
+    def grafo(self, numero):
+        arquivo, parametros, adiciona, consulta = ROTEIROS[numero]
+        Grafo = carrega_roteiro(numero, arquivo).Grafo
+        instrumentacao.instrumentar(Grafo)
+        self.classes.append(Grafo)
+
+        N = ['A', 'B', 'C', 'D']
+        arestas = ['A-B', 'B-C', 'C-D', 'D-B']
+        g = Grafo(*parametros(list(N), arestas))
+        if adiciona is not None:
+            for a in arestas:
+                getattr(g, adiciona)(a)
+        return g, consulta
+
+    def varreduras(self, metodo):
+        for nome, estatistica in instrumentacao.stats().items():
+            if nome.endswith('.' + metodo):
+                return estatistica['arestas_percorridas']
+        return None
+
+    def test_conta_varreduras_em_todos_os_roteiros(self):
+        for numero in ROTEIROS:
+            with self.subTest(roteiro=numero):
+                g, consulta = self.grafo(numero)
+                instrumentacao.reset()
+                consulta(g)
+                self.assertGreater(sum(e['arestas_percorridas'] for e in instrumentacao.stats().values()), 0)
+
+    def test_matriz_plana(self):
+        g, _ = self.grafo(4)
+        instrumentacao.reset()
+        self.assertTrue(g.existeAresta('A-B'))
+        self.assertEqual(self.varreduras('existeAresta'), 1)
+        self.assertEqual(g.grau('B'), 3)
+        self.assertEqual(self.varreduras('grau'), 4)
+
+        # A matriz recriada quando a capacidade cresce continua sendo contada
+        for v in ['E', 'F', 'G', 'H', 'I']:
+            g.adicionaVertice(v)
+        instrumentacao.reset()
+        self.assertEqual(g.grau('B'), 3)
+        self.assertEqual(self.varreduras('grau'), 9)
+        self.assertFalse(g.ha_paralelas())
+        self.assertGreater(self.varreduras('ha_paralelas'), 0)
+
+        # Depois de desinstrumentar, o grafo continua funcionando e a classe volta a ser a original
+        Grafo = type(g)
+        instrumentacao.desinstrumentar(Grafo)
+        self.assertNotIn('_Grafo__matriz', vars(Grafo))
+        self.assertEqual(Grafo(['A', 'B'], array('i', [0, 1, 1, 0])).grau('A'), 1)
+        self.assertEqual(g.grau('B'), 3)
+
+    def test_incidencia(self):
+        g, _ = self.grafo(1)
+        g.adicionaVertice('E')
+        g.adicionaAresta('a5', 'E-B')
+        instrumentacao.reset()
+        self.assertEqual(sorted(g.arestas_sobre_vertice('B')), ['a1', 'a2', 'a4', 'a5'])
+        self.assertEqual(self.varreduras('arestas_sobre_vertice'), 4)
+
+    def test_csr(self):
+        # Com o CSR já montado, as buscas o percorrem sem passar por A
+        N, arestas = caminho(50)
+        for numero, metodos in ((2, ['BFS']), (3, ['ha_ciclo', 'componentes', 'pontes'])):
+            Grafo = carrega_roteiro(numero, 'grafo.py').Grafo
+            instrumentacao.instrumentar(Grafo)
+            self.classes.append(Grafo)
+            g = Grafo(*com_nomes(list(N), arestas))
+            g.BFS('v0') if numero == 2 else g.componentes()
+            for metodo in metodos:
+                with self.subTest(roteiro=numero, metodo=metodo):
+                    instrumentacao.reset()
+                    g.BFS('v0') if metodo == 'BFS' else getattr(g, metodo)()
+                    self.assertGreaterEqual(self.varreduras(metodo), len(arestas))
+
+        # O CSR remontado depois de uma alteração também é contado
+        g.adicionaVertice('v50')
+        g.adicionaAresta('a50', 'v49-v50')
+        g.ha_ciclo()
+        instrumentacao.reset()
+        self.assertEqual(set(g.componentes()), {0})
+        self.assertGreaterEqual(self.varreduras('componentes'), len(arestas) + 1)
+
+    def test_grafo_compacto(self):
+        GrafoCompacto = carrega_grafo_compacto().GrafoCompacto
+        instrumentacao.instrumentar(GrafoCompacto)
+        self.classes.append(GrafoCompacto)
+
+        N, arestas = caminho(50)
+        g = GrafoCompacto(*com_nomes(N, arestas))
+        self.assertEqual(g.arrays_arestas()[0].tolist(), list(range(49)))
+        g.DFS('v0', [])
+        for metodo, chamada in (('DFS', lambda: g.DFS('v0', [])), ('ha_laco', g.ha_laco)):
+            with self.subTest(metodo=metodo):
+                instrumentacao.reset()
+                chamada()
+                self.assertGreaterEqual(self.varreduras(metodo), len(arestas))
+
+        # O método privado __csr() continua sendo um método
+        self.assertTrue(callable(vars(GrafoCompacto)['_GrafoCompacto__csr']))